@@ -95,37 +95,13 @@ def get_significant_digits():
 
 
 def cosine_power_series(x, sig_digits):
-    """Compute cos(x) using power series with range reduction and symmetry handling."""
+    """Compute cos(x) using power series with range reduction and symmetry handling.
+
+    The series strategy is chosen by DJKMath/Series/autotune.py."""
+    from DJKMath.Series.autotune import tuned_cosine  # Loads the series on first use
     mpmath.mp.dps = sig_digits + 5
-    pi = mpmath.pi
-    x = mpmath.fmod(x, 2 * pi)
-
-    # Reduce to [-π, π]
-    if x > pi:
-        x -= 2 * pi
-    elif x < -pi:
-        x += 2 * pi
-
-    # Symmetry: cos(x) = cos(-x), cos(π - x) = -cos(x)
-    sign = 1
-    if x < 0:
-        x = -x
-    if x > pi / 2:
-        x = pi - x
-        sign = -1
-
-    # Power series computation
-    term = mpmath.mpf(1)
-    cos_x = term
-    n = 1
-    x2 = x * x
-
-    while abs(term) > mpmath.mpf(10) ** (-sig_digits):
-        term *= -x2 / ((2 * n - 1) * (2 * n))
-        cos_x += term
-        n += 1
-
-    return sign * +cos_x
+    cos_x, _ = tuned_cosine(x, sig_digits)
+    return +mpmath.mpf(cos_x)
 
 
 def main():
@@ -123,70 +123,24 @@ def get_significant_digits():
 def cosine_power_series(x, sig_digits):
     """
     Compute cosine of x using power series with angle reduction.
+    The series strategy is chosen by DJKMath/Series/autotune.py.
     """
+    from DJKMath.Series.autotune import tuned_cosine  # Loads the series on first use
     mpmath.mp.dps = sig_digits + 5
-    pi = mpmath.pi
-    x = mpmath.fmod(x, 2 * pi)
-
-    if x > pi:
-        x -= 2 * pi
-    elif x < -pi:
-        x += 2 * pi
-
-    sign = 1
-    if x < 0:
-        x = -x
-    if x > pi / 2:
-        x = pi - x
-        sign = -1
-
-    term = mpmath.mpf(1)
-    cos_x = term
-    n = 1
-    x2 = x * x
-    terms_used = 1
-
-    while abs(term) > mpmath.mpf(10) ** (-sig_digits):
-        term *= -x2 / ((2 * n - 1) * (2 * n))
-        cos_x += term
-        n += 1
-        terms_used += 1
-
+    cos_x, terms_used = tuned_cosine(x, sig_digits)
     print(f"Terms used in cos series: {terms_used}")
-    return sign * +cos_x
+    return +mpmath.mpf(cos_x)
 
 def sine_power_series(x, sig_digits):
     """
     Compute sine of x using power series with angle reduction.
+    The series strategy is chosen by DJKMath/Series/autotune.py.
     """
+    from DJKMath.Series.autotune import tuned_sine  # Loads the series on first use
     mpmath.mp.dps = sig_digits + 5
-    pi = mpmath.pi
-    x = mpmath.fmod(x, 2 * pi)
-
-    if x > pi:
-        x -= 2 * pi
-    elif x < -pi:
-        x += 2 * pi
-
-    sign = 1
-    if x < 0:
-        x = -x
-        sign = -1
-
-    term = x
-    sin_x = term
-    n = 1
-    x2 = x * x
-    terms_used = 1
-
-    while abs(term) > mpmath.mpf(10) ** (-sig_digits):
-        term *= -x2 / ((2 * n) * (2 * n + 1))
-        sin_x += term
-        n += 1
-        terms_used += 1
-
+    sin_x, terms_used = tuned_sine(x, sig_digits)
     print(f"Terms used in sin series: {terms_used}")
-    return sign * +sin_x
+    return +mpmath.mpf(sin_x)
 
 def tangent_power_series(x, sig_digits):
     """
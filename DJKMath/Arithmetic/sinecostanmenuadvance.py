@@ -108,52 +108,18 @@ def get_significant_digits():
             print("Invalid input. Enter a valid integer.")
 
 def cosine_power_series(x, sig_digits):
-    """Compute cosine using power series with optimizations."""
+    """Compute cosine using power series with optimizations (see Series/autotune.py)."""
+    from DJKMath.Series.autotune import tuned_cosine  # Loads the series on first use
     mpmath.mp.dps = sig_digits + 5
-    pi = mpmath.pi
-    x = mpmath.fmod(x, 2 * pi)
-    if x > pi:
-        x -= 2 * pi
-    elif x < -pi:
-        x += 2 * pi
-    sign = 1
-    if x < 0:
-        x = -x
-    if x > pi / 2:
-        x = pi - x
-        sign = -1
-    term = mpmath.mpf(1)
-    cos_x = term
-    n = 1
-    x2 = x * x
-    while abs(term) > mpmath.mpf(10) ** (-sig_digits):
-        term *= -x2 / ((2 * n - 1) * (2 * n))
-        cos_x += term
-        n += 1
-    return sign * +cos_x, n
+    cos_x, n = tuned_cosine(x, sig_digits)
+    return +mpmath.mpf(cos_x), n
 
 def sine_power_series(x, sig_digits):
-    """Compute sine using power series with optimizations."""
+    """Compute sine using power series with optimizations (see Series/autotune.py)."""
+    from DJKMath.Series.autotune import tuned_sine  # Loads the series on first use
     mpmath.mp.dps = sig_digits + 5
-    pi = mpmath.pi
-    x = mpmath.fmod(x, 2 * pi)
-    if x > pi:
-        x -= 2 * pi
-    elif x < -pi:
-        x += 2 * pi
-    sign = 1
-    if x < 0:
-        x = -x
-        sign = -1
-    term = x
-    sin_x = term
-    n = 1
-    x2 = x * x
-    while abs(term) > mpmath.mpf(10) ** (-sig_digits):
-        term *= -x2 / ((2 * n) * (2 * n + 1))
-        sin_x += term
-        n += 1
-    return sign * +sin_x, n
+    sin_x, n = tuned_sine(x, sig_digits)
+    return +mpmath.mpf(sin_x), n
 
 def tangent_power_series(x, sig_digits):
     """Compute tangent using sine and cosine power series."""
@@ -52,17 +52,13 @@ def get_choice():
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 def sine_power_series(x, sig_digits):
-    """Computes sin(x) using power series expansion until the desired significant digits."""
-    mpmath.mp.dps = sig_digits + 2  # Set decimal places to ensure precision
-    x = mpmath.mpf(x)  # Convert to high precision number
-    sin_x, term, n = x, x, 1
-
-    while abs(term) > mpmath.mpf(10) ** (-sig_digits):
-        n += 2
-        term *= -x ** 2 / (n * (n - 1))  # Iterative term computation
-        sin_x += term
+    """Computes sin(x) using power series expansion until the desired significant digits.
 
-    return +sin_x  # Unary plus ensures correct precision trimming
+    The series strategy is chosen by DJKMath/Series/autotune.py."""
+    from DJKMath.Series.autotune import tuned_sine  # Loads the series on first use
+    mpmath.mp.dps = sig_digits + 2  # Set decimal places to ensure precision
+    sin_x, _ = tuned_sine(x, sig_digits)
+    return +mpmath.mpf(sin_x)  # Unary plus ensures correct precision trimming
 
 def get_degree_input():
     """Gets a valid degree, minutes, and seconds input from the user."""
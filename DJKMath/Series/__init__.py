@@ -5,11 +5,71 @@
 from .trigo_sin_cos_tan import (
     sine_power_series,
     cosine_power_series,
-    tangent_power_series
+    tangent_power_series,
+    sine_power_series_batch,
+    cosine_power_series_batch
+)
+from .anchor_table import (
+    sine_degrees,
+    cosine_degrees
+)
+from .parallel_sweep import parallel_sweep
+from .progressive import (
+    sine_power_series_progressive,
+    cosine_power_series_progressive
+)
+from .inverse_trig import (
+    arcsine,
+    arccosine,
+    arctangent
+)
+from .rotation_table import (
+    sincos_table,
+    write_sincos_table,
+    fill_sincos_table
+)
+from .hypergeometric import (
+    hypergeometric_series,
+    exp_power_series,
+    sinh_power_series,
+    cosh_power_series,
+    sinhcosh_power_series
+)
+from .complex_series import (
+    complex_sincos,
+    complex_tangent,
+    complex_sincos_batch
+)
+from .trigo_numpy import (
+    sine_power_series_array,
+    cosine_power_series_array
 )
 
 __all__ = [
     'sine_power_series',
     'cosine_power_series',
-    'tangent_power_series'
+    'tangent_power_series',
+    'sine_power_series_batch',
+    'cosine_power_series_batch',
+    'sine_degrees',
+    'cosine_degrees',
+    'parallel_sweep',
+    'sine_power_series_progressive',
+    'cosine_power_series_progressive',
+    'arcsine',
+    'arccosine',
+    'arctangent',
+    'sincos_table',
+    'write_sincos_table',
+    'fill_sincos_table',
+    'hypergeometric_series',
+    'exp_power_series',
+    'sinh_power_series',
+    'cosh_power_series',
+    'sinhcosh_power_series',
+    'complex_sincos',
+    'complex_tangent',
+    'complex_sincos_batch',
+    'sine_power_series_array',
+    'cosine_power_series_array'
 ]
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""
+anchor_table.py
+Sine and cosine of angles in degrees from a table of anchor angles.
+
+Angles entered as degrees, minutes and seconds cluster near whole degrees,
+so a table of sin/cos at the anchors n/resolution degrees (every 1/16
+degree by default) leaves only a tiny remainder h for the series:
+
+    sin(a + h) = sin(a)·cos(h) + cos(a)·sin(h)
+    cos(a + h) = cos(a)·cos(h) - sin(a)·sin(h)
+
+With |h| <= π/(360·resolution) the series of sin(h) and cos(h) is only a
+handful of terms even at hundreds of digits. Anchors are kept for the first
+quadrant only; the other quadrants follow by rotating (sin, cos). Both the
+anchors and the remainders are summed by sincos_power_series
+(trigo_sin_cos_tan.py) after its reduction to [-π/4, π/4].
+
+Angles may be given in decimal degrees or as a DegreeAngle
+(exact_angle.py); a DegreeAngle is reduced to its anchor and remainder
+exactly, with fractions, so degree-minute-second input is rounded only
+once, in the remainder series.
+
+Tables are built lazily, one anchor at a time as angles need them, and are
+cached per working precision (mp.prec in bits) and resolution, separately
+for each thread.
+
+Functions:
+    sine_degrees(angle, precision, resolution): Sine of an angle in degrees
+    cosine_degrees(angle, precision, resolution): Cosine of an angle in degrees
+    sincos_degrees(angle, precision, resolution): Both
+    clear_anchor_tables(): Drop all cached anchors
+    anchor_table_info(): Cached (prec, resolution, anchors) triples
+
+Each returns the value(s) with the number of terms of the remainder series.
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+"""
+
+import threading
+from fractions import Fraction
+
+from .precision_context import mp, mpf, isolated_precision
+from .exact_angle import DegreeAngle
+
+# Default anchor spacing: 1/16 of a degree.
+DEFAULT_RESOLUTION = 16
+
+# Extra bits carried through the table and the addition formulas.
+GUARD_BITS = 16
+
+# Per thread: (prec, resolution) -> {anchor index: (sin, cos)}
+_local = threading.local()
+
+
+def _thread_tables():
+    """Return the calling thread's anchor tables, creating them on first use."""
+    tables = getattr(_local, "tables", None)
+    if tables is None:
+        tables = _local.tables = {}
+    return tables
+
+
+def _sincos(theta):
+    """Return (sin, cos, terms) of theta at the current precision.
+
+    Summed by sincos_power_series, i.e. reduced to [-π/4, π/4] and run
+    through the fused Taylor kernel, so anchors near 90° and long remainders
+    at thousands of digits converge like any radian argument. terms is the
+    sine and cosine terms together.
+    """
+    # Imported here: trigo_sin_cos_tan imports this module.
+    from .trigo_sin_cos_tan import sincos_power_series
+
+    with mp.workprec(mp.prec):
+        sin_val, cos_val, sin_terms, cos_terms = sincos_power_series(
+            theta, mp.dps, backend="mpmath"
+        )
+    return sin_val, cos_val, sin_terms + cos_terms
+
+
+def _anchor(index, resolution):
+    """sin and cos of index/resolution degrees (first quadrant), cached."""
+    table = _thread_tables().setdefault((mp.prec, resolution), {})
+    entry = table.get(index)
+    if entry is None:
+        theta = mp.pi * index / (180 * resolution)
+        sin_val, cos_val, _ = _sincos(theta)
+        entry = table[index] = (sin_val, cos_val)
+    return entry
+
+
+def _split(angle, resolution):
+    """Return (anchor index, remainder in radians) of angle degrees.
+
+    A DegreeAngle is split exactly; the remainder is rounded once.
+    """
+    if isinstance(angle, DegreeAngle):
+        degree = angle.normal
+        index = round(degree * resolution)
+        remainder = degree - Fraction(index, resolution)
+        return index, mpf(remainder.numerator) * mp.pi / (180 * remainder.denominator)
+    # Reduce exactly: the subtraction of a multiple of 360 and of the
+    # anchor n/resolution loses nothing once the magnitude bits are added.
+    angle = mpf(angle)
+    with mp.workprec(mp.prec + max(mp.mag(angle), 0)):
+        degree = mp.fmod(angle, 360)
+        if degree < 0:
+            degree += 360
+        index = int(mp.nint(degree * resolution))
+        remainder = degree - mpf(index) / resolution
+    return index, remainder * mp.pi / 180
+
+
+def _sincos_degrees(angle, precision, resolution):
+    """Return (sin, cos, terms) of angle degrees at precision digits."""
+    if resolution < 1 or int(resolution) != resolution:
+        raise ValueError("Resolution must be a positive integer.")
+    mp.dps = precision
+    quarter = 90 * resolution
+    with mp.workprec(mp.prec + GUARD_BITS):
+        index, h = _split(angle, resolution)
+        quadrant, index = divmod(index % (4 * quarter), quarter)
+        sin_a, cos_a = _anchor(index, resolution)
+        for _ in range(quadrant):
+            sin_a, cos_a = cos_a, -sin_a
+        sin_h, cos_h, terms = _sincos(h)
+        sin_val = sin_a * cos_h + cos_a * sin_h
+        cos_val = cos_a * cos_h - sin_a * sin_h
+    return +sin_val, +cos_val, terms
+
+
+@isolated_precision
+def sine_degrees(angle, precision, resolution=DEFAULT_RESOLUTION):
+    """Computes sine of an angle in degrees from the nearest anchor.
+
+    Parameters:
+    -----------
+    angle : DegreeAngle, mpf, int, float or str
+        Angle in degrees: a DegreeAngle (exact degrees, minutes and
+        seconds) or decimal degrees.
+    precision : int
+        Significant digits.
+    resolution : int, optional
+        Anchors per degree (default 16, i.e. every 1/16 degree).
+
+    Returns:
+    --------
+    (mpf, int)
+        The sine and the number of terms of the remainder series.
+    """
+    sin_val, _, terms = _sincos_degrees(angle, precision, resolution)
+    return sin_val, terms
+
+
+@isolated_precision
+def cosine_degrees(angle, precision, resolution=DEFAULT_RESOLUTION):
+    """Computes cosine of an angle in degrees from the nearest anchor.
+
+    See sine_degrees for parameters and return values.
+    """
+    _, cos_val, terms = _sincos_degrees(angle, precision, resolution)
+    return cos_val, terms
+
+
+@isolated_precision
+def sincos_degrees(angle, precision, resolution=DEFAULT_RESOLUTION):
+    """Computes sine and cosine of an angle in degrees from the nearest anchor.
+
+    Returns (sin, cos, terms).
+    """
+    return _sincos_degrees(angle, precision, resolution)
+
+
+def clear_anchor_tables():
+    """Drop the calling thread's cached anchor tables."""
+    _thread_tables().clear()
+
+
+def anchor_table_info():
+    """Return a list of (prec, resolution, number of anchors built)."""
+    return [
+        (prec, resolution, len(table))
+        for (prec, resolution), table in _thread_tables().items()
+    ]
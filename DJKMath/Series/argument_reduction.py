@@ -0,0 +1,111 @@
+"""
+argument_reduction.py
+Accurate reduction of radian arguments for the trigonometric power series.
+
+A naive fmod(x, 2 * mp.pi) at the working precision is wrong for large x:
+the error in the stored π is multiplied by x / (2π), so for x = 1e50 every
+digit of the remainder is lost. Here x is written as
+
+    x = k·(π/2) + r,   |r| <= π/4,
+
+and π/2 is taken with as many extra bits as the magnitude of x demands
+(the Payne-Hanek idea). If x happens to lie very close to a multiple of
+π/2, the cancellation is measured and the reduction is repeated with more
+bits, so r always carries the requested number of correct digits.
+
+Functions:
+    reduce_argument(x, precision): Reduce x to (r, quadrant)
+    normalize_radian(x, precision): x modulo 2π with the sign of x, like fmod
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+"""
+
+from .precision_context import mp, mpf, isolated_precision
+
+# Bits per decimal digit, and spare bits kept above the requested precision.
+LOG2_10 = 3.321928094887362
+GUARD_BITS = 16
+
+# Values below this are already inside [-π/4, π/4].
+_QUARTER_PI_LOWER = mpf("0.785398")
+
+
+def _exact_mpf(x):
+    """Convert x to an mpf without rounding away any of its bits."""
+    if hasattr(x, "_mpf_"):
+        return mp.make_mpf(x._mpf_)
+    if isinstance(x, int):
+        with mp.workprec(max(mp.prec, x.bit_length() + 1)):
+            return mpf(x)
+    with mp.workprec(max(mp.prec, 53)):
+        return mpf(x)
+
+
+@isolated_precision
+def reduce_argument(x, precision=None):
+    """Reduce a radian angle to [-π/4, π/4] plus a quadrant.
+
+    Parameters:
+    -----------
+    x : mpf, float, int or str
+        Angle in radians. mpf values are used exactly as stored.
+    precision : int, optional
+        Significant digits wanted in r (default: the caller's mpmath.mp.dps).
+
+    Returns:
+    --------
+    (mpf, int)
+        r and quadrant q such that x = (4m + q)·(π/2) + r for some integer m.
+
+    Raises:
+    -------
+    ValueError
+        If x is infinite or nan.
+    """
+    if precision is None:
+        precision = mp.dps
+    x = _exact_mpf(x)
+    if not mp.isfinite(x):
+        raise ValueError("Cannot reduce a non-finite angle")
+    if abs(x) <= _QUARTER_PI_LOWER:
+        return x, 0
+
+    target = int(precision * LOG2_10) + GUARD_BITS
+    mag_x = mp.mag(x)
+    extra = max(mag_x, 0) + GUARD_BITS
+    while True:
+        with mp.workprec(target + extra):
+            half_pi = mp.pi / 2
+            k = mp.nint(x / half_pi)
+            r = x - k * half_pi
+        # The absolute error of r is about 2**(mag_x - working bits), so r
+        # keeps `target` correct bits only if extra covers the cancellation.
+        if r != 0:
+            lost = mag_x - mp.mag(r)
+            if extra >= lost + GUARD_BITS:
+                return r, int(k) % 4
+            extra = lost + 2 * GUARD_BITS
+        else:
+            extra *= 2
+
+
+@isolated_precision
+def normalize_radian(x, precision=None):
+    """Reduce x modulo 2π, keeping the sign of x as fmod does.
+
+    The result lies in [0, 2π) for x >= 0 and in (-2π, 0] for x < 0 and is
+    accurate to `precision` digits (default: the caller's mpmath.mp.dps) however
+    large x is.
+    """
+    if precision is None:
+        precision = mp.dps
+    x = _exact_mpf(x)
+    r, quadrant = reduce_argument(x, precision)
+    with mp.workprec(int(precision * LOG2_10) + GUARD_BITS):
+        normal = quadrant * (mp.pi / 2) + r
+        if normal < 0:
+            normal += 2 * mp.pi
+        if x < 0 and normal != 0:
+            normal -= 2 * mp.pi
+    return normal
@@ -0,0 +1,392 @@
+"""
+autotune.py
+One engine for the sine and cosine series: registered strategies and a calibrated dispatch table.
+
+The series were written several times over (math_utils.py, the programs in
+Arithmetic/), each with its own reduction and stopping rule. They survive
+here as strategies next to the faster kernels of this package:
+
+    plain_taylor         Taylor series of x as given (math_utils.py); only
+                         for |x| <= π/4, where no reduction is needed
+    symmetry             x modulo 2π folded onto [0, π/2] by symmetry, then
+                         the Taylor series (the Arithmetic/ programs)
+    taylor, paterson_stockmeyer, triple_angle, minimax
+                         quadrant reduction and the SERIES_METHODS kernels
+    float, double_double, fixed, decimal
+                         the backends of trigo_sin_cos_tan.py
+
+Every strategy is a pair of functions (x, precision) -> (value, terms) and a
+predicate telling whether it can honour a given (x, precision); the float
+and double_double kernels, for example, only apply to arguments that are
+exactly a float or a double-double. More can be added with
+register_strategy().
+
+calibrate() times the applicable strategies on a sample angle in each
+(precision, |x|) bucket, drops those whose result is off by more than
+10**(1-precision), and stores the ranking, fastest first, in a versioned
+JSON file (by default dispatch_table.json next to this module). Timings
+depend on the machine and on mpmath's arithmetic library, so the file is
+not shipped; without it DEFAULT_RANKING is used, as it is (with a warning)
+when the file is damaged or from another version. To (re)calibrate:
+
+    python -m DJKMath.Series.autotune
+
+tuned_sine() and tuned_cosine() then use the first strategy of their
+bucket's ranking that applies to the argument, falling back to "taylor"
+(which also takes the DegreeAngle and complex arguments that fit no bucket).
+The decimal strategy rounds its result back to an mpf; the float strategy
+returns a float, as backend="auto" does.
+
+Functions:
+    register_strategy(name, sine, cosine, applies): Add or replace a strategy
+    strategy_names(): Registered names, in registration order
+    calibrate(precisions, magnitudes, repeat, path): Time strategies and store the table
+    load_dispatch_table(path): Read a dispatch table file (checks its version)
+    choose_strategy(func, x, precision): Name of the strategy that would run
+    tuned_sine(x, precision): (value, terms)
+    tuned_cosine(x, precision): (value, terms)
+
+Dependencies:
+    mpmath: For high-precision arithmetic and the reference values
+    json: For the dispatch table file
+    warnings: To report a dispatch table that cannot be used
+"""
+
+import json
+import math
+import os
+import threading
+import time
+import warnings
+
+import mpmath
+
+from .precision_context import mp, mpf, isolated_precision
+from .argument_reduction import normalize_radian
+from .float_kernel import FLOAT_MAX_PRECISION, as_exact_float
+from .double_double import DD_MAX_PRECISION, as_dd
+from .trigo_sin_cos_tan import SERIES_METHODS, sine_power_series, cosine_power_series
+
+# Format version of the dispatch table file; bump when the layout changes.
+TABLE_VERSION = 1
+
+DISPATCH_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dispatch_table.json")
+
+# Upper ends of the precision buckets in digits; larger precisions use the last.
+CALIBRATION_PRECISIONS = (15, 31, 50, 100, 200, 500, 1000)
+
+# Upper ends of the |x| buckets as powers of ten; larger |x| use the last.
+CALIBRATION_MAGNITUDES = (-6, 0, 2, 6, 15)
+
+# Leading digits of the sample angle timed in each |x| bucket.
+SAMPLE_MANTISSA = 0.7318
+
+# Ranking used for every bucket until calibrate() has been run. "fixed" is
+# left out: it is only chosen where a calibration has measured it faster
+# and accurate enough.
+DEFAULT_RANKING = ("float", "double_double", "plain_taylor", "taylor")
+
+# Extra digits for the modulo-2π step of the symmetry strategy.
+GUARD_DIGITS = 5
+
+FUNCTIONS = ("sine", "cosine")
+
+# name -> (sine, cosine, applies), in registration order.
+_strategies = {}
+
+# Parsed dispatch table file (loaded once per process).
+_file_table = None
+_file_lock = threading.Lock()
+
+
+def register_strategy(name, sine, cosine, applies=None):
+    """Registers (or replaces) a strategy for the dispatcher.
+
+    Parameters:
+    -----------
+    name : str
+        Name used in the dispatch table.
+    sine, cosine : callable
+        Functions (x, precision) -> (value, terms).
+    applies : callable, optional
+        Predicate (x, precision) -> bool; by default the strategy applies
+        to every argument.
+    """
+    _strategies[name] = (sine, cosine, applies or (lambda x, precision: True))
+
+
+def strategy_names():
+    """Returns the registered strategy names in registration order."""
+    return list(_strategies)
+
+
+def _magnitude(x):
+    """|x| as a float (inf if it does not fit), for bucketing and predicates;
+    None if x has no real magnitude as a float (a DegreeAngle, a complex)."""
+    try:
+        return abs(float(x))
+    except OverflowError:
+        return math.inf
+    except (TypeError, ValueError):
+        return None
+
+
+def _bucket(x, precision):
+    """Returns the table key "precision:magnitude" for x and precision."""
+    p = next((edge for edge in CALIBRATION_PRECISIONS if precision <= edge),
+             CALIBRATION_PRECISIONS[-1])
+    size = _magnitude(x)
+    m = next((edge for edge in CALIBRATION_MAGNITUDES if size <= 10.0**edge),
+             CALIBRATION_MAGNITUDES[-1])
+    return f"{p}:{m}"
+
+
+@isolated_precision
+def _plain_series(x, precision, shift):
+    """sin (shift=0) or cos (shift=1) by the Taylor series of x itself."""
+    mp.dps = precision
+    sine_kernel, cosine_kernel, _ = SERIES_METHODS["taylor"]
+    kernel = cosine_kernel if shift else sine_kernel
+    return kernel(mpf(x), precision)
+
+
+@isolated_precision
+def _symmetric_series(x, precision, shift):
+    """sin (shift=0) or cos (shift=1) after folding x mod 2π onto [0, π/2]."""
+    mp.dps = precision + GUARD_DIGITS
+    r = normalize_radian(x, precision + GUARD_DIGITS)
+    pi = mp.pi
+    if r > pi:
+        r -= 2 * pi
+    elif r < -pi:
+        r += 2 * pi
+    # sin(-r) = -sin(r), sin(π - r) = sin(r); cos(-r) = cos(r), cos(π - r) = -cos(r).
+    negate = False
+    if r < 0:
+        r = -r
+        negate = not shift
+    if r > pi / 2:
+        r = pi - r
+        negate = negate or bool(shift)
+    sine_kernel, cosine_kernel, _ = SERIES_METHODS["taylor"]
+    value, terms = (cosine_kernel if shift else sine_kernel)(r, precision)
+    return (-value if negate else value), terms
+
+
+@isolated_precision
+def _decimal_series(x, precision, shift):
+    """sin (shift=0) or cos (shift=1) on the decimal backend, as an mpf."""
+    series = cosine_power_series if shift else sine_power_series
+    value, terms = series(x, precision, backend="decimal")
+    mp.dps = precision
+    return mpf(str(value)), terms
+
+
+def _plain_applies(x, precision):
+    """Only float, int and mpf arguments within [-π/4, π/4]."""
+    return (isinstance(x, (float, int)) or hasattr(x, "_mpf_")) and _magnitude(x) <= 0.785398
+
+
+def _float_applies(x, precision):
+    """Precisions a double honours, for arguments that are exactly a float."""
+    return precision <= FLOAT_MAX_PRECISION and as_exact_float(x) is not None
+
+
+def _dd_applies(x, precision):
+    """Precisions a double-double honours, for arguments that are exactly one."""
+    return precision <= DD_MAX_PRECISION and as_dd(x) is not None
+
+
+def _method_strategy(method):
+    """sine and cosine through the quadrant reduction with a series method."""
+    return (
+        lambda x, precision: sine_power_series(x, precision, method=method, backend="mpmath"),
+        lambda x, precision: cosine_power_series(x, precision, method=method, backend="mpmath"),
+    )
+
+
+def _backend_strategy(backend):
+    """sine and cosine on a backend of trigo_sin_cos_tan.py."""
+    return (
+        lambda x, precision: sine_power_series(x, precision, backend=backend),
+        lambda x, precision: cosine_power_series(x, precision, backend=backend),
+    )
+
+
+register_strategy(
+    "plain_taylor",
+    lambda x, precision: _plain_series(x, precision, 0),
+    lambda x, precision: _plain_series(x, precision, 1),
+    _plain_applies,
+)
+register_strategy(
+    "symmetry",
+    lambda x, precision: _symmetric_series(x, precision, 0),
+    lambda x, precision: _symmetric_series(x, precision, 1),
+)
+for _method in ("taylor", "paterson_stockmeyer", "triple_angle", "minimax"):
+    register_strategy(_method, *_method_strategy(_method))
+register_strategy("float", *_backend_strategy("float"), _float_applies)
+register_strategy("double_double", *_backend_strategy("double_double"), _dd_applies)
+register_strategy("fixed", *_backend_strategy("fixed"))
+register_strategy(
+    "decimal",
+    lambda x, precision: _decimal_series(x, precision, 0),
+    lambda x, precision: _decimal_series(x, precision, 1),
+)
+
+
+def load_dispatch_table(path=DISPATCH_PATH):
+    """Reads a dispatch table file, returning {"sine": {bucket: ranking}, "cosine": {...}}.
+
+    Raises:
+    -------
+    ValueError
+        If the file was written for another TABLE_VERSION or other buckets.
+    """
+    with open(path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    if (data.get("version") != TABLE_VERSION
+            or data.get("precisions") != list(CALIBRATION_PRECISIONS)
+            or data.get("magnitudes") != list(CALIBRATION_MAGNITUDES)):
+        raise ValueError(
+            f"{path} is dispatch table version {data.get('version')}, expected "
+            f"{TABLE_VERSION}; recalibrate with python -m DJKMath.Series.autotune"
+        )
+    return {func: data["table"].get(func, {}) for func in FUNCTIONS}
+
+
+def _reset():
+    """Forget the loaded dispatch table."""
+    global _file_table
+    with _file_lock:
+        _file_table = None
+
+
+def _table_from_file():
+    """The default dispatch table, read on first use ({} if it is missing,
+    and with a warning if it cannot be used)."""
+    global _file_table
+    with _file_lock:
+        if _file_table is None:
+            try:
+                _file_table = load_dispatch_table(DISPATCH_PATH)
+            except OSError:
+                _file_table = {func: {} for func in FUNCTIONS}
+            except ValueError as e:
+                warnings.warn(
+                    f"Ignoring the dispatch table {DISPATCH_PATH} ({e}); using the default "
+                    "ranking until you recalibrate with python -m DJKMath.Series.autotune"
+                )
+                _file_table = {func: {} for func in FUNCTIONS}
+        return _file_table
+
+
+def _time(function, x, precision, repeat):
+    """Best wall time of repeat calls, and the value of the last one."""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value, _ = function(x, precision)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+def calibrate(precisions=CALIBRATION_PRECISIONS, magnitudes=CALIBRATION_MAGNITUDES,
+              repeat=3, path=DISPATCH_PATH):
+    """Times every applicable strategy per bucket and stores the rankings.
+
+    Parameters:
+    -----------
+    precisions : iterable of int, optional
+        Precision buckets to time, a subset of CALIBRATION_PRECISIONS.
+    magnitudes : iterable of int, optional
+        |x| buckets to time, a subset of CALIBRATION_MAGNITUDES. The sample
+        angle of bucket m is SAMPLE_MANTISSA·10**m.
+    repeat : int, optional
+        Evaluations per strategy; the best time is kept (default 3).
+    path : str, optional
+        Dispatch table file; buckets already in it are kept.
+
+    Returns:
+    --------
+    dict
+        The data written to the file.
+
+    Raises:
+    -------
+    ValueError
+        If a precision or magnitude is not one of the calibration buckets.
+    """
+    if not set(precisions) <= set(CALIBRATION_PRECISIONS):
+        raise ValueError(f"Precisions must be among {CALIBRATION_PRECISIONS}")
+    if not set(magnitudes) <= set(CALIBRATION_MAGNITUDES):
+        raise ValueError(f"Magnitudes must be among {CALIBRATION_MAGNITUDES}")
+    try:
+        table = load_dispatch_table(path)
+    except (OSError, ValueError):
+        table = {func: {} for func in FUNCTIONS}
+    for precision in precisions:
+        for magnitude in magnitudes:
+            x = SAMPLE_MANTISSA * 10.0**magnitude
+            with mpmath.workdps(precision + 20):
+                references = (mpmath.sin(x), mpmath.cos(x))
+                tolerance = mpmath.mpf(10) ** (1 - precision)
+            for index, func in enumerate(FUNCTIONS):
+                timings = {}
+                for name, (sine, cosine, applies) in _strategies.items():
+                    if not applies(x, precision):
+                        continue
+                    try:
+                        seconds, value = _time(cosine if index else sine, x, precision, repeat)
+                    except (ValueError, RuntimeError):
+                        continue
+                    with mpmath.workdps(precision + 20):
+                        if abs(mpmath.mpf(str(value)) - references[index]) <= tolerance:
+                            timings[name] = seconds
+                table[func][f"{precision}:{magnitude}"] = sorted(timings, key=timings.get)
+    data = {
+        "version": TABLE_VERSION,
+        "precisions": list(CALIBRATION_PRECISIONS),
+        "magnitudes": list(CALIBRATION_MAGNITUDES),
+        "mpmath_backend": mpmath.libmp.BACKEND,
+        "table": table,
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=1)
+        handle.write("\n")
+    _reset()
+    return data
+
+
+def choose_strategy(func, x, precision):
+    """Returns the name of the strategy tuned_sine/tuned_cosine would use.
+
+    func is "sine" or "cosine". Arguments without a float magnitude are
+    not bucketed: "taylor" takes a DegreeAngle or a complex x as it is.
+    """
+    if _magnitude(x) is None:
+        return "taylor"
+    ranking = _table_from_file()[func].get(_bucket(x, precision), DEFAULT_RANKING)
+    for name in ranking:
+        strategy = _strategies.get(name)
+        if strategy is not None and strategy[2](x, precision):
+            return name
+    return "taylor"
+
+
+def tuned_sine(x, precision):
+    """Computes sine with the fastest calibrated strategy. Returns (value, terms)."""
+    return _strategies[choose_strategy("sine", x, precision)][0](x, precision)
+
+
+def tuned_cosine(x, precision):
+    """Computes cosine with the fastest calibrated strategy. Returns (value, terms)."""
+    return _strategies[choose_strategy("cosine", x, precision)][1](x, precision)
+
+
+if __name__ == "__main__":
+    result = calibrate()
+    for func in FUNCTIONS:
+        for bucket, ranking in result["table"][func].items():
+            print(f"{func:7} {bucket:10} {', '.join(ranking)}")
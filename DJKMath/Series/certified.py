@@ -0,0 +1,275 @@
+"""
+certified.py
+Certified interval enclosures of the trigonometric functions.
+
+The series functions stop once |term| <= 10**-precision and return a bare
+mpf: nothing bounds the rounding error they accumulate, so callers add
+guard digits just in case. Here every step is done in interval arithmetic
+(mpmath's interval context rounds each operation outwards), so the result
+is an interval guaranteed to contain the true value:
+
+    1. x is enclosed exactly (int, mpf) or tightly (Fraction, decimal str).
+    2. x = k·(π/2) + r, with π/2 taken as an interval at the working
+       precision plus the magnitude bits of x, so r is a rigorous enclosure.
+    3. The sine or cosine series of r is summed with interval terms. For
+       |r| < 1 the terms decrease in size and alternate in sign, so the
+       omitted tail is no larger than the first omitted term; that bound
+       is added as [-t, t].
+    4. The width of the enclosure is compared with the requested absolute
+       or relative tolerance. If it is too wide, the working precision is
+       raised by the bits it fell short, and the evaluation is repeated.
+
+Starting from the bits the tolerance itself needs, this settles on close to
+the smallest working precision that certifies the result, instead of a
+fixed number of guard digits.
+
+Functions:
+    sine_interval(x, tolerance, relative): Enclosure of sin(x)
+    cosine_interval(x, tolerance, relative): Enclosure of cos(x)
+    tangent_interval(x, tolerance, relative): Enclosure of tan(x)
+    secant_interval(x, tolerance, relative): Enclosure of sec(x)
+    cosecant_interval(x, tolerance, relative): Enclosure of csc(x)
+    cotangent_interval(x, tolerance, relative): Enclosure of cot(x)
+
+sine/cosine/secant/cosecant return (interval, terms, prec) and tangent /
+cotangent return (interval, sin_terms, cos_terms, prec), where interval is
+an mpmath.iv value and prec the working precision in bits that certified it.
+
+Dependencies:
+    mpmath: For interval and high-precision arithmetic
+"""
+
+from contextlib import contextmanager
+
+from .precision_context import (
+    mp,
+    mpf,
+    isolated_precision,
+    thread_interval_context,
+)
+
+# Spare bits above the tolerance for the first attempt.
+START_GUARD_BITS = 8
+
+# Give up (the value is probably a pole or exactly zero) beyond this precision.
+MAX_PRECISION_BITS = 1 << 16
+
+
+@contextmanager
+def _interval_prec(prec):
+    """Temporarily set the interval context's precision (it has no workprec)."""
+    iv = thread_interval_context()
+    saved = iv.prec
+    iv.prec = prec
+    try:
+        yield iv
+    finally:
+        iv.prec = saved
+
+
+def _enclose_argument(x):
+    """Enclose x at the current interval precision."""
+    iv = thread_interval_context()
+    if hasattr(x, "numerator") and not isinstance(x, int):
+        return iv.mpf(x.numerator) / x.denominator
+    if hasattr(x, "_mpf_"):
+        with _interval_prec(max(iv.prec, x._mpf_[3])):
+            return iv.mpf(mp.make_mpf(x._mpf_))
+    return iv.mpf(x)
+
+
+def _lower(interval):
+    """Lower endpoint as an mpf of the thread context (exact)."""
+    return mp.make_mpf(interval._mpi_[0])
+
+
+def _upper(interval):
+    """Upper endpoint as an mpf of the thread context (exact)."""
+    return mp.make_mpf(interval._mpi_[1])
+
+
+def _reduce(x, prec):
+    """Return (r, k) with r enclosing x - k·(π/2) at prec bits."""
+    with _interval_prec(prec + 64):
+        magnitude = max(mp.mag(_upper(abs(_enclose_argument(x)))), 0)
+    with _interval_prec(prec + magnitude + 16) as iv:
+        X = _enclose_argument(x)
+        half_pi = iv.pi / 2
+        with mp.workprec(prec + magnitude + 16):
+            k = int(mp.nint(_lower(X) / _lower(half_pi)))
+        r = X - k * half_pi
+    iv.prec = prec
+    return +r, k
+
+
+def _series(r, offset):
+    """Enclose Σ (-1)**j r**(2j+offset) / (2j+offset)! including its tail.
+
+    offset is 1 for sine and 0 for cosine; requires |r| < 1. Returns
+    (interval, terms) where terms counts the summed terms plus the bounding one.
+    """
+    iv = thread_interval_context()
+    if _upper(abs(r)) >= 1:
+        raise ValueError("Reduced argument out of range for the remainder bound")
+    r2 = r**2
+    term = r if offset else iv.mpf(1)
+    # Truncate relative to the leading term, at the working precision.
+    eps = _upper(abs(term)) * mpf(2) ** (-iv.prec)
+    total = iv.mpf(0)
+    terms = 0
+    n = offset
+    while True:
+        total += term
+        terms += 1
+        n += 2
+        term = -term * r2 / (n * (n - 1))
+        bound = _upper(abs(term))
+        if bound <= eps:
+            break
+        if terms > 1000:  # Prevent infinite loops
+            raise RuntimeError("Series not converging")
+    return total + iv.mpf([-bound, bound]), terms + 1
+
+
+def _sincos_enclosure(x, prec, need_sin, need_cos):
+    """Enclosures of sin(x) and/or cos(x) at prec bits with term counts."""
+    r, k = _reduce(x, prec)
+    quadrant = k % 4
+    # sin(q·π/2 + r) and cos(q·π/2 + r) from sin(r), cos(r).
+    swap = quadrant % 2 == 1
+    sin_val = cos_val = None
+    sin_terms = cos_terms = 0
+    if need_sin:
+        sin_val, sin_terms = _series(r, 0 if swap else 1)
+        if quadrant >= 2:
+            sin_val = -sin_val
+    if need_cos:
+        cos_val, cos_terms = _series(r, 1 if swap else 0)
+        if quadrant in (1, 2):
+            cos_val = -cos_val
+    return sin_val, cos_val, sin_terms, cos_terms
+
+
+def _shortfall(interval, tolerance, relative):
+    """Bits by which the enclosure misses the tolerance; 0 if it meets it."""
+    low, high = _lower(interval), _upper(interval)
+    width = mp.fsub(high, low, exact=True)
+    if relative:
+        if low <= 0 <= high:
+            return None  # Sign not yet decided
+        limit = tolerance * min(abs(low), abs(high))
+    else:
+        limit = tolerance
+    if width <= limit:
+        return 0
+    if width == mp.inf or limit == 0:
+        return None
+    return max(mp.mag(width / limit), 1)
+
+
+def _certify(evaluate, tolerance, relative):
+    """Raise the precision until evaluate(prec) meets the tolerance.
+
+    evaluate returns (interval, *terms); the result is (interval, *terms, prec).
+    """
+    mp.prec = 53
+    tolerance = mpf(tolerance)
+    if not tolerance > 0:
+        raise ValueError("Tolerance must be positive.")
+    prec = max(-mp.mag(tolerance), 1) + START_GUARD_BITS
+    while True:
+        result = evaluate(prec)
+        missing = _shortfall(result[0], tolerance, relative)
+        if missing == 0:
+            return (*result, prec)
+        prec += missing + 4 if missing is not None else prec
+        if prec > MAX_PRECISION_BITS:
+            raise RuntimeError("Could not certify the result (pole or zero value?)")
+
+
+def _quotient(numerator, denominator, name):
+    """Interval quotient, refusing a denominator that is exactly zero."""
+    if _lower(denominator) == 0 == _upper(denominator):
+        raise ValueError(f"{name} is undefined at this angle")
+    return numerator / denominator
+
+
+@isolated_precision
+def sine_interval(x, tolerance, relative=False):
+    """Computes a certified enclosure of sin(x).
+
+    Parameters:
+    -----------
+    x : int, mpf, Fraction, float or str
+        Angle in radians; a decimal str is enclosed as written, not rounded first.
+    tolerance : float or mpf
+        Largest allowed width of the enclosure, absolute or, if relative is
+        True, relative to the smallest magnitude in it.
+    relative : bool, optional
+        Interpret tolerance relatively (default False).
+
+    Returns:
+    --------
+    (mpmath.iv.mpf, int, int)
+        The enclosure, the series terms used and the working precision in bits.
+    """
+    def evaluate(prec):
+        sin_val, _, sin_terms, _ = _sincos_enclosure(x, prec, True, False)
+        return sin_val, sin_terms
+    return _certify(evaluate, tolerance, relative)
+
+
+@isolated_precision
+def cosine_interval(x, tolerance, relative=False):
+    """Computes a certified enclosure of cos(x). See sine_interval."""
+    def evaluate(prec):
+        _, cos_val, _, cos_terms = _sincos_enclosure(x, prec, False, True)
+        return cos_val, cos_terms
+    return _certify(evaluate, tolerance, relative)
+
+
+@isolated_precision
+def tangent_interval(x, tolerance, relative=False):
+    """Computes a certified enclosure of tan(x) = sin(x)/cos(x).
+
+    Returns (interval, sin_terms, cos_terms, prec).
+
+    Raises:
+    -------
+    ValueError
+        If cos(x) is exactly zero.
+    """
+    def evaluate(prec):
+        sin_val, cos_val, sin_terms, cos_terms = _sincos_enclosure(x, prec, True, True)
+        return _quotient(sin_val, cos_val, "Tangent"), sin_terms, cos_terms
+    return _certify(evaluate, tolerance, relative)
+
+
+@isolated_precision
+def secant_interval(x, tolerance, relative=False):
+    """Computes a certified enclosure of sec(x) = 1/cos(x). See sine_interval."""
+    def evaluate(prec):
+        _, cos_val, _, cos_terms = _sincos_enclosure(x, prec, False, True)
+        return _quotient(1, cos_val, "Secant"), cos_terms
+    return _certify(evaluate, tolerance, relative)
+
+
+@isolated_precision
+def cosecant_interval(x, tolerance, relative=False):
+    """Computes a certified enclosure of csc(x) = 1/sin(x). See sine_interval."""
+    def evaluate(prec):
+        sin_val, _, sin_terms, _ = _sincos_enclosure(x, prec, True, False)
+        return _quotient(1, sin_val, "Cosecant"), sin_terms
+    return _certify(evaluate, tolerance, relative)
+
+
+@isolated_precision
+def cotangent_interval(x, tolerance, relative=False):
+    """Computes a certified enclosure of cot(x) = cos(x)/sin(x).
+
+    Returns (interval, sin_terms, cos_terms, prec).
+    """
+    def evaluate(prec):
+        sin_val, cos_val, sin_terms, cos_terms = _sincos_enclosure(x, prec, True, True)
+        return _quotient(cos_val, sin_val, "Cotangent"), sin_terms, cos_terms
+    return _certify(evaluate, tolerance, relative)
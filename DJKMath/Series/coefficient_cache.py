@@ -0,0 +1,163 @@
+"""
+coefficient_cache.py
+Precision-keyed cache of the Taylor coefficients of sine and cosine (and of other series).
+
+The series loops used to divide every term by n·(n-1) at full precision.
+With the coefficients (-1)**k / (2k+1)! and (-1)**k / (2k)! stored once per
+working precision, each term is just two multiplications (coefficient times
+power, power times x**2) and an addition.
+
+Tables are keyed by the working precision in bits (mp.prec), grown lazily as
+far as the longest series has needed, and evicted least-recently-used first
+once their estimated size passes MAX_CACHE_BYTES. Each thread keeps its own
+tables (the values belong to its private mpmath context, see
+precision_context.py), so the cap applies per thread.
+
+Other series keep their coefficients in the same cache under a name of
+their own (exact_coefficients), from exact rational values rounded once.
+
+Functions:
+    sine_coefficients(count, prec): At least count values of ±1/(2k+1)!
+    cosine_coefficients(count, prec): At least count values of ±1/(2k)!
+    exact_coefficients(name, count, coefficient, prec): A named table of rounded Fractions
+    clear_coefficient_cache(): Drop all cached tables
+    clear_coefficient_table(name): Drop the tables of one name
+    coefficient_cache_info(): Precisions cached and estimated bytes used
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+"""
+
+import threading
+from collections import OrderedDict
+from math import factorial
+
+from mpmath.libmp import from_rational, round_nearest
+
+from .precision_context import mp, mpf
+
+# Upper bound on the estimated memory held by all cached tables.
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+# Per thread: prec -> {table name: values}, least recently used first.
+_local = threading.local()
+
+
+def _thread_cache():
+    """Return the calling thread's cache, creating it on first use."""
+    cache = getattr(_local, "cache", None)
+    if cache is None:
+        cache = _local.cache = OrderedDict()
+    return cache
+
+
+def _entry_bytes(prec):
+    """Rough size of one cached mpf: its mantissa plus object overhead."""
+    return prec // 8 + 100
+
+
+def _cache_bytes():
+    """Estimated bytes held by all cached tables."""
+    return sum(
+        sum(len(table) for table in tables.values()) * _entry_bytes(prec)
+        for prec, tables in _thread_cache().items()
+    )
+
+
+def _evict():
+    """Drop least recently used precisions until the cache fits its cap."""
+    cache = _thread_cache()
+    while len(cache) > 1 and _cache_bytes() > MAX_CACHE_BYTES:
+        cache.popitem(last=False)
+
+
+def _tables(prec):
+    """Return the dict of tables for prec, marking them most recent."""
+    cache = _thread_cache()
+    tables = cache.get(prec)
+    if tables is None:
+        tables = cache[prec] = {"sine": [], "cosine": []}
+    else:
+        cache.move_to_end(prec)
+    return tables
+
+
+def _extend(table, count, prec, offset):
+    """Append (-1)**k / (2k + offset)! until the table holds count values."""
+    k = len(table)
+    if k >= count:
+        return
+    # Each value is one correctly rounded division by an exact factorial,
+    # so no rounding error builds up along the table.
+    fact = factorial(2 * k + offset)
+    with mp.workprec(prec):
+        while k < count:
+            value = mpf(1) / fact
+            table.append(-value if k % 2 else value)
+            k += 1
+            fact *= (2 * k + offset - 1) * (2 * k + offset)
+    _evict()
+
+
+def sine_coefficients(count, prec=None):
+    """Return the cached list [1/1!, -1/3!, 1/5!, ...] with at least count values.
+
+    prec is the working precision in bits (default: the current mp.prec).
+    The same list object is returned on every call for that precision.
+    """
+    if prec is None:
+        prec = mp.prec
+    table = _tables(prec)["sine"]
+    _extend(table, count, prec, 1)
+    return table
+
+
+def cosine_coefficients(count, prec=None):
+    """Return the cached list [1/0!, -1/2!, 1/4!, ...] with at least count values.
+
+    prec is the working precision in bits (default: the current mp.prec).
+    The same list object is returned on every call for that precision.
+    """
+    if prec is None:
+        prec = mp.prec
+    table = _tables(prec)["cosine"]
+    _extend(table, count, prec, 0)
+    return table
+
+
+def exact_coefficients(name, count, coefficient, prec=None):
+    """Return the cached list [coefficient(0), coefficient(1), ...] rounded to prec bits.
+
+    coefficient(k) gives the k-th value exactly (a Fraction or an int); each
+    is rounded once, to nearest. name keys the table, so one name must always
+    go with the same coefficient function. The list holds at least count
+    values and is the same object on every call for that name and precision.
+    """
+    if prec is None:
+        prec = mp.prec
+    table = _tables(prec).setdefault(name, [])
+    k = len(table)
+    if k < count:
+        while k < count:
+            value = coefficient(k)
+            table.append(mp.make_mpf(from_rational(value.numerator, value.denominator,
+                                                   prec, round_nearest)))
+            k += 1
+        _evict()
+    return table
+
+
+def clear_coefficient_cache():
+    """Drop the calling thread's cached coefficient tables."""
+    _thread_cache().clear()
+
+
+def clear_coefficient_table(name):
+    """Drop the calling thread's tables of name at every precision."""
+    for tables in _thread_cache().values():
+        tables.pop(name, None)
+
+
+def coefficient_cache_info():
+    """Return (list of cached precisions in bits, estimated bytes used)."""
+    return list(_thread_cache()), _cache_bytes()
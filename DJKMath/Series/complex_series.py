@@ -0,0 +1,187 @@
+"""
+complex_series.py
+Sine, cosine and tangent of complex arguments from the real series.
+
+For z = x + iy,
+
+    sin z = sin x·cosh y + i·cos x·sinh y
+    cos z = cos x·cosh y - i·sin x·sinh y
+
+so one pass computes both: sin x and cos x from the reduced real part
+(argument_reduction.py and the sine/cosine series of hypergeometric.py),
+sinh y and cosh y together from one series or one exponential
+(sinhcosh_power_series), then four multiplications. tan z = sin z / cos z
+is one complex division more.
+
+Arguments are Python complex or mpc (its parts are used exactly, as mpf
+arguments are elsewhere). complex_sincos_batch takes a whole list, e.g.
+from Utils.inout.get_bunch_complex, in a single call: the context, the
+precision and the threshold are set up once, and equal real or imaginary
+parts, common on grids, are evaluated once per batch.
+
+Functions:
+    is_complex(value): Whether value is a complex or mpc number
+    complex_sincos(z, precision, method, backend): (sin z, cos z, terms)
+    complex_tangent(z, precision, method, backend): (tan z, terms)
+    complex_sincos_batch(values, precision, method, backend): [(sin, cos, terms), ...]
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+"""
+
+from .precision_context import mp, mpf, isolated_precision
+from .argument_reduction import reduce_argument
+from .hypergeometric import (
+    STRATEGIES,
+    taylor_sum,
+    paterson_stockmeyer_sums,
+    sinhcosh_power_series,
+)
+
+# Backends that accept complex arguments (all of them run on mpmath).
+BACKENDS = ("auto", "mpmath")
+
+# Extra digits for the products of the real and hyperbolic parts.
+GUARD_DIGITS = 5
+
+
+def is_complex(value):
+    """Whether value is a Python complex or an mpmath mpc."""
+    return isinstance(value, complex) or hasattr(value, "_mpc_")
+
+
+def _check(precision, method, backend):
+    """Validate the precision, method and backend for complex arguments."""
+    if precision < 1:
+        raise ValueError("Precision must be at least 1 digit.")
+    if method not in STRATEGIES:
+        raise ValueError(f"Complex arguments support the methods {', '.join(STRATEGIES)} only.")
+    if backend not in BACKENDS:
+        raise ValueError(f"Complex arguments support the backends {', '.join(BACKENDS)} only.")
+
+
+def _parts(z):
+    """The real and imaginary parts of z as mpf, without rounding."""
+    if hasattr(z, "_mpc_"):
+        z = mp.make_mpc(z._mpc_)
+        return z.real, z.imag
+    if isinstance(z, complex):
+        return mpf(z.real), mpf(z.imag)
+    return mpf(z), mpf(0)
+
+
+def _real_sincos(x, precision, method, threshold):
+    """sin x and cos x of a real x after reduction: (sin, cos, terms)."""
+    r, quadrant = reduce_argument(x, precision)
+    if method == "paterson_stockmeyer":
+        (s, s_terms), (c, c_terms) = paterson_stockmeyer_sums(["sine", "cosine"], r, precision)
+    else:
+        s, s_terms = taylor_sum("sine", r, precision, threshold)
+        c, c_terms = taylor_sum("cosine", r, precision, threshold)
+    # sin(q·π/2 + r) and cos(q·π/2 + r) for q = 0, 1, 2, 3.
+    if quadrant == 1:
+        s, c = c, -s
+    elif quadrant == 2:
+        s, c = -s, -c
+    elif quadrant == 3:
+        s, c = -c, s
+    return s, c, s_terms + c_terms
+
+
+def _sincos(z, work, method, threshold, real_parts, imaginary_parts):
+    """sin z and cos z at work digits: (sin, cos, terms).
+
+    real_parts and imaginary_parts memoize the real and hyperbolic factors
+    by part.
+    """
+    x, y = _parts(z)
+    if x not in real_parts:
+        real_parts[x] = _real_sincos(x, work, method, threshold)
+    if y not in imaginary_parts:
+        imaginary_parts[y] = sinhcosh_power_series(y, work, method) if y else (mpf(0), mpf(1), 0)
+    s, c, real_terms = real_parts[x]
+    sh, ch, imaginary_terms = imaginary_parts[y]
+    mp.dps = work
+    sin_z = mp.mpc(s * ch, c * sh)
+    cos_z = mp.mpc(c * ch, -s * sh)
+    return sin_z, cos_z, real_terms + imaginary_terms
+
+
+@isolated_precision
+def complex_sincos(z, precision, method="taylor", backend="auto"):
+    """Computes sin z and cos z of a complex z in one pass.
+
+    Parameters:
+    -----------
+    z : complex or mpc
+        The argument (real values are taken as z + 0i).
+    precision : int
+        Digits of the results: each part is within about
+        10**-precision·cosh(y), i.e. relative except near the zeros of sin
+        and cos (as for the real series).
+    method : str, optional
+        "taylor" (default) or "paterson_stockmeyer".
+    backend : str, optional
+        "auto" or "mpmath"; both run on mpmath.
+
+    Returns:
+    --------
+    (mpc, mpc, int)
+        sin z, cos z and the series terms summed for both.
+
+    Raises:
+    -------
+    ValueError
+        If precision is not positive, the method or backend is not supported
+        for complex arguments, or z is not finite.
+    """
+    _check(precision, method, backend)
+    work = precision + GUARD_DIGITS
+    mp.dps = work
+    sin_z, cos_z, terms = _sincos(z, work, method, mpf(10) ** (-work), {}, {})
+    mp.dps = precision
+    return +sin_z, +cos_z, terms
+
+
+@isolated_precision
+def complex_tangent(z, precision, method="taylor", backend="auto"):
+    """Computes tan z = sin z / cos z of a complex z.
+
+    Parameters and errors are as for complex_sincos. Returns (tan z, terms).
+    """
+    _check(precision, method, backend)
+    work = precision + GUARD_DIGITS
+    mp.dps = work
+    sin_z, cos_z, terms = _sincos(z, work, method, mpf(10) ** (-work), {}, {})
+    value = sin_z / cos_z
+    mp.dps = precision
+    return +value, terms
+
+
+@isolated_precision
+def complex_sincos_batch(values, precision, method="taylor", backend="auto"):
+    """Computes sin z and cos z for a whole list of complex values in one call.
+
+    Parameters:
+    -----------
+    values : iterable of complex or mpc
+        The arguments, e.g. the list filled by Utils.inout.get_bunch_complex.
+    precision, method, backend :
+        As for complex_sincos.
+
+    Returns:
+    --------
+    list of (mpc, mpc, int)
+        sin z, cos z and the terms summed, in the order of values.
+    """
+    _check(precision, method, backend)
+    work = precision + GUARD_DIGITS
+    mp.dps = work
+    threshold = mpf(10) ** (-work)
+    real_parts, imaginary_parts = {}, {}
+    results = []
+    for z in values:
+        sin_z, cos_z, terms = _sincos(z, work, method, threshold, real_parts, imaginary_parts)
+        results.append((sin_z, cos_z, terms))
+    mp.dps = precision
+    return [(+sin_z, +cos_z, terms) for sin_z, cos_z, terms in results]
@@ -0,0 +1,312 @@
+"""
+decimal_backend.py
+Sine and cosine series on the standard library's decimal module (backend="decimal").
+
+decimal is implemented in C (libmpdec) and works in base 10, so its
+precision is exactly the number of significant digits get_precision() asks
+for. Every evaluation runs in its own decimal.Context entered with
+localcontext(), so neither the caller's decimal context nor any module
+state changes, and threads do not interfere.
+
+    1. x is converted to Decimal exactly (int, float, Decimal, decimal str)
+       or to the working precision (mpf, Fraction).
+    2. x = k·(π/2) + r with |r| <= π/4, carrying the magnitude digits of x
+       plus GUARD_DIGITS; if the subtraction cancels more than that, it is
+       repeated with more digits, like argument_reduction.py.
+    3. The sine or cosine Taylor loop of r with the same stopping rule and
+       term counting as trigo_sin_cos_tan.py, rounded to precision digits.
+
+π comes from the Machin integer series in float_kernel.py, cached at the
+largest precision used so far.
+
+Functions:
+    decimal_sine(x, precision): (Decimal value, terms)
+    decimal_cosine(x, precision): (Decimal value, terms)
+    decimal_sincos(x, precision): (sin, cos, sin_terms, cos_terms)
+    decimal_divide(a, b, precision): a / b rounded to precision digits
+    dms_to_radians(degree, minute, second, precision): DMS conversion
+    radians_to_degrees(radian, precision): Radian conversion
+    degrees_to_dms(degree, precision): Whole degrees, minutes and the seconds
+    benchmark_backends(precisions, angle, repeat): Time decimal against mpmath
+
+Dependencies:
+    decimal: For the arithmetic (standard library)
+    mpmath: Only to read mpf arguments and for the benchmark comparison
+"""
+
+import threading
+import time
+from decimal import Context, Decimal, localcontext, ROUND_HALF_EVEN, MAX_EMAX, MIN_EMIN
+
+import mpmath
+
+from .argument_reduction import LOG2_10
+from .float_kernel import pi_scaled
+
+# Extra digits carried through the reduction and the series.
+GUARD_DIGITS = 5
+
+# Precisions timed by benchmark_backends() by default.
+BENCHMARK_PRECISIONS = (20, 50, 100, 500, 1000)
+
+# π cached at the largest precision computed so far: (digits, Decimal).
+_pi_cache = (0, None)
+_pi_lock = threading.Lock()
+
+
+def _context(digits):
+    """A fresh context with digits significant digits and no traps for inexact results."""
+    return Context(prec=digits, rounding=ROUND_HALF_EVEN, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+
+def _pi(digits):
+    """π to digits significant digits (in the current local context)."""
+    global _pi_cache
+    with _pi_lock:
+        cached_digits, cached = _pi_cache
+        if cached_digits < digits:
+            bits = int((digits + 10) * LOG2_10)
+            with localcontext(_context(digits + 10)):
+                cached = Decimal(pi_scaled(bits)) / Decimal(1 << bits)
+            _pi_cache = (digits + 10, cached)
+    return +cached
+
+
+def _to_decimal(x):
+    """x as a Decimal, exactly where possible, else at the current precision.
+
+    Raises:
+    -------
+    ValueError
+        If x is infinite or nan.
+    """
+    if isinstance(x, Decimal):
+        value = x
+    elif isinstance(x, (int, float, str)):
+        value = Decimal(x)
+    elif hasattr(x, "_mpf_"):
+        sign, man, exp, _ = x._mpf_
+        if not man and exp:
+            raise ValueError("Cannot reduce a non-finite angle")
+        if exp >= 0:
+            value = Decimal(man << exp)
+        else:
+            value = Decimal(man) / Decimal(1 << -exp)
+        if sign:
+            value = -value
+    elif hasattr(x, "numerator"):
+        value = Decimal(x.numerator) / Decimal(x.denominator)
+    else:
+        raise TypeError(f"Cannot convert {type(x).__name__} to Decimal")
+    if not value.is_finite():
+        raise ValueError("Cannot reduce a non-finite angle")
+    return value
+
+
+def _reduce(x, precision):
+    """Return (r, quadrant) with r to precision + GUARD_DIGITS digits."""
+    target = precision + GUARD_DIGITS
+    with localcontext(_context(target + 20)):
+        magnitude = max(_to_decimal(x).adjusted(), 0)
+    extra = magnitude + GUARD_DIGITS
+    while True:
+        with localcontext(_context(target + extra)):
+            value = _to_decimal(x)
+            half_pi = _pi(target + extra) / 2
+            if abs(value) <= half_pi / 2:
+                return +value, 0
+            k = (value / half_pi).to_integral_value()
+            r = value - k * half_pi
+        if r == 0:
+            return r, int(k) % 4
+        lost = magnitude - r.adjusted()
+        if extra >= lost + GUARD_DIGITS:
+            with localcontext(_context(target)):
+                return +r, int(k) % 4
+        extra = lost + 2 * GUARD_DIGITS
+
+
+def _sine_series(r, threshold):
+    """Sine Taylor loop on a Decimal, counting terms like _sine_series."""
+    r2 = r * r
+    result = Decimal(0)
+    term = r
+    n = 1
+    total_terms = 1
+    while abs(term) > threshold:
+        result += term
+        n += 2
+        term = -term * r2 / (n * (n - 1))
+        total_terms += 1
+        if total_terms > 1000:  # Prevent infinite loops
+            raise RuntimeError("Series not converging")
+    return result, total_terms
+
+
+def _cosine_series(r, threshold):
+    """Cosine Taylor loop on a Decimal, counting terms like _cosine_series."""
+    r2 = r * r
+    result = Decimal(1)
+    term = Decimal(1)
+    n = 0
+    total_terms = 1
+    while abs(term) > threshold:
+        n += 2
+        term = -term * r2 / (n * (n - 1))
+        result += term
+        total_terms += 1
+        if total_terms > 1000:  # Prevent infinite loops
+            raise RuntimeError("Series not converging")
+    return result, total_terms
+
+
+def _check(precision):
+    """Validate the precision."""
+    if precision < 1:
+        raise ValueError("Precision must be at least 1 digit.")
+
+
+def _quadrant_series(x, precision, shift):
+    """sin (shift=0) or cos (shift=1) of x via its quadrant."""
+    _check(precision)
+    r, quadrant = _reduce(x, precision)
+    quadrant = (quadrant + shift) % 4
+    threshold = Decimal(1).scaleb(-precision)
+    with localcontext(_context(precision + GUARD_DIGITS)):
+        if quadrant % 2 == 0:
+            value, terms = _sine_series(r, threshold)
+        else:
+            value, terms = _cosine_series(r, threshold)
+    with localcontext(_context(precision)):
+        value = -value if quadrant >= 2 else +value
+    return value, terms
+
+
+def decimal_sine(x, precision):
+    """Computes sine with the decimal Taylor series. Returns (Decimal, terms)."""
+    return _quadrant_series(x, precision, 0)
+
+
+def decimal_cosine(x, precision):
+    """Computes cosine with the decimal Taylor series. Returns (Decimal, terms)."""
+    return _quadrant_series(x, precision, 1)
+
+
+def decimal_sincos(x, precision):
+    """Computes sine and cosine from one decimal reduction.
+
+    Returns (sin, cos, sin_terms, cos_terms).
+    """
+    _check(precision)
+    r, quadrant = _reduce(x, precision)
+    threshold = Decimal(1).scaleb(-precision)
+    with localcontext(_context(precision + GUARD_DIGITS)):
+        s, s_terms = _sine_series(r, threshold)
+        c, c_terms = _cosine_series(r, threshold)
+    with localcontext(_context(precision)):
+        # sin(q·π/2 + r) and cos(q·π/2 + r) for q = 0, 1, 2, 3.
+        if quadrant == 1:
+            s, c, s_terms, c_terms = c, -s, c_terms, s_terms
+        elif quadrant == 2:
+            s, c = -s, -c
+        elif quadrant == 3:
+            s, c, s_terms, c_terms = -c, s, c_terms, s_terms
+        return +s, +c, s_terms, c_terms
+
+
+def decimal_divide(a, b, precision):
+    """Returns a / b rounded to precision digits (for the derived ratios)."""
+    with localcontext(_context(precision)):
+        return Decimal(a) / Decimal(b)
+
+
+def dms_to_radians(degree, minute, second, precision):
+    """Converts degrees, minutes and seconds to radians in decimal.
+
+    Returns (decimal_degree, radian, normal_degree, normal_radian) where the
+    normal values are reduced to [0, 360) degrees.
+    """
+    with localcontext(_context(precision + GUARD_DIGITS)):
+        decimal_degree = _to_decimal(degree) + _to_decimal(minute) / 60 + _to_decimal(second) / 3600
+        pi = _pi(precision + GUARD_DIGITS)
+        radian = decimal_degree * pi / 180
+        normal_degree = decimal_degree % 360
+        if normal_degree < 0:
+            normal_degree += 360
+        normal_radian = normal_degree * pi / 180
+    with localcontext(_context(precision)):
+        return +decimal_degree, +radian, +normal_degree, +normal_radian
+
+
+def radians_to_degrees(radian, precision):
+    """Converts radians to degrees in decimal.
+
+    Returns (decimal_degree, normal_radian, normal_degree) with the normal
+    values reduced to [0, 2π) and [0, 360).
+    """
+    with localcontext(_context(precision + 20)):
+        magnitude = max(_to_decimal(radian).adjusted(), 0)
+    digits = precision + GUARD_DIGITS + magnitude
+    with localcontext(_context(digits)):
+        value = _to_decimal(radian)
+        pi = _pi(digits)
+        decimal_degree = value * 180 / pi
+        normal_radian = value % (2 * pi)
+        if normal_radian < 0:
+            normal_radian += 2 * pi
+        normal_degree = normal_radian * 180 / pi
+    with localcontext(_context(precision)):
+        return +decimal_degree, +normal_radian, +normal_degree
+
+
+def degrees_to_dms(degree, precision):
+    """Splits decimal degrees into (int degrees, int minutes, Decimal seconds)."""
+    with localcontext(_context(precision + GUARD_DIGITS)):
+        degree = _to_decimal(degree)
+        minute = degree % 1 * 60
+        second = minute % 1 * 60
+    with localcontext(_context(precision)):
+        return int(degree), int(minute), +second
+
+
+def benchmark_backends(precisions=BENCHMARK_PRECISIONS, angle="1.2345", repeat=5):
+    """Times sine_power_series on the decimal and mpmath backends.
+
+    Parameters:
+    -----------
+    precisions : iterable of int, optional
+        Significant digits to time (default BENCHMARK_PRECISIONS).
+    angle : str, optional
+        Angle in radians, as a decimal string (default "1.2345").
+    repeat : int, optional
+        Evaluations per backend and precision; the best is kept (default 5).
+
+    Returns:
+    --------
+    list of dict
+        One dict per precision with the seconds per evaluation for "decimal"
+        and "mpmath", the faster "engine", and mpmath's arithmetic library
+        ("gmpy" or "python") as "mpmath_backend".
+    """
+    from .trigo_sin_cos_tan import sine_power_series  # trigo imports this module
+
+    results = []
+    for precision in precisions:
+        with mpmath.workdps(precision + 10):
+            x = mpmath.mpf(angle)
+        timings = {}
+        for backend, argument in (("decimal", angle), ("mpmath", x)):
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                sine_power_series(argument, precision, backend=backend)
+                best = min(best, time.perf_counter() - start)
+            timings[backend] = best
+        results.append({
+            "precision": precision,
+            "decimal": timings["decimal"],
+            "mpmath": timings["mpmath"],
+            "engine": min(timings, key=timings.get),
+            "mpmath_backend": mpmath.libmp.BACKEND,
+        })
+    return results
@@ -0,0 +1,455 @@
+"""
+double_double.py
+Double-double (about 32 digit) sine and cosine series for precisions 16 to 31.
+
+Between the 15 digits a double holds and the point where mpmath's cost
+per operation stops mattering, a number can be carried as an unevaluated
+sum hi + lo of two doubles with |lo| <= ulp(hi)/2: 106 significant bits,
+about 31.9 digits. Sums and products are made exact with the error-free
+transformations
+
+    two_sum(a, b)  = (s, e) with s = fl(a + b), a + b = s + e   (Knuth)
+    two_prod(a, b) = (p, e) with p = fl(a · b), a · b = p + e   (Dekker split)
+
+which use only float additions and multiplications and no branches, so the
+same functions run element-wise on NumPy arrays.
+
+    1. Range reduction x = k·(π/2) + r, |r| <= π/4:
+       - scalars: Payne-Hanek with Python integers (float_kernel.payne_hanek)
+         on the exact binary value of hi + lo; the fraction is rounded to a
+         double-double and multiplied by π/2 in double-double.
+       - arrays: a Cody-Waite split of π/2 into 33-bit parts, subtracted
+         in double-double, for |x| < 2**19·(π/2); the rare larger elements
+         go through the integer reduction one by one.
+    2. The sine/cosine Taylor series of r, with the term count found first
+       from float magnitudes (same stopping rule as the mpmath loops) and
+       the polynomial then evaluated by Horner's rule. Scalars evaluate the
+       trailing terms, which are below 2**-56, in plain doubles and only the
+       leading ones in double-double, which keeps them several times faster
+       than mpmath at 30 digits.
+
+Functions:
+    two_sum(a, b), two_prod(a, b): Error-free float sum and product
+    dd_add(a, b), dd_mul(a, b), dd_div(a, b): Double-double arithmetic on pairs
+    as_dd(x, exact): x as a (hi, lo) pair (None if exact and not representable)
+    dd_to_mpf(pair): The exact value hi + lo as an mpf of the thread context
+    reduce_dd(x): (r, quadrant) for a (hi, lo) pair
+    dd_sine(x, precision): (value pair, terms)
+    dd_cosine(x, precision): (value pair, terms)
+    dd_sincos(x, precision): (sin pair, cos pair, sin_terms, cos_terms)
+    dd_sine_array(x, precision): ((hi, lo) arrays, terms) for a float array
+    dd_cosine_array(x, precision): ((hi, lo) arrays, terms) for a float array
+
+Dependencies:
+    numpy: For the array functions (optional for the rest of the package)
+    mpmath: Only to build the mpf results in dd_to_mpf
+"""
+
+from math import isfinite
+
+from .float_kernel import pi_scaled, payne_hanek, QUARTER_PI, CODY_WAITE_LIMIT
+from .precision_context import mpf
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the array functions need it.
+    np = None
+
+# Largest precision a double-double honours (106 bits ≈ 31.9 decimal digits).
+DD_MAX_PRECISION = 31
+
+# Dekker's splitting constant 2**27 + 1.
+_SPLITTER = 134217729.0
+
+# Trailing Horner terms below this are summed in plain doubles.
+_TAIL_LIMIT = 2.0**-56
+
+# Bits of 2/π beyond the bit length of x in the integer reduction.
+_EXTRA_BITS = 200
+
+# Coefficients kept; |r| <= π/4 needs at most 16 terms at 31 digits.
+_TERMS = 40
+
+
+def two_sum(a, b):
+    """Return (s, e) with s = fl(a + b) and a + b = s + e exactly."""
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+
+def _quick_two_sum(a, b):
+    """two_sum for |a| >= |b|."""
+    s = a + b
+    return s, b - (s - a)
+
+
+def two_prod(a, b):
+    """Return (p, e) with p = fl(a · b) and a · b = p + e exactly."""
+    p = a * b
+    t = _SPLITTER * a
+    a_hi = t - (t - a)
+    a_lo = a - a_hi
+    t = _SPLITTER * b
+    b_hi = t - (t - b)
+    b_lo = b - b_hi
+    return p, ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+
+def dd_add(a, b):
+    """Sum of two (hi, lo) pairs."""
+    s, e = two_sum(a[0], b[0])
+    t, f = two_sum(a[1], b[1])
+    e += t
+    s, e = _quick_two_sum(s, e)
+    e += f
+    return _quick_two_sum(s, e)
+
+
+def dd_mul(a, b):
+    """Product of two (hi, lo) pairs."""
+    p, e = two_prod(a[0], b[0])
+    e += a[0] * b[1] + a[1] * b[0]
+    return _quick_two_sum(p, e)
+
+
+def dd_div(a, b):
+    """Quotient of two (hi, lo) pairs (three-step long division)."""
+    q1 = a[0] / b[0]
+    r = dd_add(a, dd_mul(b, (-q1, 0.0)))
+    q2 = r[0] / b[0]
+    r = dd_add(r, dd_mul(b, (-q2, 0.0)))
+    q3 = r[0] / b[0]
+    q = _quick_two_sum(q1, q2)
+    return dd_add(q, (q3, 0.0))
+
+
+def _dd_ratio(numerator, denominator):
+    """Correctly rounded hi and nearly so lo of numerator/denominator (ints, denominator > 0)."""
+    hi = numerator / denominator
+    n, d = hi.as_integer_ratio()
+    return hi, (numerator * d - n * denominator) / (denominator * d)
+
+
+def _man_exp(x):
+    """Exact (man, exp) with hi + lo = man·2**exp."""
+    n1, d1 = x[0].as_integer_ratio()
+    n2, d2 = x[1].as_integer_ratio()
+    d = max(d1, d2)
+    return n1 * (d // d1) + n2 * (d // d2), 1 - d.bit_length()
+
+
+def _factorial_coefficients(offset):
+    """(-1)**k / (2k + offset)! as (hi list, lo list)."""
+    his, los = [], []
+    factorial = 1
+    for k in range(_TERMS):
+        n = 2 * k + offset
+        if n > 1:
+            factorial *= n * (n - 1) if k else n
+        hi, lo = _dd_ratio(-1 if k % 2 else 1, factorial)
+        his.append(hi)
+        los.append(lo)
+    return his, los
+
+
+_SIN_HI, _SIN_LO = _factorial_coefficients(1)
+_COS_HI, _COS_LO = _factorial_coefficients(0)
+_HALF_PI = _dd_ratio(pi_scaled(240), 1 << 241)
+
+
+def _half_pi_parts(count):
+    """π/2 as count doubles, the first count - 1 with 33 significant bits."""
+    total = 33 * count + 64
+    remaining = pi_scaled(total) >> 1  # 2**total·π/2, total + 1 bits
+    parts = []
+    for i in range(1, count):
+        low = total + 1 - 33 * i
+        chunk = (remaining >> low) << low
+        parts.append(chunk / (1 << total))
+        remaining -= chunk
+    parts.append(remaining / (1 << total))
+    return parts
+
+
+_PIO2_PARTS = _half_pi_parts(6)
+
+
+def as_dd(x, exact=True):
+    """Return x as a (hi, lo) pair of floats with hi + lo == x.
+
+    Accepts float, int, mpf and Fraction (and (hi, lo) pairs, returned as
+    they are). With exact=True (default) values that do not fit a
+    double-double give None; otherwise they are rounded to one.
+    """
+    if isinstance(x, tuple):
+        return x
+    if isinstance(x, float):
+        return (x, 0.0) if isfinite(x) else None
+    if isinstance(x, int):
+        man, exp = x, 0
+    elif hasattr(x, "_mpf_"):
+        sign, man, exp, bc = x._mpf_
+        if not man:
+            return (0.0, 0.0) if not exp else None  # Zero, or inf/nan
+        if sign:
+            man = -man
+    elif hasattr(x, "numerator"):
+        num, den = x.numerator, x.denominator
+        if den & (den - 1) or not exact:
+            if exact:
+                return None
+            return _dd_ratio(num, den)
+        man, exp = num, 1 - den.bit_length()
+    else:
+        return None
+    if not man:
+        return 0.0, 0.0
+    trailing = (man & -man).bit_length() - 1
+    man >>= trailing
+    exp += trailing
+    bits = man.bit_length()
+    if exact and (bits > 106 or exp < -1074 or exp + bits > 1024):
+        return None
+    if exp >= 0:
+        return _dd_ratio(man << exp, 1)
+    return _dd_ratio(man, 1 << -exp)
+
+
+def dd_to_mpf(pair):
+    """Return hi + lo as an mpf of the thread context, rounded to mp.prec."""
+    return mpf(pair[0]) + pair[1]
+
+
+def reduce_dd(x):
+    """Reduce a (hi, lo) pair to x = k·(π/2) + r with |r| <= π/4.
+
+    Returns (r, quadrant) with r a pair and quadrant = k mod 4.
+    """
+    if abs(x[0]) <= QUARTER_PI:
+        return x, 0
+    man, exp = _man_exp(x)
+    k, numerator, shift = payne_hanek(abs(man), exp, abs(man).bit_length() + _EXTRA_BITS)
+    if numerator >= 0:
+        r = dd_mul(_dd_ratio(numerator, 1 << shift), _HALF_PI)
+    else:
+        r = dd_mul(_dd_ratio(-numerator, 1 << shift), _HALF_PI)
+        r = (-r[0], -r[1])
+    if man < 0:
+        r, k = (-r[0], -r[1]), -k
+    return r, k % 4
+
+
+def _check(x, precision):
+    """Validate precision and x for the double-double kernels."""
+    if not 1 <= precision <= DD_MAX_PRECISION:
+        raise ValueError(
+            f"Double-double precision must be between 1 and {DD_MAX_PRECISION} digits."
+        )
+    if x is None or not (isfinite(x[0]) and isfinite(x[1])):
+        raise ValueError("Cannot reduce a non-finite angle")
+
+
+def _count_terms(r, threshold, offset):
+    """Series terms by the float magnitudes, counted like the mpmath loops.
+
+    Returns (total_terms, summed) where summed is how many leading
+    coefficients the polynomial needs.
+    """
+    r2 = r * r
+    term = abs(r) if offset else 1.0
+    n = offset
+    total_terms = 1
+    while term > threshold:
+        n += 2
+        term *= r2 / (n * (n - 1))
+        total_terms += 1
+    # The sine loop stops before adding the small term; cosine adds it.
+    return total_terms, total_terms - 1 if offset else total_terms
+
+
+def _horner(y, count, his, los):
+    """Σ c_k·y**k for k < count, the terms below _TAIL_LIMIT in plain doubles."""
+    yh = y[0]
+    split = 0
+    bound = 1.0
+    while split < count and abs(his[split]) * bound >= _TAIL_LIMIT:
+        bound *= abs(yh)
+        split += 1
+    tail = 0.0
+    for k in range(count - 1, split - 1, -1):
+        tail = tail * yh + his[k]
+    acc = (tail, 0.0)
+    for k in range(split - 1, -1, -1):
+        acc = dd_add(dd_mul(acc, y), (his[k], los[k]))
+    return acc
+
+
+def _sine_poly(r, y, precision):
+    """sin(r) and its term count for a reduced pair r with y = r²."""
+    total_terms, count = _count_terms(r[0], 10.0 ** (-precision), 1)
+    if not count:
+        return (0.0, 0.0), total_terms
+    return dd_mul(r, _horner(y, count, _SIN_HI, _SIN_LO)), total_terms
+
+
+def _cosine_poly(r, y, precision):
+    """cos(r) and its term count for a reduced pair r with y = r²."""
+    total_terms, count = _count_terms(r[0], 10.0 ** (-precision), 0)
+    return _horner(y, count, _COS_HI, _COS_LO), total_terms
+
+
+def _quadrant_series(x, precision, shift):
+    """sin (shift=0) or cos (shift=1) of a pair via its quadrant."""
+    x = as_dd(x, exact=False)
+    _check(x, precision)
+    r, quadrant = reduce_dd(x)
+    quadrant = (quadrant + shift) % 4
+    y = dd_mul(r, r)
+    if quadrant % 2 == 0:
+        value, terms = _sine_poly(r, y, precision)
+    else:
+        value, terms = _cosine_poly(r, y, precision)
+    if quadrant >= 2:
+        value = (-value[0], -value[1])
+    return value, terms
+
+
+def dd_sine(x, precision):
+    """Computes sine with the double-double Taylor series. Returns ((hi, lo), terms)."""
+    return _quadrant_series(x, precision, 0)
+
+
+def dd_cosine(x, precision):
+    """Computes cosine with the double-double Taylor series. Returns ((hi, lo), terms)."""
+    return _quadrant_series(x, precision, 1)
+
+
+def dd_sincos(x, precision):
+    """Computes sine and cosine from one double-double reduction.
+
+    Returns (sin pair, cos pair, sin_terms, cos_terms).
+    """
+    x = as_dd(x, exact=False)
+    _check(x, precision)
+    r, quadrant = reduce_dd(x)
+    y = dd_mul(r, r)
+    s, s_terms = _sine_poly(r, y, precision)
+    c, c_terms = _cosine_poly(r, y, precision)
+    # sin(q·π/2 + r) and cos(q·π/2 + r) for q = 0, 1, 2, 3.
+    if quadrant == 1:
+        s, c, s_terms, c_terms = c, (-s[0], -s[1]), c_terms, s_terms
+    elif quadrant == 2:
+        s, c = (-s[0], -s[1]), (-c[0], -c[1])
+    elif quadrant == 3:
+        s, c, s_terms, c_terms = (-c[0], -c[1]), s, c_terms, s_terms
+    return s, c, s_terms, c_terms
+
+
+def _require_numpy():
+    """Raise a helpful error when NumPy is not installed."""
+    if np is None:
+        raise ImportError("NumPy is required for the array API: pip install numpy")
+
+
+def _reduce_array(x):
+    """Cody-Waite reduction of a float array in double-double.
+
+    Returns (r_hi, r_lo, quadrant).
+    """
+    k = np.rint(x * (2 / np.pi))
+    # k·part is exact for |k| < 2**20, and x - k·part_1 is exact too.
+    r = (x - k * _PIO2_PARTS[0], np.zeros_like(x))
+    for part in _PIO2_PARTS[1:]:
+        r = dd_add(r, (-k * part, np.zeros_like(x)))
+    r_hi, r_lo = r
+    quadrant = np.mod(k, 4).astype(np.int64)
+    small = np.abs(x) <= QUARTER_PI
+    r_hi = np.where(small, x, r_hi)
+    r_lo = np.where(small, 0.0, r_lo)
+    quadrant[small] = 0
+    large = np.flatnonzero(np.abs(x) >= CODY_WAITE_LIMIT)
+    for i in large:
+        (r_hi[i], r_lo[i]), quadrant[i] = reduce_dd((float(x[i]), 0.0))
+    return r_hi, r_lo, quadrant
+
+
+def _array_poly(y, counts, his, los):
+    """Σ c_k·y**k for k < counts (element-wise) in double-double."""
+    zero = np.zeros_like(y[0])
+    acc = (zero, zero)
+    for k in range(int(counts.max(initial=0)) - 1, -1, -1):
+        used = k < counts
+        coefficient = (np.where(used, his[k], 0.0), np.where(used, los[k], 0.0))
+        acc = dd_add(dd_mul(acc, y), coefficient)
+    return acc
+
+
+def _array_counts(r, threshold, offset):
+    """Element-wise _count_terms."""
+    r2 = r * r
+    term = np.abs(r) if offset else np.ones_like(r)
+    total_terms = np.ones(r.shape, dtype=np.int64)
+    active = term > threshold
+    n = offset
+    while active.any():
+        n += 2
+        term = term * (r2 / (n * (n - 1)))
+        total_terms += active
+        active &= term > threshold
+    return total_terms, total_terms - 1 if offset else total_terms
+
+
+def _evaluate_array(x, precision, shift):
+    """sin (shift=0) or cos (shift=1) of a float array in double-double."""
+    _require_numpy()
+    if not 1 <= precision <= DD_MAX_PRECISION:
+        raise ValueError(
+            f"Double-double precision must be between 1 and {DD_MAX_PRECISION} digits."
+        )
+    x = np.asarray(x, dtype=np.float64)
+    finite = np.isfinite(x)
+    r_hi, r_lo, quadrant = _reduce_array(np.where(finite, x, 0.0))
+    quadrant = (quadrant + shift) % 4
+    r = (r_hi, r_lo)
+    y = dd_mul(r, r)
+    threshold = 10.0 ** (-precision)
+
+    sin_terms, sin_count = _array_counts(r_hi, threshold, 1)
+    sin_hi, sin_lo = dd_mul(r, _array_poly(y, sin_count, _SIN_HI, _SIN_LO))
+    cos_terms, cos_count = _array_counts(r_hi, threshold, 0)
+    cos_hi, cos_lo = _array_poly(y, cos_count, _COS_HI, _COS_LO)
+
+    use_cos = (quadrant % 2) == 1
+    sign = np.where(quadrant >= 2, -1.0, 1.0)
+    hi = np.where(finite, sign * np.where(use_cos, cos_hi, sin_hi), np.nan)
+    lo = np.where(finite, sign * np.where(use_cos, cos_lo, sin_lo), np.nan)
+    terms = np.where(finite, np.where(use_cos, cos_terms, sin_terms), 0)
+    return (hi, lo), terms
+
+
+def dd_sine_array(x, precision=DD_MAX_PRECISION):
+    """Computes sine of every element of a float array in double-double.
+
+    Parameters:
+    -----------
+    x : array_like
+        Angles in radians (float64).
+    precision : int, optional
+        Significant digits, 1 to 31 (default 31).
+
+    Returns:
+    --------
+    ((numpy.ndarray, numpy.ndarray), numpy.ndarray)
+        The hi and lo parts of the sines and the number of terms used for
+        each element. Non-finite inputs give nan with a term count of 0.
+    """
+    return _evaluate_array(x, precision, 0)
+
+
+def dd_cosine_array(x, precision=DD_MAX_PRECISION):
+    """Computes cosine of every element of a float array in double-double.
+
+    See dd_sine_array for parameters and return values.
+    """
+    return _evaluate_array(x, precision, 1)
@@ -0,0 +1,212 @@
+"""
+exact_angle.py
+Angles in degrees, minutes and seconds as exact rationals, with closed forms for the special angles.
+
+degree + minute/60 + second/3600 in floats (or in mpf at the default 15
+digits) puts a rounding error into the angle before any series runs, and
+no amount of precision afterwards removes it. Here the three parts are
+added as fractions.Fraction, so the angle stays exact:
+
+    - reduction modulo 360 degrees is exact, however large the angle;
+    - the one conversion to radians, d·π/180, rounds only once and at the
+      precision of the series (degrees_to_radians);
+    - at the angles whose sine and cosine are known in radicals (multiples
+      of 15, 18 and 22.5 degrees: 30° gives 1/2, 60° gives √3/2, 18° gives
+      (√5 - 1)/4, ...) the value comes from the closed form and no series
+      is summed (special_sincos);
+    - the poles of tan/sec (odd multiples of 90°) and csc/cot (multiples
+      of 180°) are decided exactly (pole_multiple).
+
+The trigonometric functions in trigo_sin_cos_tan.py take a DegreeAngle
+wherever they take a radian value.
+
+Seconds given as a float are read from their shortest decimal form
+(repr), i.e. as typed: 0.1 is 1/10, not the binary double nearest to it.
+
+Functions:
+    exact_fraction(value): int, Fraction, Decimal, str, float or mpf as an exact Fraction
+    dms_to_degrees(degree, minute, second): Exact Fraction of degrees
+    DegreeAngle(degree, minute, second): An exact angle for the series functions
+    degrees_to_radians(angle, precision, normalize): The angle in radians as an mpf
+    special_sincos(angle, precision): Closed-form (sin, cos, sin_text, cos_text) or None
+    pole_multiple(angle, half): k where the angle is k·90° (half) or k·180°, else None
+
+Dependencies:
+    fractions: For the exact arithmetic (standard library)
+    mpmath: For the radian values and the radicals
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+from math import isfinite
+
+from .precision_context import mp, mpf, isolated_precision
+
+# Extra bits for the conversion to radians and for the radicals.
+GUARD_BITS = 16
+
+# sin of the first-quadrant angles (in degrees) known in radicals:
+# text and an evaluator at the current precision. cos(a) is sin(90 - a).
+_SPECIAL_SINES = {
+    Fraction(0): ("0", lambda: mpf(0)),
+    Fraction(15): ("(√6 - √2)/4", lambda: (mp.sqrt(6) - mp.sqrt(2)) / 4),
+    Fraction(18): ("(√5 - 1)/4", lambda: (mp.sqrt(5) - 1) / 4),
+    Fraction(45, 2): ("√(2 - √2)/2", lambda: mp.sqrt(2 - mp.sqrt(2)) / 2),
+    Fraction(30): ("1/2", lambda: mpf(1) / 2),
+    Fraction(36): ("√(10 - 2√5)/4", lambda: mp.sqrt(10 - 2 * mp.sqrt(5)) / 4),
+    Fraction(45): ("√2/2", lambda: mp.sqrt(2) / 2),
+    Fraction(54): ("(√5 + 1)/4", lambda: (mp.sqrt(5) + 1) / 4),
+    Fraction(60): ("√3/2", lambda: mp.sqrt(3) / 2),
+    Fraction(135, 2): ("√(2 + √2)/2", lambda: mp.sqrt(2 + mp.sqrt(2)) / 2),
+    Fraction(72): ("√(10 + 2√5)/4", lambda: mp.sqrt(10 + 2 * mp.sqrt(5)) / 4),
+    Fraction(75): ("(√6 + √2)/4", lambda: (mp.sqrt(6) + mp.sqrt(2)) / 4),
+    Fraction(90): ("1", lambda: mpf(1)),
+}
+
+
+def exact_fraction(value):
+    """Returns value as an exact fractions.Fraction.
+
+    Accepts int, fractions.Fraction, DJKMath.Fraction.Fraction (anything
+    with integer numerator and denominator), Decimal, str ("30.5", "1/3",
+    "1e-3"), float (by its repr) and mpf (exactly, bit for bit).
+
+    Raises:
+    -------
+    ValueError
+        If value is infinite or nan, or a string that is not a number.
+    TypeError
+        For any other type.
+    """
+    if isinstance(value, Fraction):
+        return value
+    if isinstance(value, int):
+        return Fraction(value)
+    if isinstance(value, float):
+        if not isfinite(value):
+            raise ValueError("Cannot use a non-finite angle")
+        return Fraction(repr(value))
+    if isinstance(value, Decimal):
+        if not value.is_finite():
+            raise ValueError("Cannot use a non-finite angle")
+        return Fraction(value)
+    if isinstance(value, str):
+        return Fraction(value.strip())
+    if hasattr(value, "_mpf_"):
+        sign, man, exp, _ = value._mpf_
+        if not man and exp:
+            raise ValueError("Cannot use a non-finite angle")
+        result = Fraction(man << exp) if exp >= 0 else Fraction(man, 1 << -exp)
+        return -result if sign else result
+    if hasattr(value, "numerator") and hasattr(value, "denominator"):
+        return Fraction(value.numerator, value.denominator)
+    raise TypeError(f"Cannot use {type(value).__name__} as an exact angle")
+
+
+def dms_to_degrees(degree, minute=0, second=0):
+    """Returns degree + minute/60 + second/3600 as an exact Fraction."""
+    return exact_fraction(degree) + exact_fraction(minute) / 60 + exact_fraction(second) / 3600
+
+
+class DegreeAngle:
+    """An angle in degrees, minutes and seconds, held as an exact Fraction of degrees.
+
+    Attributes:
+    -----------
+    degrees : Fraction
+        The angle as given, in degrees.
+    normal : Fraction
+        The angle reduced to [0, 360) degrees.
+    """
+
+    __slots__ = ("degrees",)
+
+    def __init__(self, degree, minute=0, second=0):
+        self.degrees = dms_to_degrees(degree, minute, second)
+
+    @property
+    def normal(self):
+        """The angle reduced exactly to [0, 360) degrees."""
+        return self.degrees % 360
+
+    def __repr__(self):
+        return f"DegreeAngle({self.degrees})"
+
+
+def _degrees(angle, normalize=True):
+    """The Fraction of degrees of a DegreeAngle or of any exact degree value."""
+    if isinstance(angle, DegreeAngle):
+        return angle.normal if normalize else angle.degrees
+    degrees = exact_fraction(angle)
+    return degrees % 360 if normalize else degrees
+
+
+@isolated_precision
+def degrees_to_radians(angle, precision, normalize=True):
+    """Converts an exact angle in degrees to radians, rounding once.
+
+    Parameters:
+    -----------
+    angle : DegreeAngle or any value exact_fraction accepts
+        Angle in degrees.
+    precision : int
+        Significant digits of the result.
+    normalize : bool, optional
+        Reduce the angle to [0, 360) degrees first (default True).
+
+    Returns:
+    --------
+    mpf
+        The angle in radians.
+    """
+    degrees = _degrees(angle, normalize)
+    mp.dps = precision
+    with mp.workprec(mp.prec + GUARD_BITS):
+        value = mpf(degrees.numerator) * mp.pi / (180 * degrees.denominator)
+    return +value
+
+
+def _negate(text):
+    """The closed form of -value, for the text of value."""
+    if text == "0":
+        return text
+    return text[1:] if text.startswith("-") else "-" + text
+
+
+@isolated_precision
+def special_sincos(angle, precision):
+    """Closed-form sine and cosine of a special angle.
+
+    Returns (sin, cos, sin_text, cos_text), the values as mpf rounded to
+    precision digits and their closed forms such as "√3/2", or None if the
+    angle (reduced to [0, 360) degrees) is not a special angle.
+    """
+    quadrant, first = divmod(_degrees(angle), 90)
+    if first not in _SPECIAL_SINES:
+        return None
+    mp.dps = precision
+    sin_text, sine = _SPECIAL_SINES[first]
+    cos_text, cosine = _SPECIAL_SINES[90 - first]
+    with mp.workprec(mp.prec + GUARD_BITS):
+        s, c = sine(), cosine()
+    s, c = +s, +c
+    # sin(q·90° + a) and cos(q·90° + a) for q = 0, 1, 2, 3.
+    for _ in range(int(quadrant)):
+        s, c = c, -s
+        sin_text, cos_text = cos_text, _negate(sin_text)
+    return s, c, sin_text, cos_text
+
+
+def pole_multiple(angle, half):
+    """Decides exactly whether an angle in degrees is a pole.
+
+    With half=True (tan, sec: cos = 0) returns the odd k with angle = k·90°;
+    with half=False (csc, cot: sin = 0) the k with angle = k·180°. Returns
+    None when the angle is not such a multiple.
+    """
+    degrees = _degrees(angle, normalize=False)
+    if half:
+        k = degrees / 90
+        return int(k) if k.denominator == 1 and k.numerator % 2 else None
+    k = degrees / 180
+    return int(k) if k.denominator == 1 else None
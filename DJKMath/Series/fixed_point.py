@@ -0,0 +1,150 @@
+"""
+fixed_point.py
+Sine and cosine series on Python integers scaled by 2**wp (backend="fixed").
+
+Every step of the mpf Taylor loops allocates new mpf objects and
+normalizes their mantissa and exponent. Here, after the usual reduction to
+|r| <= π/4 (argument_reduction.py), r and every term are plain Python
+integers scaled by 2**wp:
+
+    R = ⌊r·2**wp⌋,  R2 = R·R >> wp
+    term(n+2) = -(term(n)·R2 >> wp) // ((n+1)·(n+2))
+
+so each term costs one big-integer multiplication, one shift and one
+division by a small integer, and the sum is converted to an mpf once at
+the end. mpmath's own elementary functions (mpmath.libmp) are written the
+same way. wp is the requested precision in bits plus GUARD_BITS, which
+absorb the truncation of at most one unit per term.
+
+An absolute scale would leave a small r with few significant bits (r below
+2**-wp would be 0), so the sine loop works at wp bits plus the leading zero
+bits of r: sin r keeps its digits relative to r however small r is. The
+cosine, close to 1 there, stays at wp bits.
+
+The loops stop and count terms exactly like the Taylor loops of the series
+engine (hypergeometric.py), with the threshold 10**-precision scaled to the
+loop's bits.
+
+Functions:
+    fixed_sine(x, precision): (value, terms)
+    fixed_cosine(x, precision): (value, terms)
+    fixed_sincos(x, precision): (sin, cos, sin_terms, cos_terms)
+
+Dependencies:
+    mpmath: For the reduction and the final mpf
+"""
+
+from .argument_reduction import reduce_argument, LOG2_10
+from .precision_context import mpf, mp, isolated_precision
+
+# Extra bits carried through the integer loops.
+GUARD_BITS = 20
+
+
+def _working_bits(precision):
+    """Fixed-point scale in bits for precision digits."""
+    return int(precision * LOG2_10) + GUARD_BITS
+
+
+def _to_fixed(x, wp):
+    """⌊x·2**wp⌋ for an mpf x (truncated towards zero)."""
+    sign, man, exp, _ = x._mpf_
+    shift = exp + wp
+    value = man << shift if shift >= 0 else man >> -shift
+    return -value if sign else value
+
+
+def _from_fixed(value, wp):
+    """value·2**-wp as an mpf, rounded to the current precision."""
+    return mpf((value, -wp))
+
+
+def _sine_fixed(r, bits, precision):
+    """Sine series of r scaled by 2**bits; returns (sum, total_terms) at that scale."""
+    r2 = (r * r) >> bits
+    threshold = (1 << bits) // 10**precision
+    total = term = r
+    n = 1
+    total_terms = 1
+    while abs(term) > threshold:
+        term = -((term * r2) >> bits) // ((n + 1) * (n + 2))
+        n += 2
+        total += term
+        total_terms += 1
+        if total_terms > 1000:  # Prevent infinite loops
+            raise RuntimeError("Series not converging")
+    return total, total_terms
+
+
+def _cosine_fixed(r, bits, wp, precision):
+    """Cosine series of r scaled by 2**bits; returns (sum, total_terms) scaled by 2**wp."""
+    r2 = (r * r) >> (2 * bits - wp)
+    threshold = (1 << wp) // 10**precision
+    total = term = 1 << wp
+    n = 0
+    total_terms = 1
+    while abs(term) > threshold:
+        term = -((term * r2) >> wp) // ((n + 1) * (n + 2))
+        n += 2
+        total += term
+        total_terms += 1
+        if total_terms > 1000:  # Prevent infinite loops
+            raise RuntimeError("Series not converging")
+    return total, total_terms
+
+
+def _reduced_fixed(x, precision):
+    """Reduce x and return (R, bits, quadrant, wp): R = ⌊r·2**bits⌋ with
+    bits = wp plus the leading zero bits of a small r."""
+    mp.dps = precision
+    r, quadrant = reduce_argument(x, precision)
+    wp = _working_bits(precision)
+    bits = wp + max(0, -mp.mag(r)) if r else wp
+    return _to_fixed(r, bits), bits, quadrant, wp
+
+
+def _quadrant_series(x, precision, shift):
+    """sin (shift=0) or cos (shift=1) of x via its quadrant."""
+    r, bits, quadrant, wp = _reduced_fixed(x, precision)
+    quadrant = (quadrant + shift) % 4
+    if quadrant % 2 == 0:
+        value, terms = _sine_fixed(r, bits, precision)
+        value = _from_fixed(value, bits)
+    else:
+        value, terms = _cosine_fixed(r, bits, wp, precision)
+        value = _from_fixed(value, wp)
+    if quadrant >= 2:
+        value = -value
+    return value, terms
+
+
+@isolated_precision
+def fixed_sine(x, precision):
+    """Computes sine with the fixed-point Taylor series. Returns (value, terms)."""
+    return _quadrant_series(x, precision, 0)
+
+
+@isolated_precision
+def fixed_cosine(x, precision):
+    """Computes cosine with the fixed-point Taylor series. Returns (value, terms)."""
+    return _quadrant_series(x, precision, 1)
+
+
+@isolated_precision
+def fixed_sincos(x, precision):
+    """Computes sine and cosine from one reduction and one fixed-point r**2.
+
+    Returns (sin, cos, sin_terms, cos_terms).
+    """
+    r, bits, quadrant, wp = _reduced_fixed(x, precision)
+    s, s_terms = _sine_fixed(r, bits, precision)
+    c, c_terms = _cosine_fixed(r, bits, wp, precision)
+    s, c = _from_fixed(s, bits), _from_fixed(c, wp)
+    # sin(q·π/2 + r) and cos(q·π/2 + r) for q = 0, 1, 2, 3.
+    if quadrant == 1:
+        s, c, s_terms, c_terms = c, -s, c_terms, s_terms
+    elif quadrant == 2:
+        s, c = -s, -c
+    elif quadrant == 3:
+        s, c, s_terms, c_terms = -c, s, c_terms, s_terms
+    return s, c, s_terms, c_terms
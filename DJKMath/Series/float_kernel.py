@@ -0,0 +1,246 @@
+"""
+float_kernel.py
+Native float64 sine and cosine series for precisions up to 15 digits.
+
+At 15 significant digits or fewer every intermediate fits in a double, so
+the mpf machinery (object creation, Python-level mantissa arithmetic) only
+costs time. These kernels run the same Taylor loops as trigo_sin_cos_tan.py
+on plain floats, with the same stopping rule and term counting, and never
+create an mpmath object:
+
+    1. Range reduction x = k·(π/2) + r, |r| <= π/4:
+       - |x| < 2**19·(π/2): three-part Cody-Waite split of π/2 (fdlibm
+         constants), exact because k·PIO2_1 and k·PIO2_2 are exact.
+       - larger |x|: Payne-Hanek with Python integers. x = m·2**e exactly,
+         and m·⌊2**N·2/π⌋ is formed exactly with N about e + 200 bits of
+         2/π, so the fraction left after removing k keeps full accuracy
+         even for the worst-case doubles near multiples of π/2.
+    2. The sine or cosine series of r, chosen by the quadrant k mod 4.
+
+The bits of 2/π are computed once at import with integer arithmetic; the
+integer reduction is shared with double_double.py, and the Cody-Waite step
+(cody_waite, which also works element-wise on NumPy arrays) and
+reduce_float with trigo_numpy.py, so the float reductions live here only.
+
+Functions:
+    pi_scaled(bits): ⌊2**bits·π⌋ in integers
+    cody_waite(x, nearest): (x - k·π/2, k) for |x| < CODY_WAITE_LIMIT
+    payne_hanek(man, exp, extra_bits): Exact integer reduction of man·2**exp
+    as_exact_float(x): x as a float if that conversion is exact, else None
+    reduce_float(x): (r, quadrant) for a finite float
+    float_sine(x, precision): (value, terms)
+    float_cosine(x, precision): (value, terms)
+    float_sincos(x, precision): (sin, cos, sin_terms, cos_terms)
+
+Dependencies:
+    None (standard library only)
+"""
+
+from math import frexp, isfinite
+
+# Largest precision a double can honour (53 bits ≈ 15.95 decimal digits).
+FLOAT_MAX_PRECISION = 15
+
+# π/2 in three parts (fdlibm): PIO2_1 and PIO2_2 have 33 significant bits,
+# so k·PIO2_1 and k·PIO2_2 are exact while |k| < 2**20.
+_PIO2_1 = 1.57079632673412561417e+00
+_PIO2_2 = 6.07710050630396597660e-11
+_PIO2_3 = 2.02226624871116645580e-21
+_TWO_OVER_PI = 6.36619772367581382433e-01
+_HALF_PI = 1.5707963267948966
+QUARTER_PI = 0.7853981633974483
+
+# Beyond this |x| the Cody-Waite split is no longer exact.
+CODY_WAITE_LIMIT = 2.0**19 * _HALF_PI
+
+# Bits of 2/π kept beyond the exponent of x in the Payne-Hanek reduction.
+_EXTRA_BITS = 200
+
+# Bits of 2/π tabulated: enough for exponents up to 1100 with 320 extra bits.
+_TABLE_BITS = 1100 + 320
+
+
+def _arctan_inverse(n, bits):
+    """⌊2**bits · arctan(1/n)⌋ (to within a few units) by the integer series."""
+    total = term = (1 << bits) // n
+    n2 = n * n
+    k = 1
+    while term:
+        term //= n2
+        k += 2
+        total += -(term // k) if k % 4 == 3 else term // k
+    return total
+
+
+def pi_scaled(bits):
+    """⌊2**bits · π⌋ (to within a few units) from Machin's formula
+    π/4 = 4·arctan(1/5) - arctan(1/239)."""
+    work = bits + 32
+    pi_work = 4 * (4 * _arctan_inverse(5, work) - _arctan_inverse(239, work))
+    return pi_work >> 32
+
+
+def _two_over_pi(bits):
+    """⌊2**bits · 2/π⌋."""
+    work = bits + 32
+    return (1 << (bits + work + 1)) // pi_scaled(work)
+
+
+_TWO_OVER_PI_BITS = _two_over_pi(_TABLE_BITS)
+
+
+def payne_hanek(man, exp, extra_bits):
+    """Reduce x = man·2**exp (man > 0) modulo π/2 with integer arithmetic.
+
+    Returns (k, numerator, shift) with x·2/π = k + numerator/2**shift and
+    |numerator/2**shift| <= 1/2, accurate to about 2**(man.bit_length() -
+    extra_bits). Requires exp + extra_bits <= 1420.
+    """
+    n = exp + extra_bits
+    # x·2/π ≈ man·T / 2**(n-exp) with T = ⌊2**n·2/π⌋, so scale by 2**-shift.
+    if n >= 0:
+        product = man * (_TWO_OVER_PI_BITS >> (_TABLE_BITS - n))
+    else:
+        product = (man * _TWO_OVER_PI_BITS) >> (_TABLE_BITS - n)
+    shift = extra_bits
+    k = (product + (1 << (shift - 1))) >> shift  # Nearest integer
+    return k, product - (k << shift), shift
+
+
+def _payne_hanek(x):
+    """Reduce a large finite float exactly with integer arithmetic."""
+    mantissa, exponent = frexp(abs(x))
+    m = int(mantissa * (1 << 53))
+    e = exponent - 53  # |x| = m · 2**e exactly
+    k, numerator, shift = payne_hanek(m, e, _EXTRA_BITS)
+    fraction = numerator / (1 << shift)  # Correctly rounded
+    r = fraction * _HALF_PI
+    if x < 0:
+        r, k = -r, -k
+    return r, k % 4
+
+
+def as_exact_float(x):
+    """Return x as a finite float if float(x) loses nothing, else None.
+
+    Accepts float, int and mpf (read from its raw tuple, so no mpmath
+    object is created).
+    """
+    if isinstance(x, float):
+        return x if isfinite(x) else None
+    if isinstance(x, int):
+        return float(x) if abs(x) <= 2**53 else None
+    if hasattr(x, "_mpf_"):
+        sign, man, exp, bc = x._mpf_
+        if not man:
+            return 0.0 if not exp else None  # Zero, or inf/nan
+        if bc <= 53 and exp >= -1074 and exp + bc <= 1024:
+            return float(x)
+    return None
+
+
+def cody_waite(x, nearest=round):
+    """Returns (r, k) with x = k·(π/2) + r for |x| < CODY_WAITE_LIMIT.
+
+    k = nearest(x·2/π); pass numpy.rint to reduce a whole array at once.
+    """
+    k = nearest(x * _TWO_OVER_PI)
+    return ((x - k * _PIO2_1) - k * _PIO2_2) - k * _PIO2_3, k
+
+
+def reduce_float(x):
+    """Reduce a finite float to x = k·(π/2) + r with |r| <= π/4.
+
+    Returns (r, quadrant) with quadrant = k mod 4.
+    """
+    if abs(x) <= QUARTER_PI:
+        return x, 0
+    if abs(x) < CODY_WAITE_LIMIT:
+        r, k = cody_waite(x)
+        return r, k % 4
+    return _payne_hanek(x)
+
+
+def _sine_series(r, threshold):
+    """Sine Taylor loop on a float, counting terms like _sine_series."""
+    r2 = r * r
+    result = 0.0
+    term = r
+    n = 1
+    total_terms = 1
+    while abs(term) > threshold:
+        result += term
+        n += 2
+        term *= -r2 / (n * (n - 1))
+        total_terms += 1
+    return result, total_terms
+
+
+def _cosine_series(r, threshold):
+    """Cosine Taylor loop on a float, counting terms like _cosine_series."""
+    r2 = r * r
+    result = 1.0
+    term = 1.0
+    n = 0
+    total_terms = 1
+    while abs(term) > threshold:
+        n += 2
+        term *= -r2 / (n * (n - 1))
+        result += term
+        total_terms += 1
+    return result, total_terms
+
+
+def _check(x, precision):
+    """Validate precision and x for the float kernels."""
+    if not 1 <= precision <= FLOAT_MAX_PRECISION:
+        raise ValueError(
+            f"Float precision must be between 1 and {FLOAT_MAX_PRECISION} digits."
+        )
+    if not isfinite(x):
+        raise ValueError("Cannot reduce a non-finite angle")
+
+
+def _quadrant_series(x, precision, shift):
+    """sin (shift=0) or cos (shift=1) of a float via its quadrant."""
+    _check(x, precision)
+    r, quadrant = reduce_float(x)
+    quadrant = (quadrant + shift) % 4
+    threshold = 10.0 ** (-precision)
+    if quadrant % 2 == 0:
+        value, terms = _sine_series(r, threshold)
+    else:
+        value, terms = _cosine_series(r, threshold)
+    if quadrant >= 2:
+        value = -value
+    return value, terms
+
+
+def float_sine(x, precision):
+    """Computes sine of a float with the float64 Taylor series. Returns (value, terms)."""
+    return _quadrant_series(x, precision, 0)
+
+
+def float_cosine(x, precision):
+    """Computes cosine of a float with the float64 Taylor series. Returns (value, terms)."""
+    return _quadrant_series(x, precision, 1)
+
+
+def float_sincos(x, precision):
+    """Computes sine and cosine of a float from one reduction.
+
+    Returns (sin, cos, sin_terms, cos_terms).
+    """
+    _check(x, precision)
+    r, quadrant = reduce_float(x)
+    threshold = 10.0 ** (-precision)
+    s, s_terms = _sine_series(r, threshold)
+    c, c_terms = _cosine_series(r, threshold)
+    # sin(q·π/2 + r) and cos(q·π/2 + r) for q = 0, 1, 2, 3.
+    if quadrant == 1:
+        s, c, s_terms, c_terms = c, -s, c_terms, s_terms
+    elif quadrant == 2:
+        s, c = -s, -c
+    elif quadrant == 3:
+        s, c, s_terms, c_terms = -c, s, c_terms, s_terms
+    return s, c, s_terms, c_terms
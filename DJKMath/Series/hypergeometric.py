@@ -0,0 +1,448 @@
+"""
+hypergeometric.py
+One series engine for sine, cosine, exp, sinh and cosh, driven by the ratio of consecutive coefficients.
+
+The loop term *= -(x**2) / (n * (n - 1)) of the sine and cosine series is
+one case of a hypergeometric series: with c(0) = 1 the coefficients follow
+c(k+1) = c(k)·ratio(k) for a rational function ratio(k):
+
+    sine    x·Σ c(k)·(x²)^k    ratio(k) = -1/((2k+2)(2k+3))
+    cosine    Σ c(k)·(x²)^k    ratio(k) = -1/((2k+1)(2k+2))
+    sinh    x·Σ c(k)·(x²)^k    ratio(k) = 1/((2k+2)(2k+3))
+    cosh      Σ c(k)·(x²)^k    ratio(k) = 1/((2k+1)(2k+2))
+    exp       Σ c(k)·x^k       ratio(k) = 1/(k+1)
+
+A series is registered once (register_series) by its ratio, whether it
+runs in x² or in x, and whether the sum is multiplied by x. Everything else
+is shared by all of them:
+
+    - coefficients: c(k) exactly, as products of the ratio, rounded once per
+      working precision and cached in coefficient_cache.py (sine and cosine
+      use the same tables as the rest of the package);
+    - the stopping rule: terms are summed until one is at or below the
+      threshold (default 10**-precision), that one included, and counted
+      like the Taylor loops of trigo_sin_cos_tan.py (1000 terms at most);
+    - evaluation strategies: "taylor" (term by term, two multiplications
+      per term) and "paterson_stockmeyer" (about 2·√N full-precision
+      multiplications for N terms, see paterson_stockmeyer.py), the latter
+      for every series whose ratios are 1/integer, as all five are.
+
+exp, sinh and cosh reduce their argument first: exp(x) = 2**n·exp(r) with
+|r| <= ln2/2, and sinh/cosh come from exp(x) for |x| >= 1 (from their own
+series below, where e**x - e**-x would cancel).
+
+Functions:
+    register_series(name, ratio, squared, odd): Add a series to the engine
+    unregister_series(name): Remove a series and its cached values
+    series_names(): The registered series
+    series_coefficients(name, count, prec): Cached rounded coefficients c(0), c(1), ...
+    term_count(name, x, precision): Estimated terms of the series at x
+    taylor_sum(name, x, precision, threshold): Term-by-term sum in the current context
+    paterson_stockmeyer_sums(names, x, precision): Baby-step/giant-step sums sharing the powers
+    hypergeometric_series(name, x, precision, threshold, strategy): (value, terms)
+    exp_power_series(x, precision, method): e**x
+    sinh_power_series(x, precision, method): Hyperbolic sine
+    cosh_power_series(x, precision, method): Hyperbolic cosine
+    sinhcosh_power_series(x, precision, method): Both from one series or one exp
+
+Dependencies:
+    fractions: For the exact coefficients (standard library)
+    mpmath: For high-precision arithmetic
+"""
+
+import threading
+from fractions import Fraction
+from math import isqrt, log
+
+from .precision_context import mp, mpf, isolated_precision
+from .coefficient_cache import exact_coefficients, clear_coefficient_table
+
+STRATEGIES = ("taylor", "paterson_stockmeyer")
+
+# Extra bits carried through the Paterson-Stockmeyer blocks.
+GUARD_BITS = 20
+
+# Extra digits for the exp reduction and the hyperbolic identities.
+GUARD_DIGITS = 5
+
+_LN10 = log(10)
+_LN2 = log(2)
+
+# name -> (ratio, squared, odd, unit): c(k+1)/c(k) as a Fraction-valued
+# function of k, whether the series runs in x² (else x), whether the sum is
+# multiplied by x, and whether every ratio is 1/integer (Paterson-Stockmeyer).
+_series = {}
+
+# name -> exact coefficients computed so far.
+_exact = {}
+_exact_lock = threading.Lock()
+
+# name -> [log|ratio(0)|, log|ratio(1)|, ...] for term_count, and, for
+# 1/integer ratios, [1/ratio(0), 1/ratio(1), ...] as ints for
+# Paterson-Stockmeyer; both extended on demand, so each Fraction is built once.
+_log_ratios = {}
+_inverse_ratios = {}
+
+
+def register_series(name, ratio, squared=True, odd=False):
+    """Adds the series Σ c(k)·z**k (times x if odd) with c(0) = 1 and
+    c(k+1) = c(k)·ratio(k), where z is x² (squared) or x.
+
+    ratio(k) must return a Fraction (or int). The name also keys the
+    coefficient tables in coefficient_cache.py, so re-registering a name
+    with a different ratio is refused.
+
+    Raises:
+    -------
+    ValueError
+        If name is already registered with another ratio.
+    """
+    if name in _series and _series[name][0] is not ratio:
+        raise ValueError(f"Series {name!r} is already registered.")
+    unit = all(Fraction(ratio(k)).numerator in (1, -1) for k in range(8))
+    _series[name] = (ratio, squared, odd, unit)
+
+
+def unregister_series(name):
+    """Removes the series name with its exact coefficients, ratio tables and
+    (in the calling thread) its rounded coefficient tables, so the name can
+    be registered again with another ratio.
+
+    Raises:
+    -------
+    ValueError
+        If name is not registered.
+    """
+    _spec(name)
+    with _exact_lock:
+        del _series[name]
+        for tables in (_exact, _log_ratios, _inverse_ratios):
+            tables.pop(name, None)
+    clear_coefficient_table(name)
+
+
+def series_names():
+    """Returns the names of the registered series."""
+    return list(_series)
+
+
+def _spec(name):
+    """The registration of name."""
+    try:
+        return _series[name]
+    except KeyError:
+        raise ValueError(f"Unknown series {name!r}; choose from {', '.join(_series)}") from None
+
+
+def _exact_coefficient(name, k):
+    """c(k) of the series name as an exact Fraction."""
+    ratio = _spec(name)[0]
+    with _exact_lock:
+        values = _exact.setdefault(name, [Fraction(1)])
+        while len(values) <= k:
+            values.append(values[-1] * ratio(len(values) - 1))
+        return values[k]
+
+
+def _ratio_table(tables, name, count, value):
+    """The cached list [value(ratio(0)), value(ratio(1)), ...] of name, with
+    at least count entries."""
+    table = tables.get(name)
+    if table is None or len(table) < count:
+        ratio = _spec(name)[0]
+        with _exact_lock:
+            table = tables.setdefault(name, [])
+            while len(table) < count:
+                table.append(value(Fraction(ratio(len(table)))))
+    return table
+
+
+def _log_ratio_table(name, count):
+    """log|ratio(k)| of name for k < count (at least), cached."""
+    return _ratio_table(_log_ratios, name, count, lambda r: log(abs(r)))
+
+
+def _inverse_ratio_table(name, count):
+    """1/ratio(k) of name as ints for k < count (at least), cached; the
+    ratios must be 1/integer."""
+    return _ratio_table(_inverse_ratios, name, count, lambda r: int(1 / r))
+
+
+def series_coefficients(name, count, prec=None):
+    """Returns the cached list [c(0), c(1), ...] of name with at least count
+    values, each rounded once to prec bits (default: the current mp.prec)."""
+    return exact_coefficients(name, count, lambda k: _exact_coefficient(name, k), prec)
+
+
+def term_count(name, x, precision):
+    """Estimates the terms the Taylor loop of name sums at x.
+
+    Counts the terms above 10**-precision plus the final negligible one,
+    the Taylor loops' convention, with floating-point logarithms.
+
+    Raises:
+    -------
+    RuntimeError
+        If more than 1000 terms would be needed.
+    """
+    _, squared, odd, _ = _spec(name)
+    if not x:
+        return 1 if odd else 2  # 0, or the leading 1 and a zero term
+    magnitude = float(abs(x))
+    # Fall back on the binary exponent below the float range.
+    log_x = log(magnitude) if magnitude > 0 else mp.mag(x) * _LN2
+    log_z = 2 * log_x if squared else log_x
+    limit = -precision * _LN10
+    log_term = log_x if odd else 0.0
+    log_ratios = _log_ratio_table(name, 16)
+    count = 0
+    while True:
+        if count == len(log_ratios):
+            log_ratios = _log_ratio_table(name, 2 * count)
+        step = log_ratios[count] + log_z
+        # Stop once below the limit and shrinking.
+        if log_term <= limit and step < 0:
+            break
+        log_term += step
+        count += 1
+        if count > 1000:  # Prevent infinite loops
+            raise RuntimeError("Series not converging")
+    return count + 1
+
+
+def taylor_sum(name, x, precision, threshold=None):
+    """Sums the series of name at x term by term in the current context.
+
+    Stops at the first term at or below threshold (default
+    10**-precision), that term included. Returns (value, terms).
+    """
+    _, squared, odd, _ = _spec(name)
+    mp.dps = precision
+    if threshold is None:
+        threshold = mpf(10) ** (-precision)
+    coefficients = series_coefficients(name, 16)
+    z = x * x if squared else mpf(x)
+    power = mpf(x) if odd else mpf(1)
+    result = term = coefficients[0] * power
+    k = 0
+    total_terms = 1
+
+    while abs(term) > threshold:
+        k += 1
+        if k == len(coefficients):
+            coefficients = series_coefficients(name, 2 * k)
+        power *= z
+        term = coefficients[k] * power
+        result += term
+        total_terms += 1
+        if total_terms > 1000:  # Prevent infinite loops
+            raise RuntimeError("Series not converging")
+    return result, total_terms
+
+
+def _baby_steps(z, m):
+    """Returns [1, z, z**2, ..., z**m]."""
+    powers = [mpf(1), z]
+    for _ in range(m - 1):
+        powers.append(powers[-1] * z)
+    return powers
+
+
+def _block_size(count):
+    """Baby-step count m = ceil(√count)."""
+    return isqrt(max(count - 1, 0)) + 1
+
+
+def _ps_polynomial(inverses, powers, m, count):
+    """Evaluates Σ_{k<count} c(k)·z**k from the baby steps [1, z, ..., z**m].
+
+    inverses[k] = 1/ratio(k) are integers, so inside a block b(k) = c(k)/c(hi)
+    (hi is the block's last index) are integers built from the top of the
+    block down and the block sums need no full-precision multiplications.
+    Each block ends with b = c(lo)/c(hi), which gives the giant-step factor
+    c(upper)/c(hi) = 1/(inverses[hi]·b) for the block below it; after the
+    bottom block (lo = 0) b is 1/c(hi) itself.
+    """
+    giant = powers[m]
+    blocks = (count + m - 1) // m
+    acc = mpf(0)
+    carry = None  # c(lo)/c(hi) of the block above, an integer
+    for j in reversed(range(blocks)):
+        lo = j * m
+        hi = min(lo + m, count) - 1
+        block_sum = mpf(0)
+        b = 1
+        for k in range(hi, lo - 1, -1):
+            block_sum += powers[k - lo] * b
+            if k > lo:
+                b *= inverses[k - 1]
+        if carry is not None:
+            # acc is in units of c(upper); bring it to units of c(hi).
+            block_sum += acc * giant / (inverses[hi] * carry)
+        acc = block_sum
+        carry = b
+    return acc / carry
+
+
+def paterson_stockmeyer_sums(names, x, precision):
+    """Sums the series names at x with Paterson-Stockmeyer, sharing the baby steps.
+
+    All names must run in the same variable (x² or x). Returns a list of
+    (value, terms).
+    """
+    specs = [_spec(name) for name in names]
+    for name, (_, _, _, unit) in zip(names, specs):
+        if not unit:
+            raise ValueError(f"Paterson-Stockmeyer needs 1/integer ratios; {name!r} has others.")
+    mp.dps = precision
+    counts = [term_count(name, x, precision) for name in names]
+    results = []
+    with mp.workprec(mp.prec + GUARD_BITS):
+        m = _block_size(max(counts))
+        z = x * x if specs[0][1] else mpf(x)
+        powers = _baby_steps(z, m)
+        for name, (_, _, odd, _), count in zip(names, specs, counts):
+            if odd and not x:
+                results.append((mpf(0), count))
+                continue
+            inverses = _inverse_ratio_table(name, count)
+            value = _ps_polynomial(inverses, powers, m, count)
+            results.append((x * value if odd else value, count))
+    return [(+value, count) for value, count in results]
+
+
+def _check_strategy(strategy):
+    """Validates the strategy name."""
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}; choose from {', '.join(STRATEGIES)}")
+
+
+def _sum(name, x, precision, threshold=None, strategy="taylor"):
+    """The series of name at x with the given strategy, in the current context."""
+    if strategy == "paterson_stockmeyer":
+        return paterson_stockmeyer_sums([name], x, precision)[0]
+    return taylor_sum(name, x, precision, threshold)
+
+
+@isolated_precision
+def hypergeometric_series(name, x, precision, threshold=None, strategy="taylor"):
+    """Sums a registered series at x, without argument reduction.
+
+    Parameters:
+    -----------
+    name : str
+        A registered series ("sine", "cosine", "sinh", "cosh", "exp", ...).
+    x : mpf, float, int or str
+        The argument, used as given.
+    precision : int
+        Significant digits of the working precision.
+    threshold : mpf, optional
+        Stop at the first term at or below this (default 10**-precision;
+        taylor only, paterson_stockmeyer derives its term count from
+        precision).
+    strategy : str, optional
+        "taylor" (default) or "paterson_stockmeyer".
+
+    Returns:
+    --------
+    (mpf, int)
+        The sum and the number of terms.
+    """
+    _check_strategy(strategy)
+    mp.dps = precision
+    return _sum(name, mpf(x), precision, threshold, strategy)
+
+
+def _exp(x, precision, method):
+    """e**x in the current context at precision digits: (value, terms)."""
+    if not mp.isfinite(x):
+        raise ValueError("Cannot take exp of a non-finite value")
+    work = mp.prec + GUARD_BITS
+    # x - n·ln2 needs ln2 to the bits of n on top of the precision.
+    with mp.workprec(work + max(mp.mag(x), 0)):
+        n = int(mp.nint(x / mp.ln2))
+        r = x - n * mp.ln2
+    value, terms = _sum("exp", r, precision + GUARD_DIGITS, strategy=method)
+    return mp.ldexp(value, n), terms
+
+
+@isolated_precision
+def exp_power_series(x, precision, method="taylor"):
+    """Computes e**x from the exp series of x - n·ln2.
+
+    method is "taylor" or "paterson_stockmeyer". Returns (value, terms).
+    """
+    _check_strategy(method)
+    mp.dps = precision + GUARD_DIGITS
+    value, terms = _exp(mpf(x), precision, method)
+    mp.dps = precision
+    return +value, terms
+
+
+def _hyperbolic(x, precision, method, odd):
+    """sinh (odd) or cosh of x: (value, terms)."""
+    _check_strategy(method)
+    mp.dps = precision + GUARD_DIGITS
+    x = mpf(x)
+    if abs(x) < 1:
+        # sinh(x) >= |x|: stop relative to x so small x keeps its digits.
+        threshold = mpf(10) ** (-precision - GUARD_DIGITS) * abs(x) if odd else None
+        name = "sinh" if odd else "cosh"
+        value, terms = _sum(name, x, precision + GUARD_DIGITS, threshold, method)
+        mp.dps = precision + GUARD_DIGITS
+    else:
+        e, terms = _exp(x, precision, method)
+        mp.dps = precision + GUARD_DIGITS
+        value = (e - 1 / e) / 2 if odd else (e + 1 / e) / 2
+    mp.dps = precision
+    return +value, terms
+
+
+@isolated_precision
+def sinh_power_series(x, precision, method="taylor"):
+    """Computes sinh(x): its own series for |x| < 1, else (e**x - e**-x)/2.
+
+    Returns (value, terms).
+    """
+    return _hyperbolic(x, precision, method, True)
+
+
+@isolated_precision
+def cosh_power_series(x, precision, method="taylor"):
+    """Computes cosh(x): its own series for |x| < 1, else (e**x + e**-x)/2.
+
+    Returns (value, terms).
+    """
+    return _hyperbolic(x, precision, method, False)
+
+
+@isolated_precision
+def sinhcosh_power_series(x, precision, method="taylor"):
+    """Computes sinh(x) and cosh(x) together.
+
+    For |x| < 1 sinh comes from its series and cosh = √(1 + sinh²) (no
+    cancellation, cosh >= 1); otherwise both come from one e**x.
+    Returns (sinh, cosh, terms).
+    """
+    _check_strategy(method)
+    mp.dps = precision + GUARD_DIGITS
+    x = mpf(x)
+    if abs(x) < 1:
+        threshold = mpf(10) ** (-precision - GUARD_DIGITS) * abs(x)
+        s, terms = _sum("sinh", x, precision + GUARD_DIGITS, threshold, method)
+        mp.dps = precision + GUARD_DIGITS
+        c = mp.sqrt(1 + s * s)
+    else:
+        e, terms = _exp(x, precision, method)
+        mp.dps = precision + GUARD_DIGITS
+        inverse = 1 / e
+        s, c = (e - inverse) / 2, (e + inverse) / 2
+    mp.dps = precision
+    return +s, +c, terms
+
+
+register_series("sine", lambda k: Fraction(-1, (2 * k + 2) * (2 * k + 3)), odd=True)
+register_series("cosine", lambda k: Fraction(-1, (2 * k + 1) * (2 * k + 2)))
+register_series("sinh", lambda k: Fraction(1, (2 * k + 2) * (2 * k + 3)), odd=True)
+register_series("cosh", lambda k: Fraction(1, (2 * k + 1) * (2 * k + 2)))
+register_series("exp", lambda k: Fraction(1, k + 1), squared=False)
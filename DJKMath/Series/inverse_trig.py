@@ -0,0 +1,180 @@
+"""
+inverse_trig.py
+Arcsine, arccosine and arctangent by Newton iteration on the sine/cosine series.
+
+y = arctan(x) is the root of tan(y) = x. Newton's step for it, written with
+sine and cosine of the current y,
+
+    y <- y + cos(y)·(x·cos(y) - sin(y)),
+
+doubles the number of correct digits, so each step only needs the
+precision the next one will have: the seed (math.atan, about 15 digits)
+is refined at about 30, 60, 120, ... digits and only the last step runs
+at the full precision. Since the cost of sincos_power_series grows faster
+than linearly with the precision, all steps together cost little more
+than one forward evaluation at the full precision.
+
+The arguments are reduced first, so y stays in [-π/4, π/4], where the
+sine and cosine series converge fastest and no reduction by π/2 is needed:
+
+    arctan(x) = ±π/2 - arctan(1/x)               for |x| > 1
+    arcsin(x) = arctan(x / √(1 - x²))            (±π/2 at x = ±1)
+    arccos(x) = 2·arctan(√((1 - x) / (1 + x)))   (π at x = -1)
+
+Near ±1 the differences 1 - x and 1 + x are exact (they are taken before
+the square roots, not as 1 - x²), so neither identity loses digits there.
+
+Each function returns (value, terms), where terms counts the series terms
+summed over all Newton steps, like the forward functions of
+trigo_sin_cos_tan.py.
+
+Functions:
+    arctangent(x, precision, method): arctan(x) in (-π/2, π/2)
+    arcsine(x, precision, method): arcsin(x) in [-π/2, π/2]
+    arccosine(x, precision, method): arccos(x) in [0, π]
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+"""
+
+import math
+
+from .precision_context import mp, mpf, isolated_precision
+from .argument_reduction import LOG2_10
+from .trigo_sin_cos_tan import sincos_power_series
+
+# Extra digits carried through the reduction and the iteration.
+GUARD_DIGITS = 5
+
+# Correct digits of the float seed.
+SEED_DIGITS = 15
+
+
+def _schedule(precision):
+    """Precisions of the Newton steps, each about twice the one before."""
+    steps = []
+    digits = precision
+    while digits > SEED_DIGITS:
+        steps.append(digits)
+        digits = (digits + 1) // 2 + 1
+    return steps[::-1] or [precision]
+
+
+def _check(x, precision):
+    """Validate the precision and read x (mpf exactly, others at the working precision)."""
+    if precision < 1:
+        raise ValueError("Precision must be at least 1 digit.")
+    mp.dps = precision + GUARD_DIGITS
+    # Near ±1 arcsin and arccos magnify any rounding of x, so keep its bits.
+    x = mp.make_mpf(x._mpf_) if hasattr(x, "_mpf_") else mpf(x)
+    if mp.isnan(x):
+        raise ValueError("Cannot invert a nan argument")
+    return x
+
+
+def _newton_arctan(x, precision, method):
+    """arctan(x) for |x| <= 1 by Newton steps at doubling precisions.
+
+    Returns (value, terms) at precision + GUARD_DIGITS digits.
+    """
+    if not x:
+        return mpf(0), 0
+    # The seed is x itself where arctan(x) = x to double precision.
+    y = mpf(x) if abs(x) < 1e-8 else mpf(math.atan(float(x)))
+    # The series stop at an absolute 10**-digits; small y needs its
+    # magnitude in extra digits to get sin(y) to digits significant digits.
+    extra = max(0, int(-mp.mag(x) / LOG2_10))
+    terms = 0
+    for digits in _schedule(precision + GUARD_DIGITS):
+        s, c, s_terms, c_terms = sincos_power_series(y, digits + extra, method, backend="mpmath")
+        terms += s_terms + c_terms
+        mp.dps = digits
+        y += c * (x * c - s)
+    mp.dps = precision + GUARD_DIGITS
+    return y, terms
+
+
+def _arctan(x, precision, method):
+    """arctan(x) for any x, at precision + GUARD_DIGITS digits."""
+    if abs(x) <= 1:
+        return _newton_arctan(x, precision, method)
+    half_pi = mp.pi / 2
+    if mp.isinf(x):
+        return (half_pi if x > 0 else -half_pi), 0
+    value, terms = _newton_arctan(1 / x, precision, method)
+    return (half_pi if x > 0 else -half_pi) - value, terms
+
+
+@isolated_precision
+def arctangent(x, precision, method="taylor"):
+    """Computes arctan(x) by Newton iteration on the sine/cosine series.
+
+    Parameters:
+    -----------
+    x : mpf, float, int or str
+        The tangent; ±inf gives ±π/2.
+    precision : int
+        Significant digits of the result.
+    method : str, optional
+        Series method for the sine and cosine evaluations (see
+        sine_power_series; default "taylor").
+
+    Returns:
+    --------
+    (mpf, int)
+        The angle in radians, in (-π/2, π/2), and the series terms summed.
+
+    Raises:
+    -------
+    ValueError
+        If x is nan or precision is not positive.
+    """
+    x = _check(x, precision)
+    value, terms = _arctan(x, precision, method)
+    mp.dps = precision
+    return +value, terms
+
+
+@isolated_precision
+def arcsine(x, precision, method="taylor"):
+    """Computes arcsin(x) as arctan(x / √(1 - x²)).
+
+    Parameters and results are as for arctangent; the angle is in
+    [-π/2, π/2].
+
+    Raises:
+    -------
+    ValueError
+        If |x| > 1, x is nan or precision is not positive.
+    """
+    x = _check(x, precision)
+    if abs(x) > 1:
+        raise ValueError("arcsine is defined for -1 <= x <= 1 only.")
+    if abs(x) == 1:
+        mp.dps = precision
+        return (mp.pi / 2 if x > 0 else -mp.pi / 2), 0
+    value, terms = _arctan(x / mp.sqrt((1 - x) * (1 + x)), precision, method)
+    mp.dps = precision
+    return +value, terms
+
+
+@isolated_precision
+def arccosine(x, precision, method="taylor"):
+    """Computes arccos(x) as 2·arctan(√((1 - x) / (1 + x))).
+
+    Parameters and results are as for arctangent; the angle is in [0, π].
+
+    Raises:
+    -------
+    ValueError
+        If |x| > 1, x is nan or precision is not positive.
+    """
+    x = _check(x, precision)
+    if abs(x) > 1:
+        raise ValueError("arccosine is defined for -1 <= x <= 1 only.")
+    if x == -1:
+        mp.dps = precision
+        return +mp.pi, 0
+    value, terms = _arctan(mp.sqrt((1 - x) / (1 + x)), precision, method)
+    mp.dps = precision
+    return 2 * value, terms
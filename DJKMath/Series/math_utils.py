@@ -1,39 +1,31 @@
 """The module contains functions to compute sine, cosine, and tangent using power series."""
 
 
+import os
+import sys
+
 from mpmath import mp, mpf, radians, degrees, fmod, sin, cos, tan
 from keyboard_input import get_single_key
 from keyboard_utils import clear_screen, wait_for_key
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from DJKMath.Series.autotune import tuned_sine, tuned_cosine
+
 
 def sine_power_series(x, precision):
-    """Computes sine using Taylor series expansion around 0."""
+    """Computes sine using Taylor series expansion around 0.
+
+    The series strategy is chosen by autotune.py."""
     mp.dps = precision
-    result = mpf(0)
-    term = x
-    n = 1
-    total_terms = 1
-    while abs(term) > mpf(10) ** (-precision):
-        result += term
-        n += 2
-        term *= -(x**2) / (n * (n - 1))
-        total_terms += 1
-    return result, total_terms
+    return tuned_sine(x, precision)
 
 
 def cosine_power_series(x, precision):
-    """Computes cosine using Taylor series expansion around 0."""
+    """Computes cosine using Taylor series expansion around 0.
+
+    The series strategy is chosen by autotune.py."""
     mp.dps = precision
-    result = mpf(1)
-    term = mpf(1)
-    n = 0
-    total_terms = 1
-    while abs(term) > mpf(10) ** (-precision):
-        n += 2
-        term *= -(x**2) / (n * (n - 1))
-        result += term
-        total_terms += 1
-    return result, total_terms
+    return tuned_cosine(x, precision)
 
 
 def tangent_power_series(x, precision):
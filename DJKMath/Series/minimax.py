@@ -0,0 +1,393 @@
+"""
+minimax.py
+Minimax polynomials for sine and cosine on [-π/4, π/4] from the Remez algorithm.
+
+The Taylor polynomial is exact at 0 and worst at the ends of the reduced
+range; the minimax polynomial of the same degree spreads its error evenly
+over the range and so reaches a given accuracy with fewer terms. With
+y = r**2,
+
+    sin(r) ≈ r·P(y)      P minimises max |sin(√y)/√y - P(y)|  (relative error of sin)
+    cos(r) ≈ Q(y)        Q minimises max |cos(√y) - Q(y)|
+
+for 0 <= y <= R**2, R = 0.7854 (just above π/4, for rounding in the reduction).
+
+remez() runs the Remez exchange: solve for the polynomial that alternates
+in error on n + 2 reference points, move the references to the extrema of
+the new error curve (found on a Chebyshev grid and refined by golden-section
+search), and repeat until the extrema are level. minimax_table() picks the
+lowest degree whose error is below 10**-(precision+1).
+
+Tables are written by generate_tables() to a versioned JSON file (by
+default minimax_tables.json next to this module) and read lazily, once per
+process, the first time method="minimax" needs them. A precision is served
+by the table of the smallest tabulated precision at or above it, provided
+that table has no more coefficients than the Taylor loop sums at the end of
+the reduced range for that precision. Otherwise (below the smallest table,
+where its extra terms would cost more than Taylor, and above the largest)
+the kernels fall back to the Paterson-Stockmeyer evaluation of the Taylor
+series (same values and term counts as the Taylor loops). Only precisions
+near the shipped ones, 16 to 200 digits, benefit. To (re)generate:
+
+    python -m DJKMath.Series.minimax 16 20 30 50 100 200
+
+Functions:
+    remez(func, degree, prec): Minimax coefficients of P or Q and the levelled error
+    minimax_table(func, precision): Coefficients of the lowest adequate degree
+    generate_tables(precisions, path): Compute and store tables
+    load_tables(path): Read a table file (checks its version)
+    minimax_coefficients(func, precision): Cached mpf coefficients, or None when
+        no table is at least as cheap as Taylor
+    mm_sine(x, precision), mm_cosine(x, precision), mm_sincos(x, precision):
+        Kernels on a reduced argument, in the style of the Taylor kernels
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+    json: For the table file
+"""
+
+import json
+import os
+import sys
+import threading
+
+from .precision_context import mp, mpf, isolated_precision
+from .hypergeometric import term_count
+from .paterson_stockmeyer import ps_sine, ps_cosine, ps_sincos
+
+# Format version of the table file; bump when the layout or interval changes.
+TABLE_VERSION = 1
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "minimax_tables.json")
+
+# Upper end of the approximation interval in r (π/4 = 0.785398...).
+INTERVAL = "0.7854"
+
+# Digits kept in the stored coefficients beyond the table precision.
+STORED_GUARD_DIGITS = 10
+
+# Evaluation guard digits for Horner's rule.
+GUARD_DIGITS = 3
+
+# Remez stops once the extrema agree to this relative spread.
+LEVEL_TOLERANCE = 1e-6
+
+MAX_ITERATIONS = 60
+
+FUNCTIONS = ("sin", "cos")
+
+# The hypergeometric series of each function, for the Taylor term counts.
+SERIES_NAMES = {"sin": "sine", "cos": "cosine"}
+
+# Precisions tabulated when the tool is run without arguments.
+DEFAULT_PRECISIONS = (16, 20, 30, 50, 100, 200)
+
+# Parsed file (loaded once per process) and per-thread mpf coefficients.
+_file_tables = None
+_file_lock = threading.Lock()
+_local = threading.local()
+
+
+def _target(func, y):
+    """sin(√y)/√y or cos(√y) at the current precision."""
+    if func == "sin":
+        if y == 0:
+            return mpf(1)
+        r = mp.sqrt(y)
+        return mp.sin(r) / r
+    return mp.cos(mp.sqrt(y))
+
+
+def _horner(coefficients, y):
+    """Σ c_k·y**k."""
+    total = mpf(0)
+    for c in reversed(coefficients):
+        total = total * y + c
+    return total
+
+
+def _solve_reference(func, points, degree):
+    """Coefficients and levelled error E with P(y_i) + (-1)**i·E = f(y_i)."""
+    size = degree + 2
+    matrix = mp.matrix(size, size)
+    rhs = mp.matrix(size, 1)
+    for i, y in enumerate(points):
+        power = mpf(1)
+        for j in range(degree + 1):
+            matrix[i, j] = power
+            power *= y
+        matrix[i, degree + 1] = -1 if i % 2 else 1
+        rhs[i] = _target(func, y)
+    solution = mp.lu_solve(matrix, rhs)
+    return [solution[j] for j in range(degree + 1)], solution[degree + 1]
+
+
+def _refine(error, low, high):
+    """Golden-section search for the extremum of |error| in [low, high]."""
+    ratio = (mp.sqrt(5) - 1) / 2
+    a, b = low, high
+    for _ in range(40):
+        c = b - ratio * (b - a)
+        d = a + ratio * (b - a)
+        if abs(error(c)) > abs(error(d)):
+            b = d
+        else:
+            a = c
+    return (a + b) / 2
+
+
+def _alternating_extrema(error, grid, values, size):
+    """size alternating extrema of the error curve sampled on grid."""
+    last = len(grid) - 1
+    extrema = []
+    for i, value in enumerate(values):
+        left = values[i - 1] if i else None
+        right = values[i + 1] if i < last else None
+        if (left is None or abs(value) >= abs(left)) and (right is None or abs(value) >= abs(right)):
+            y = grid[i]
+            if 0 < i < last:
+                y = _refine(error, grid[i - 1], grid[i + 1])
+            extrema.append((y, error(y)))
+    # Keep the larger of neighbours with the same sign.
+    merged = []
+    for y, e in extrema:
+        if merged and (merged[-1][1] > 0) == (e > 0):
+            if abs(e) > abs(merged[-1][1]):
+                merged[-1] = (y, e)
+        else:
+            merged.append((y, e))
+    while len(merged) > size:
+        merged.pop(0 if abs(merged[0][1]) < abs(merged[-1][1]) else -1)
+    return merged
+
+
+def remez(func, degree, prec=None):
+    """Runs the Remez exchange for P (func "sin") or Q (func "cos").
+
+    Parameters:
+    -----------
+    func : str
+        "sin" or "cos".
+    degree : int
+        Degree of the polynomial in y = r**2.
+    prec : int, optional
+        Working precision in bits (default: the current mp.prec).
+
+    Returns:
+    --------
+    (list of mpf, mpf)
+        The coefficients of y**0 ... y**degree and the maximum error.
+
+    Raises:
+    -------
+    RuntimeError
+        If the exchange finds too few alternating extrema or does not level.
+    """
+    if func not in FUNCTIONS:
+        raise ValueError(f"Unknown function {func!r}; choose from {', '.join(FUNCTIONS)}")
+    with mp.workprec(prec or mp.prec):
+        upper = mpf(INTERVAL) ** 2
+        size = degree + 2
+        # Chebyshev extrema as the first reference and as the search grid.
+        points = [upper * (1 - mp.cospi(mpf(i) / (size - 1))) / 2 for i in range(size)]
+        samples = 24 * size
+        grid = [upper * (1 - mp.cospi(mpf(i) / samples)) / 2 for i in range(samples + 1)]
+        targets = [_target(func, y) for y in grid]
+        for _ in range(MAX_ITERATIONS):
+            coefficients, _ = _solve_reference(func, points, degree)
+
+            def error(y):
+                return _target(func, y) - _horner(coefficients, y)
+
+            values = [t - _horner(coefficients, y) for y, t in zip(grid, targets)]
+            extrema = _alternating_extrema(error, grid, values, size)
+            if len(extrema) < size:
+                raise RuntimeError("Remez exchange lost alternation")
+            points = [y for y, _ in extrema]
+            largest = max(abs(e) for _, e in extrema)
+            smallest = min(abs(e) for _, e in extrema)
+            if largest - smallest <= LEVEL_TOLERANCE * largest:
+                return coefficients, largest
+        raise RuntimeError("Remez exchange did not converge")
+
+
+def _degree_estimate(func, precision):
+    """Degree where the Chebyshev-scaled Taylor coefficient drops below the target.
+
+    The minimax error of degree n is close to 2·|c_(n+1)|·(R²/4)**(n+1), with
+    c_k = 1/(2k+1)! or 1/(2k)!.
+    """
+    target = mpf(10) ** (-precision - 1)
+    quarter = mpf(INTERVAL) ** 2 / 4
+    n = 0
+    while 2 * quarter ** (n + 1) / mp.factorial(2 * n + 2 + (func == "sin")) > target:
+        n += 1
+    return n
+
+
+@isolated_precision
+def minimax_table(func, precision):
+    """Computes the lowest-degree minimax polynomial accurate to 10**-(precision+1).
+
+    Returns a dict with "degree", "error" and "coefficients" (decimal
+    strings with STORED_GUARD_DIGITS extra digits), as stored in the file.
+    """
+    mp.dps = precision + 10
+    target = mpf(10) ** (-precision - 1)
+    degree = _degree_estimate(func, precision)
+    # Ill-conditioning of the monomial basis grows with the degree.
+    prec = mp.prec + 4 * degree + 32
+    coefficients, error = remez(func, degree, prec)
+    while error > target:
+        degree += 1
+        coefficients, error = remez(func, degree, prec + 4)
+    while degree > 0:
+        lower, lower_error = remez(func, degree - 1, prec)
+        if lower_error > target:
+            break
+        degree, coefficients, error = degree - 1, lower, lower_error
+    digits = precision + STORED_GUARD_DIGITS
+    return {
+        "degree": degree,
+        "error": mp.nstr(error, 5),
+        "coefficients": [mp.nstr(c, digits, strip_zeros=False) for c in coefficients],
+    }
+
+
+def load_tables(path=TABLE_PATH):
+    """Reads a table file, returning {"sin": {precision: entry}, "cos": {...}}.
+
+    Raises:
+    -------
+    ValueError
+        If the file was written for another TABLE_VERSION or interval.
+    """
+    with open(path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    if data.get("version") != TABLE_VERSION or data.get("interval") != INTERVAL:
+        raise ValueError(
+            f"{path} is table version {data.get('version')}, expected {TABLE_VERSION}; "
+            "regenerate it with python -m DJKMath.Series.minimax"
+        )
+    return {
+        func: {int(p): entry for p, entry in data["tables"].get(func, {}).items()}
+        for func in FUNCTIONS
+    }
+
+
+def generate_tables(precisions, path=TABLE_PATH):
+    """Computes sine and cosine tables for each precision and stores them.
+
+    Entries already in the file for other precisions are kept.
+    """
+    try:
+        tables = load_tables(path)
+    except (OSError, ValueError):
+        tables = {func: {} for func in FUNCTIONS}
+    for precision in precisions:
+        for func in FUNCTIONS:
+            tables[func][precision] = minimax_table(func, precision)
+    data = {
+        "version": TABLE_VERSION,
+        "interval": INTERVAL,
+        "tables": {
+            func: {str(p): tables[func][p] for p in sorted(tables[func])}
+            for func in FUNCTIONS
+        },
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=1)
+        handle.write("\n")
+    _reset()
+    return data
+
+
+def _reset():
+    """Forget the loaded file and the parsed coefficients."""
+    global _file_tables
+    with _file_lock:
+        _file_tables = None
+    _local.__dict__.clear()
+
+
+def _tables_from_file():
+    """The default table file, read on first use ({} entries if it is missing)."""
+    global _file_tables
+    with _file_lock:
+        if _file_tables is None:
+            try:
+                _file_tables = load_tables()
+            except OSError:
+                _file_tables = {func: {} for func in FUNCTIONS}
+        return _file_tables
+
+
+def minimax_coefficients(func, precision):
+    """Returns the mpf coefficients serving precision digits, or None.
+
+    Uses the table of the smallest tabulated precision >= precision, unless
+    it has more coefficients than the Taylor series needs at the end of the
+    reduced range (e.g. the 16-digit table for 5 digits). The parsed values
+    are cached per thread and per working precision.
+    """
+    tables = _tables_from_file()[func]
+    candidates = [p for p in tables if p >= precision]
+    if not candidates:
+        return None
+    served = min(candidates)
+    taylor_terms = term_count(SERIES_NAMES[func], mpf(INTERVAL), precision)
+    if len(tables[served]["coefficients"]) > taylor_terms:
+        return None
+    key = (func, served, mp.prec)
+    cache = _local.__dict__.setdefault("coefficients", {})
+    coefficients = cache.get(key)
+    if coefficients is None:
+        coefficients = cache[key] = [mpf(c) for c in tables[key[1]]["coefficients"]]
+    return coefficients
+
+
+@isolated_precision
+def mm_sine(x, precision, threshold=None):
+    """Sine of a reduced x from the minimax table. Returns (value, terms).
+
+    terms is the number of polynomial coefficients; threshold is accepted
+    for the kernel signature and not used.
+    """
+    mp.dps = precision + GUARD_DIGITS
+    coefficients = minimax_coefficients("sin", precision)
+    if coefficients is None:
+        return ps_sine(x, precision, threshold)
+    value = x * _horner(coefficients, x * x)
+    mp.dps = precision
+    return +value, len(coefficients)
+
+
+@isolated_precision
+def mm_cosine(x, precision, threshold=None):
+    """Cosine of a reduced x from the minimax table. Returns (value, terms)."""
+    mp.dps = precision + GUARD_DIGITS
+    coefficients = minimax_coefficients("cos", precision)
+    if coefficients is None:
+        return ps_cosine(x, precision, threshold)
+    value = _horner(coefficients, x * x)
+    mp.dps = precision
+    return +value, len(coefficients)
+
+
+@isolated_precision
+def mm_sincos(x, precision):
+    """Sine and cosine of a reduced x sharing x**2. Returns (sin, cos, sin_terms, cos_terms)."""
+    mp.dps = precision + GUARD_DIGITS
+    sin_coefficients = minimax_coefficients("sin", precision)
+    cos_coefficients = minimax_coefficients("cos", precision)
+    if sin_coefficients is None or cos_coefficients is None:
+        return ps_sincos(x, precision)
+    y = x * x
+    s = x * _horner(sin_coefficients, y)
+    c = _horner(cos_coefficients, y)
+    mp.dps = precision
+    return +s, +c, len(sin_coefficients), len(cos_coefficients)
+
+
+if __name__ == "__main__":
+    generate_tables([int(arg) for arg in sys.argv[1:]] or DEFAULT_PRECISIONS)
@@ -0,0 +1,180 @@
+"""
+multiple_angle.py
+Argument scaling with triple-angle reconstruction for the sine and cosine series.
+
+The Taylor series needs fewer terms the smaller its argument. After the
+usual reduction to |r| <= π/4 the angle is divided by 3**k, the short
+series is summed at t = r / 3**k, and the result is rebuilt k times with
+the triple-angle identities
+
+    sin(3t) = s·(3 - 4s²)                    with s = sin(t)
+    1 - cos(3t) = v·(3 - 2v)²                with v = 1 - cos(t)
+
+Cosine is carried as the versine v = 1 - cos(t) so that the tiny angles do
+not cancel against the leading 1. Each step multiplies the absolute error
+of s by at most 3 and that of v by at most 9, so the series is truncated
+that much lower and the working precision gets a few guard digits for the
+rounding of the k steps. k is chosen automatically to minimise the
+estimated number of full-precision multiplications (two per series term,
+two per reconstruction step for each function).
+
+Functions:
+    choose_steps(x, precision): Number of triple-angle steps for |x| and precision
+    sine_triple_angle(x, precision): Sine with reduction, returns (value, terms, steps)
+    cosine_triple_angle(x, precision): Cosine with reduction, returns (value, terms, steps)
+    ta_sine, ta_cosine, ta_sincos: Kernels for reduced arguments, used by
+        the "triple_angle" method of trigo_sin_cos_tan.py
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+"""
+
+from math import lgamma, log
+
+from .precision_context import mp, mpf, isolated_precision
+
+from .argument_reduction import reduce_argument
+
+_LN10 = log(10)
+_LN3 = log(3)
+_LOG10_9 = log(9, 10)
+
+# Upper limit on the steps considered by choose_steps.
+MAX_STEPS = 200
+
+
+def _estimated_terms(log_t, digits, offset):
+    """Float estimate of the terms t**(2n+offset)/(2n+offset)! above 10**-digits."""
+    limit = -digits * _LN10
+    count = 0
+    while (2 * count + offset) * log_t - lgamma(2 * count + offset + 1) > limit:
+        count += 1
+    return count
+
+
+def choose_steps(x, precision):
+    """Return the number k of triple-angle steps that minimises the work for |x| <= π/4."""
+    if x == 0:
+        return 0
+    magnitude = float(abs(x))
+    log_x = log(magnitude) if magnitude > 0 else mp.mag(x) * log(2)
+    best_k, best_cost = 0, None
+    for k in range(MAX_STEPS + 1):
+        log_t = log_x - k * _LN3
+        # Cosine truncates lowest (v grows ninefold per step), so it sets the term count.
+        terms = _estimated_terms(log_t, precision + k * _LOG10_9, 0)
+        cost = terms + k
+        if best_cost is None or cost < best_cost:
+            best_k, best_cost = k, cost
+        elif cost > best_cost + 5:
+            break
+    return best_k
+
+
+def _scaled_series(x, precision, want_sin, want_cos):
+    """Sum the short series at x / 3**k and rebuild sin(x) and/or 1 - cos(x).
+
+    Returns (sin, versine, sin_terms, cos_terms, steps); the unwanted value
+    is None with a term count of 0.
+    """
+    steps = choose_steps(x, precision)
+    guard = len(str(steps)) + 3
+    sin_val = versine = None
+    sin_terms = cos_terms = 0
+    with mp.workdps(precision + guard):
+        t = x / 3**steps
+        t2 = t * t
+        if want_sin:
+            # Truncation error is tripled by each step, so stop 3**steps lower.
+            threshold = mpf(10) ** (-precision - 1) / 3**steps
+            term = mpf(t)
+            sin_val = mpf(0)
+            sin_terms = 1
+            n = 1
+            while abs(term) > threshold:
+                sin_val += term
+                n += 2
+                term = term * t2 / (-(n * (n - 1)))
+                sin_terms += 1
+            for _ in range(steps):
+                sin_val = sin_val * (3 - 4 * sin_val * sin_val)
+        if want_cos:
+            # v = t²/2! - t⁴/4! + ... ; its error grows ninefold per step.
+            threshold = mpf(10) ** (-precision - 1) / 9**steps
+            term = t2 / 2
+            versine = mpf(0)
+            cos_terms = 2  # The leading 1 and the final negligible term
+            n = 2
+            while abs(term) > threshold:
+                versine += term
+                n += 2
+                term = term * t2 / (-(n * (n - 1)))
+                cos_terms += 1
+            for _ in range(steps):
+                factor = 3 - 2 * versine
+                versine = versine * factor * factor
+    return sin_val, versine, sin_terms, cos_terms, steps
+
+
+@isolated_precision
+def ta_sine(x, precision, threshold=None):
+    """Sine of a reduced argument by triple-angle reconstruction. Returns (value, terms)."""
+    mp.dps = precision
+    sin_val, _, terms, _, _ = _scaled_series(x, precision, True, False)
+    return +sin_val, terms
+
+
+@isolated_precision
+def ta_cosine(x, precision, threshold=None):
+    """Cosine of a reduced argument by triple-angle reconstruction. Returns (value, terms)."""
+    mp.dps = precision
+    _, versine, _, terms, _ = _scaled_series(x, precision, False, True)
+    return 1 - versine, terms
+
+
+@isolated_precision
+def ta_sincos(x, precision):
+    """Sine and cosine of a reduced argument sharing one scaling.
+
+    Returns (sin, cos, sin_terms, cos_terms).
+    """
+    mp.dps = precision
+    sin_val, versine, sin_terms, cos_terms, _ = _scaled_series(x, precision, True, True)
+    return +sin_val, 1 - versine, sin_terms, cos_terms
+
+
+def _reduced_triple_angle(x, precision, shift):
+    """sin (shift=0) or cos (shift=1) of any x, with the steps used."""
+    r, quadrant = reduce_argument(x, precision)
+    quadrant = (quadrant + shift) % 4
+    use_sin = quadrant % 2 == 0
+    sin_val, versine, sin_terms, cos_terms, steps = _scaled_series(
+        r, precision, use_sin, not use_sin
+    )
+    mp.dps = precision
+    if use_sin:
+        value, terms = +sin_val, sin_terms
+    else:
+        value, terms = 1 - versine, cos_terms
+    if quadrant >= 2:
+        value = -value
+    return value, terms, steps
+
+
+@isolated_precision
+def sine_triple_angle(x, precision):
+    """Computes sine of x with argument scaling and triple-angle reconstruction.
+
+    Returns (value, terms, steps): the series terms summed at x / 3**steps
+    and the number of triple-angle steps applied.
+    """
+    return _reduced_triple_angle(x, precision, 0)
+
+
+@isolated_precision
+def cosine_triple_angle(x, precision):
+    """Computes cosine of x with argument scaling and triple-angle reconstruction.
+
+    Returns (value, terms, steps) as for sine_triple_angle.
+    """
+    return _reduced_triple_angle(x, precision, 1)
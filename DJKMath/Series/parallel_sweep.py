@@ -0,0 +1,176 @@
+"""
+parallel_sweep.py
+Process-pool evaluation of the trigonometric series over large angle sweeps.
+
+Tables of 10**5 angles at hundreds of digits are CPU bound, and threads
+share one interpreter lock, so the sweep is spread over worker processes
+with concurrent.futures.ProcessPoolExecutor:
+
+    1. The angles are split into contiguous chunks, several per worker, so
+       the per-task overhead is paid once per chunk and slow chunks do not
+       leave the other workers idle.
+    2. mpf angles and results travel as their raw (sign, mantissa, exponent,
+       bitcount) tuples, marked as such (_PackedMpf), which pickle as binary
+       integers and are rebuilt bit for bit, rather than as decimal strings
+       that must be printed and re-parsed at full precision. Other values,
+       ordinary tuples included, are sent as they are.
+    3. Each worker evaluates its chunk through the functions of
+       trigo_sin_cos_tan.py (the batch functions, sincos_power_series and
+       tangent_power_series with its pole test), and executor.map hands the
+       chunks back in submission order, so the results line up with the
+       input.
+
+Small sweeps or workers=1 run in the calling process, where a pool would
+cost more than it saves.
+
+Functions:
+    parallel_sweep(angles, precision, function, method, workers, chunk_size):
+        Evaluate one function over all angles, results in input order
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+    concurrent.futures: For the process pool
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from mpmath import mp
+
+from .trigo_sin_cos_tan import (
+    sine_power_series_batch,
+    cosine_power_series_batch,
+    sincos_power_series,
+    tangent_power_series,
+    tangent_pole,
+)
+
+# Chunks per worker: enough to balance uneven chunks, few enough to keep
+# the per-task overhead small.
+CHUNKS_PER_WORKER = 4
+
+# Below this many angles the sweep runs in-process.
+MIN_PARALLEL_ANGLES = 64
+
+SWEEP_FUNCTIONS = ("sine", "cosine", "sincos", "tangent")
+
+
+class _PackedMpf(tuple):
+    """The raw (sign, mantissa, exponent, bitcount) tuple of an mpf in transit."""
+
+    __slots__ = ()
+
+
+def _pack(value):
+    """Encode an mpf as its marked raw tuple; other values are sent unchanged."""
+    if hasattr(value, "_mpf_"):
+        return _PackedMpf(value._mpf_)
+    return value
+
+
+def _unpack(value):
+    """Rebuild an mpf from its marked raw tuple; other values are returned unchanged."""
+    if isinstance(value, _PackedMpf):
+        return mp.make_mpf(tuple(value))
+    return value
+
+
+def _tangent_rows(angles, precision, method):
+    """tangent_power_series per angle, with "undefined" rows at its poles.
+
+    The pole is tested first (tangent_pole), so workers never stop at the
+    interactive pole message.
+    """
+    for x in angles:
+        if tangent_pole(x, precision, method) is not None:
+            yield "undefined", 0, 0
+        else:
+            yield tangent_power_series(x, precision, method)
+
+
+def _evaluate_rows(function, angles, precision, method):
+    """Yield the result tuples of one function for each angle."""
+    if function == "sine":
+        return sine_power_series_batch(angles, precision, method)
+    if function == "cosine":
+        return cosine_power_series_batch(angles, precision, method)
+    if function == "sincos":
+        return (sincos_power_series(x, precision, method) for x in angles)
+    return _tangent_rows(angles, precision, method)
+
+
+def _sweep_chunk(function, packed_angles, precision, method):
+    """Worker task: evaluate one chunk and return its packed result rows."""
+    angles = [_unpack(x) for x in packed_angles]
+    return [
+        tuple(_pack(item) for item in row)
+        for row in _evaluate_rows(function, angles, precision, method)
+    ]
+
+
+def _chunks(items, size):
+    """Split a list into consecutive slices of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def parallel_sweep(angles, precision, function="sine", method="taylor",
+                   workers=None, chunk_size=None):
+    """Evaluates a trigonometric series over many angles with a process pool.
+
+    Parameters:
+    -----------
+    angles : iterable
+        Angles in radians (mpf, int, float or Fraction).
+    precision : int
+        Significant digits.
+    function : str, optional
+        "sine", "cosine", "sincos" or "tangent" (default "sine").
+    method : str, optional
+        Series method, as for sine_power_series (default "taylor").
+    workers : int, optional
+        Worker processes (default: os.cpu_count()).
+    chunk_size : int, optional
+        Angles per task (default: spread over CHUNKS_PER_WORKER tasks per worker).
+
+    Returns:
+    --------
+    list
+        One row per angle, in input order: (value, terms) for sine and
+        cosine, (sin, cos, sin_terms, cos_terms) for sincos and
+        (value, sin_terms, cos_terms) for tangent, whose value is
+        "undefined" at the poles tangent_power_series finds.
+
+    Raises:
+    -------
+    ValueError
+        If function is unknown or workers/chunk_size is not positive.
+    """
+    if function not in SWEEP_FUNCTIONS:
+        raise ValueError(
+            f"Unknown function {function!r}; choose from {', '.join(SWEEP_FUNCTIONS)}"
+        )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or (chunk_size is not None and chunk_size < 1):
+        raise ValueError("workers and chunk_size must be positive integers.")
+    packed = [_pack(x) for x in angles]
+    if not packed:
+        return []
+
+    if workers == 1 or len(packed) < MIN_PARALLEL_ANGLES:
+        rows = _sweep_chunk(function, packed, precision, method)
+    else:
+        if chunk_size is None:
+            tasks = workers * CHUNKS_PER_WORKER
+            chunk_size = max(1, -(-len(packed) // tasks))
+        chunks = _chunks(packed, chunk_size)
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = pool.map(
+                _sweep_chunk,
+                [function] * len(chunks),
+                chunks,
+                [precision] * len(chunks),
+                [method] * len(chunks),
+            )
+            rows = [row for chunk in results for row in chunk]
+    return [tuple(_unpack(item) for item in row) for row in rows]
@@ -0,0 +1,87 @@
+"""
+paterson_stockmeyer.py
+Paterson-Stockmeyer (baby-step/giant-step) evaluation of the sine and cosine series.
+
+After reduction, sin(x) = x·P(y) and cos(x) = Q(y) with y = x**2, where P and
+Q are polynomials with coefficients (-1)**k/(2k+1)! and (-1)**k/(2k)!. The
+plain Taylor loop spends one or two full-precision multiplications per term.
+Paterson-Stockmeyer splits the N coefficients into blocks of m ≈ √N:
+
+    baby steps:  y, y**2, ..., y**m            (m full multiplications)
+    blocks:      S_j = Σ b_i · y**i            (b_i small integers, cheap)
+    giant steps: Horner in Y = y**m over the blocks   (N/m full multiplications)
+
+Inside a block the coefficients share the denominator (2k+offset)! of its
+last term, so they become exact integers b_i; neighbouring blocks differ by
+an integer factor that is divided out once per giant step. The number of
+full-precision multiplications therefore grows like 2·√N instead of 2·N,
+which pays off from a few hundred digits upwards.
+
+The blocks are evaluated by the shared series engine (hypergeometric.py),
+which offers the same strategy to its other series (exp, sinh, cosh).
+
+Functions:
+    series_term_count(x, precision, offset): Terms needed before they drop below 10**-precision
+    ps_sine(x, precision): Sine series of x, no argument reduction
+    ps_cosine(x, precision): Cosine series of x, no argument reduction
+    ps_sincos(x, precision): Both, sharing the baby steps
+
+Each returns the value(s) with term counts in the same convention as the
+Taylor loops in trigo_sin_cos_tan.py.
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+"""
+
+from .precision_context import mp, isolated_precision
+from .hypergeometric import term_count, paterson_stockmeyer_sums
+
+
+def series_term_count(x, precision, offset):
+    """Count the terms x**(2k+offset)/(2k+offset)! larger than 10**-precision.
+
+    offset is 1 for the sine series and 0 for the cosine series. The result
+    follows the Taylor loops' convention (terms above the threshold plus the
+    final negligible one), and that many terms are evaluated, which leaves a
+    one-term margin for the floating-point estimate.
+
+    Raises:
+    -------
+    RuntimeError
+        If more than 1000 terms would be needed.
+    """
+    return term_count("sine" if offset else "cosine", x, precision)
+
+
+@isolated_precision
+def ps_sine(x, precision, threshold=None):
+    """Computes sine of x (no argument reduction) with Paterson-Stockmeyer.
+
+    threshold is accepted for symmetry with the Taylor kernels; the term
+    count is derived from precision. Returns (value, terms).
+    """
+    mp.dps = precision
+    return paterson_stockmeyer_sums(["sine"], x, precision)[0]
+
+
+@isolated_precision
+def ps_cosine(x, precision, threshold=None):
+    """Computes cosine of x (no argument reduction) with Paterson-Stockmeyer.
+
+    Returns (value, terms).
+    """
+    mp.dps = precision
+    return paterson_stockmeyer_sums(["cosine"], x, precision)[0]
+
+
+@isolated_precision
+def ps_sincos(x, precision):
+    """Computes sine and cosine of x (no argument reduction) sharing the baby steps.
+
+    Returns (sin, cos, sin_terms, cos_terms).
+    """
+    mp.dps = precision
+    (sin_val, sin_terms), (cos_val, cos_terms) = paterson_stockmeyer_sums(
+        ["sine", "cosine"], x, precision
+    )
+    return sin_val, cos_val, sin_terms, cos_terms
@@ -0,0 +1,125 @@
+"""
+precision_context.py
+Per-thread mpmath contexts for the series functions.
+
+mpmath's global mp carries one working precision for the whole process, so
+setting mp.dps inside a series function both clobbers the caller's
+precision and lets two threads running different precisions corrupt each
+other. The series modules therefore work in a private mpmath context per
+thread:
+
+    mp      stands in for that context (mp.dps, mp.pi, mp.workprec, ...)
+    mpf     builds an mpf in that context
+
+Public functions are wrapped with isolated_precision. On the outermost call
+in a thread it starts the thread's context at the caller's precision
+(mpmath.mp.prec, so "the current mp.dps" means the same inside and out),
+copies mpf/mpc arguments into it (exactly, bit for bit) and copies the
+mpf/mpc results back into mpmath's global context, whose precision it never
+touches. Nested calls between the series
+modules pass values through unchanged, so the conversions happen once per
+call from outside.
+
+Functions:
+    thread_context(): This thread's private mpmath context
+    thread_interval_context(): This thread's private mpmath interval context
+    to_local(value): Copy an mpf/mpc into the thread's context
+    to_caller(value): Copy mpf/mpc/interval values (also inside tuples/lists)
+        to mpmath.mp or mpmath.iv
+    isolated_precision(func): Decorator running func in the thread's context
+
+Dependencies:
+    mpmath: For the contexts themselves
+"""
+
+import functools
+import threading
+
+import mpmath
+from mpmath.ctx_iv import MPIntervalContext
+
+_local = threading.local()
+
+
+def thread_context():
+    """Return this thread's private mpmath context, creating it on first use."""
+    ctx = getattr(_local, "context", None)
+    if ctx is None:
+        ctx = _local.context = mpmath.MPContext()
+    return ctx
+
+
+def thread_interval_context():
+    """Return this thread's private mpmath interval context, creating it on first use."""
+    ctx = getattr(_local, "interval_context", None)
+    if ctx is None:
+        ctx = _local.interval_context = MPIntervalContext()
+    return ctx
+
+
+class _ThreadContext:
+    """Forwards attribute access to the calling thread's private context."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        return getattr(thread_context(), name)
+
+    def __setattr__(self, name, value):
+        setattr(thread_context(), name, value)
+
+    def __repr__(self):
+        return repr(thread_context())
+
+
+mp = _ThreadContext()
+
+
+def mpf(*args, **kwargs):
+    """Build an mpf in the calling thread's context."""
+    return thread_context().mpf(*args, **kwargs)
+
+
+def to_local(value):
+    """Copy an mpf or mpc into the thread's context without rounding.
+
+    Other values (int, float, str, Fraction, ...) are returned unchanged.
+    """
+    if hasattr(value, "_mpf_"):
+        return thread_context().make_mpf(value._mpf_)
+    if hasattr(value, "_mpc_"):
+        return thread_context().make_mpc(value._mpc_)
+    return value
+
+
+def to_caller(value):
+    """Copy mpf, mpc and interval values, also inside tuples and lists, to
+    mpmath.mp (mpmath.iv for intervals)."""
+    if hasattr(value, "_mpf_"):
+        return mpmath.mp.make_mpf(value._mpf_)
+    if hasattr(value, "_mpc_"):
+        return mpmath.mp.make_mpc(value._mpc_)
+    if hasattr(value, "_mpi_"):
+        return mpmath.iv.make_mpf(value._mpi_)
+    if isinstance(value, (tuple, list)):
+        return type(value)(to_caller(item) for item in value)
+    return value
+
+
+def isolated_precision(func):
+    """Run func in the thread's own context, leaving mpmath.mp untouched."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if getattr(_local, "active", False):
+            return func(*args, **kwargs)
+        _local.active = True
+        try:
+            thread_context().prec = mpmath.mp.prec
+            args = [to_local(arg) for arg in args]
+            kwargs = {key: to_local(arg) for key, arg in kwargs.items()}
+            return to_caller(func(*args, **kwargs))
+        finally:
+            _local.active = False
+
+    return wrapper
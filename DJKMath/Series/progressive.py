@@ -0,0 +1,183 @@
+"""
+progressive.py
+Generators yielding sine and cosine to successively more digits.
+
+sine_power_series() returns only once the full precision is reached. The
+generators here run the same Taylor loop of the reduced argument (same
+cached coefficients, stopping rule and term counting as the series engine
+of hypergeometric.py) and hand out the partial sum along the way:
+
+    - at doubling precisions: start, 2·start, 4·start, ... digits, then
+      the full precision, or
+    - every k terms (every=k), then the full precision.
+
+The partial sum, the current power of r and the term count are kept
+between yields, so each refinement only adds the terms it still needs;
+nothing is recomputed. Since |r| <= π/4 the series alternates with
+shrinking terms, and the next term bounds the error of the partial sum;
+the digits reported with each value come from that bound.
+
+The argument is reduced once, to the full precision, before the first
+yield. Each step runs in the thread's private precision context (see
+precision_context.py), so consumers may interleave other computations
+between steps. A consumer that has enough digits simply stops iterating
+(or calls close()); no further terms are summed.
+
+The final value and term count equal those of sine_power_series /
+cosine_power_series with backend="mpmath".
+
+Functions:
+    sine_power_series_progressive(x, precision, every, start): Generator of (value, terms, digits)
+    cosine_power_series_progressive(x, precision, every, start): Generator of (value, terms, digits)
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+"""
+
+from .precision_context import mp, mpf, isolated_precision
+from .argument_reduction import reduce_argument, LOG2_10
+from .hypergeometric import series_coefficients
+
+# Digits of the first refinement when refining at doubling precisions.
+DEFAULT_START_DIGITS = 10
+
+
+@isolated_precision
+def _start(x, precision, shift):
+    """Reduce x and set up the loop state for sin (shift=0) or cos (shift=1).
+
+    Returns (state, negate): the state of the series of r whose partial
+    sums approximate ±f(x), and whether to negate them.
+    """
+    mp.dps = precision
+    r, quadrant = reduce_argument(x, precision)
+    quadrant = (quadrant + shift) % 4
+    odd = quadrant % 2 == 0  # sin(r) is the odd series
+    first = mpf(r) if odd else mpf(1)
+    state = {
+        "name": "sine" if odd else "cosine",
+        "x2": r * r,
+        "power": first,
+        "result": first,
+        "term": first,
+        "k": 0,
+        "terms": 1,
+    }
+    return state, quadrant >= 2
+
+
+@isolated_precision
+def _advance(state, precision, digits=None, max_terms=None):
+    """Continue the Taylor loop until |term| <= 10**-digits or max_terms terms.
+
+    Returns (digits reached, done) where done means the full precision's
+    stopping rule has been met.
+    """
+    mp.dps = precision
+    threshold = mpf(10) ** (-precision)
+    bound = mpf(10) ** (-digits) if digits is not None else threshold
+    name = state["name"]
+    coefficients = series_coefficients(name, state["k"] + 16)
+    x2, power, result, term = state["x2"], state["power"], state["result"], state["term"]
+    k, total_terms = state["k"], state["terms"]
+
+    while abs(term) > threshold and abs(term) > bound:
+        if max_terms is not None and total_terms >= max_terms:
+            break
+        k += 1
+        if k == len(coefficients):
+            coefficients = series_coefficients(name, 2 * k)
+        power *= x2
+        term = coefficients[k] * power
+        result += term
+        total_terms += 1
+        if total_terms > 1000:  # Prevent infinite loops
+            raise RuntimeError("Series not converging")
+
+    state.update(power=power, result=result, term=term, k=k, terms=total_terms)
+    done = abs(term) <= threshold
+    if done or not term:
+        return precision, done
+    reached = max(0, int(-mp.mag(term) / LOG2_10))
+    if digits is not None and abs(term) <= bound:
+        reached = max(reached, digits)
+    return min(precision, reached), done
+
+
+@isolated_precision
+def _partial_value(state, digits, negate):
+    """The partial sum rounded to digits significant digits, with its sign."""
+    mp.dps = max(digits, 1)
+    value = +state["result"]
+    return -value if negate else value
+
+
+def _refinements(state, negate, precision, every, start):
+    """Yields (value, terms, digits) for an initialised loop state."""
+    if every:
+        while True:
+            digits, done = _advance(state, precision, max_terms=state["terms"] + every)
+            if done:
+                break
+            yield _partial_value(state, digits, negate), state["terms"], digits
+    else:
+        target = start
+        while target < precision:
+            digits, done = _advance(state, precision, digits=target)
+            if done:
+                break
+            yield _partial_value(state, digits, negate), state["terms"], digits
+            while target <= digits:
+                target *= 2
+        _advance(state, precision)
+    yield _partial_value(state, precision, negate), state["terms"], precision
+
+
+def _progressive(x, precision, shift, every, start):
+    """Validate the arguments, reduce x and return the generator."""
+    if precision < 1:
+        raise ValueError("Precision must be at least 1 digit.")
+    if every is not None and every < 1:
+        raise ValueError("every must be a positive number of terms.")
+    if start < 1:
+        raise ValueError("start must be at least 1 digit.")
+    state, negate = _start(x, precision, shift)
+    return _refinements(state, negate, precision, every, start)
+
+
+def sine_power_series_progressive(x, precision, every=None, start=DEFAULT_START_DIGITS):
+    """Yields sin(x) to successively more digits.
+
+    Parameters:
+    -----------
+    x : mpf, float, int or str
+        Angle in radians.
+    precision : int
+        Significant digits of the final value.
+    every : int, optional
+        Yield after every this many terms instead of at doubling precisions.
+    start : int, optional
+        Digits of the first refinement at doubling precisions (default
+        DEFAULT_START_DIGITS).
+
+    Returns:
+    --------
+    generator of (mpf, int, int)
+        The value, the terms summed so far and the number of digits the
+        value is good to. The last item has digits == precision.
+
+    Raises:
+    -------
+    ValueError
+        If precision, every or start is not positive (raised by the call,
+        before iteration), or if x is not finite.
+    """
+    return _progressive(x, precision, 0, every, start)
+
+
+def cosine_power_series_progressive(x, precision, every=None, start=DEFAULT_START_DIGITS):
+    """Yields cos(x) to successively more digits.
+
+    Parameters and results are as for sine_power_series_progressive.
+    """
+    return _progressive(x, precision, 1, every, start)
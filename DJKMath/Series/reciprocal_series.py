@@ -0,0 +1,377 @@
+"""
+reciprocal_series.py
+Direct series for tangent, secant, cosecant and cotangent from Bernoulli and Euler numbers.
+
+tan as sin/cos costs two series and a full-precision division. The four
+functions have power series of their own (Laurent series for cot, csc):
+
+    tan r = Σ A(2k+1)/(2k+1)! · r^(2k+1)                        |r| < π/2
+    sec r = Σ A(2k)/(2k)! · r^(2k)                              |r| < π/2
+    cot r = 1/r - Σ 2^(2n)·|B(2n)|/(2n)! · r^(2n-1)             |r| < π
+    csc r = 1/r + Σ 2·(2^(2n-1) - 1)·|B(2n)|/(2n)! · r^(2n-1)   |r| < π
+
+A(n) are the zigzag numbers (1, 1, 1, 2, 5, 16, 61, 272, ...): A(2k) = |E(2k)|
+(Euler numbers) and A(2k-1) = 2^(2k)·(2^(2k) - 1)·|B(2k)|/(2k) (Bernoulli).
+They come from the Seidel-Entringer triangle in integer additions only,
+computed once and cached; the coefficients are rounded once per working
+precision in coefficient_cache.py.
+
+x = q·(π/2) + r with |r| <= π/4 (argument_reduction.py), and each
+function of x is ± one of the four series of r (tan of x is -cot r in odd
+quadrants, ...). The terms shrink by a factor of about (2r/π)² for tan and
+sec, (r/π)² for cot and csc, while sin and cos shrink factorially. A direct
+term costs less than a fused sin/cos pair, so the tan and cot series win
+for small r and the quotient near r = π/4, i.e. closer to the radius of
+convergence; a direct sec or csc term costs as much as a cos or sin term,
+so those rarely win. direct_series() estimates the cost of both and
+returns None when the quotient is cheaper. The estimate depends on r only
+through its binary exponent and is cached, so callers that already reduced
+x (direct_series_reduced) decide with one dictionary lookup.
+benchmark_direct() times both paths to check the model.
+
+The series are summed to a relative error of 10**-precision, so values near
+the poles (small r in cot and csc) keep all their digits.
+
+Functions:
+    zigzag_numbers(count): A(0), ..., A(count - 1) as integers
+    bernoulli_number(n): B(n) as an exact Fraction (B(1) = -1/2)
+    euler_number(n): E(n) as an integer
+    direct_series(func, x, precision, force): (value, terms), or None if the quotient is cheaper
+    direct_series_reduced(func, r, quadrant, precision, force): The same for x = quadrant·(π/2) + r
+    benchmark_direct(precisions, exponents, repeat): Time the direct series against the quotient
+
+Dependencies:
+    fractions: For the exact coefficients (standard library)
+    mpmath: For high-precision arithmetic
+"""
+
+import math
+import threading
+import time
+from fractions import Fraction
+
+from .precision_context import mp, mpf, isolated_precision
+from .argument_reduction import reduce_argument
+from .coefficient_cache import exact_coefficients
+
+FUNCTIONS = ("tangent", "secant", "cosecant", "cotangent")
+
+# Extra digits for the reduction and the summation.
+GUARD_DIGITS = 5
+
+# Full-precision multiplications per direct term, per fused sin/cos pair of
+# terms (sincos_power_series), per single sin or cos term and per division,
+# and the fixed overhead of the direct loop (tail bound, coefficient table):
+# the cost model of direct_series(), fitted with benchmark_direct().
+DIRECT_TERM_COST = 2
+PAIR_TERM_COST = 4
+TAYLOR_TERM_COST = 2
+DIVISION_COST = 2
+DIRECT_SETUP_COST = 8
+
+# Precisions and exponents e (r = 0.7·10**-e) timed by benchmark_direct().
+BENCHMARK_PRECISIONS = (50, 200, 1000)
+BENCHMARK_EXPONENTS = (1, 2, 3, 5, 10)
+
+# Upper bounds of coefficient(k + 1) / coefficient(k): the terms shrink at
+# least by this times r² (the limits are 4/π² and 1/π²).
+_RATIO_BOUNDS = {"tangent": 0.4053, "secant": 0.5, "cotangent": 0.1014, "cosecant": 0.1167}
+
+# Series with the leading 1/r.
+_LAURENT = ("cotangent", "cosecant")
+
+# The function of x = q·(π/2) + r as (series of r, sign) for q = 0, 1, 2, 3.
+_QUADRANTS = {
+    "tangent": (("tangent", 1), ("cotangent", -1), ("tangent", 1), ("cotangent", -1)),
+    "cotangent": (("cotangent", 1), ("tangent", -1), ("cotangent", 1), ("tangent", -1)),
+    "secant": (("secant", 1), ("cosecant", -1), ("secant", -1), ("cosecant", 1)),
+    "cosecant": (("cosecant", 1), ("secant", 1), ("cosecant", -1), ("secant", -1)),
+}
+
+# (series name, precision, binary exponent of r) -> whether the direct
+# series is estimated cheaper.
+_choices = {}
+
+# Zigzag numbers so far and the last row of the Seidel-Entringer triangle.
+_zigzag = [1]
+_row = [1]
+_zigzag_lock = threading.Lock()
+
+
+def zigzag_numbers(count):
+    """Returns the zigzag numbers A(0), ..., A(count - 1) (1, 1, 1, 2, 5, 16, 61, ...).
+
+    Row n of the triangle is E(n, 0) = 0, E(n, k) = E(n, k-1) + E(n-1, n-k),
+    and A(n) = E(n, n); rows are added to the cache as far as needed.
+    """
+    global _row
+    with _zigzag_lock:
+        while len(_zigzag) < count:
+            n = len(_zigzag)
+            row = [0]
+            for k in range(1, n + 1):
+                row.append(row[k - 1] + _row[n - k])
+            _row = row
+            _zigzag.append(row[n])
+        return _zigzag[:count]
+
+
+def bernoulli_number(n):
+    """Returns the Bernoulli number B(n) as an exact Fraction (B(1) = -1/2)."""
+    if n < 0:
+        raise ValueError("n must not be negative.")
+    if n == 0:
+        return Fraction(1)
+    if n == 1:
+        return Fraction(-1, 2)
+    if n % 2:
+        return Fraction(0)
+    value = Fraction(n * zigzag_numbers(n)[n - 1], 4 ** n - 2 ** n)
+    return value if n % 4 == 2 else -value
+
+
+def euler_number(n):
+    """Returns the Euler number E(n) as an integer (1, 0, -1, 0, 5, 0, -61, ...)."""
+    if n < 0:
+        raise ValueError("n must not be negative.")
+    if n % 2:
+        return 0
+    value = zigzag_numbers(n + 1)[n]
+    return value if n % 4 == 0 else -value
+
+
+def _coefficient(name):
+    """The exact k-th series coefficient of name, as a function of k."""
+    def tangent(k):
+        return Fraction(zigzag_numbers(2 * k + 2)[2 * k + 1], math.factorial(2 * k + 1))
+
+    def secant(k):
+        return Fraction(zigzag_numbers(2 * k + 1)[2 * k], math.factorial(2 * k))
+
+    def cotangent(k):
+        # 2^(2n)·|B(2n)|/(2n)! with n = k + 1
+        return tangent(k) / (4 ** (k + 1) - 1)
+
+    def cosecant(k):
+        # 2·(2^(2n-1) - 1)·|B(2n)|/(2n)! with n = k + 1
+        half = 2 ** (2 * k + 1)
+        return tangent(k) * (half - 1) / (half * (4 ** (k + 1) - 1))
+
+    return {"tangent": tangent, "secant": secant,
+            "cotangent": cotangent, "cosecant": cosecant}[name]
+
+
+def _series(name, r, precision):
+    """Sums the series of name at r (|r| <= π/4) to a relative error of 10**-precision.
+
+    Returns (value, terms).
+    """
+    mp.dps = precision + GUARD_DIGITS
+    odd = name != "secant"
+    coefficient = _coefficient(name)
+    table_name = "reciprocal_" + name
+    coefficients = exact_coefficients(table_name, 16, coefficient)
+    r = mpf(r)
+    x2 = r * r
+    power = r if odd else mpf(1)
+    subtract = name == "cotangent"
+    if name in _LAURENT:
+        result = 1 / r
+        total_terms = 1
+    else:
+        result = mpf(0)
+        total_terms = 0
+    # The tail after a term is at most term·ratio/(1 - ratio), and |value|
+    # is at least |r| (tan), 1 (sec), 1/|r| (csc) or (π/4)/|r| (cot).
+    ratio = _RATIO_BOUNDS[name] * x2
+    smallest = {"tangent": abs(r), "secant": 1, "cosecant": abs(result),
+                "cotangent": abs(result) * 3 / 4}[name]
+    threshold = mpf(10) ** (-precision) * smallest * (1 - ratio) / ratio if x2 else mpf(0)
+    term = coefficients[0] * power
+    k = 0
+
+    while True:
+        if subtract:
+            result -= term
+        else:
+            result += term
+        total_terms += 1
+        if abs(term) <= threshold:
+            break
+        k += 1
+        if k == len(coefficients):
+            coefficients = exact_coefficients(table_name, 2 * k, coefficient)
+        power *= x2
+        term = coefficients[k] * power
+        if total_terms > 1000:  # Prevent infinite loops
+            raise RuntimeError("Series not converging")
+    return result, total_terms
+
+
+def _direct_terms(name, log_r, precision):
+    """Estimated terms of the direct series of name at |r| = exp(log_r)."""
+    log_ratio = math.log(_RATIO_BOUNDS[name]) + 2 * log_r
+    return math.ceil(precision * math.log(10) / -log_ratio) + 1
+
+
+def _taylor_terms(log_r, precision, odd):
+    """Estimated terms of the sin (odd) or cos Taylor loop at |r| = exp(log_r)."""
+    limit = -precision * math.log(10)
+    n = 1 if odd else 0
+    terms = 1
+    while n * log_r - math.lgamma(n + 1) > limit:
+        n += 2
+        terms += 1
+    return terms
+
+
+def _estimate_direct(name, log_r, precision):
+    """Whether the direct series of name at |r| = exp(log_r) is estimated
+    cheaper than the sin/cos quotient."""
+    direct = DIRECT_SETUP_COST + DIRECT_TERM_COST * _direct_terms(name, log_r, precision)
+    if name in _LAURENT:
+        direct += DIVISION_COST
+    if name in ("tangent", "cotangent"):
+        pairs = max(_taylor_terms(log_r, precision, True), _taylor_terms(log_r, precision, False))
+        quotient = PAIR_TERM_COST * pairs
+    else:
+        quotient = TAYLOR_TERM_COST * _taylor_terms(log_r, precision, name == "cosecant")
+    return direct < quotient + DIVISION_COST
+
+
+def _prefer_direct(name, r, precision):
+    """Whether the direct series of name at r (r != 0) is estimated cheaper.
+
+    2**(e-1) <= |r| < 2**e with e = mag(r); the estimate is made once per
+    (name, precision, e) at the middle of that range.
+    """
+    exponent = int(mp.mag(r))
+    key = (name, precision, exponent)
+    choice = _choices.get(key)
+    if choice is None:
+        choice = _choices[key] = _estimate_direct(name, (exponent - 0.5) * math.log(2), precision)
+    return choice
+
+
+@isolated_precision
+def direct_series(func, x, precision, force=False):
+    """Evaluates tangent, secant, cosecant or cotangent of x by its direct series.
+
+    Parameters:
+    -----------
+    func : str
+        One of FUNCTIONS.
+    x : mpf, float, int or str
+        Angle in radians.
+    precision : int
+        Significant digits of the result.
+    force : bool, optional
+        Sum the direct series even where the quotient is estimated cheaper.
+
+    Returns:
+    --------
+    (mpf, int) or None
+        The value and the terms summed, or None when the sin/cos quotient
+        is cheaper (and force is False) or x is a pole.
+
+    Raises:
+    -------
+    ValueError
+        If func is unknown or x is not finite.
+    """
+    if func not in _QUADRANTS:
+        raise ValueError(f"Unknown function {func!r}; choose from {', '.join(FUNCTIONS)}")
+    mp.dps = precision + GUARD_DIGITS
+    r, quadrant = reduce_argument(x, precision + GUARD_DIGITS)
+    return direct_series_reduced(func, r, quadrant, precision, force)
+
+
+@isolated_precision
+def direct_series_reduced(func, r, quadrant, precision, force=False):
+    """Evaluates func of x = quadrant·(π/2) + r by its direct series.
+
+    For callers that reduced x already (reduce_argument with GUARD_DIGITS
+    extra digits) and sum the quotient from the same r when this returns
+    None. Parameters, return value and errors are those of direct_series.
+    """
+    if func not in _QUADRANTS:
+        raise ValueError(f"Unknown function {func!r}; choose from {', '.join(FUNCTIONS)}")
+    name, sign = _QUADRANTS[func][quadrant]
+    if not r:
+        if name in _LAURENT or not force:
+            return None
+    elif not force and not _prefer_direct(name, r, precision):
+        return None
+    value, terms = _series(name, r, precision)
+    mp.dps = precision
+    return (+value if sign > 0 else -value), terms
+
+
+def _quotient(func, r, precision):
+    """func of r by the sin/cos Taylor kernels, as the library sums it when
+    the direct series is not chosen."""
+    # Imported here: trigo_sin_cos_tan imports this module.
+    from .trigo_sin_cos_tan import SERIES_METHODS
+
+    sine_kernel, cosine_kernel, sincos_kernel = SERIES_METHODS["taylor"]
+    with mp.workdps(precision):
+        if func == "secant":
+            return 1 / cosine_kernel(r, precision)[0]
+        if func == "cosecant":
+            return 1 / sine_kernel(r, precision)[0]
+        s, c, _, _ = sincos_kernel(r, precision)
+        return s / c if func == "tangent" else c / s
+
+
+def benchmark_direct(precisions=BENCHMARK_PRECISIONS, exponents=BENCHMARK_EXPONENTS, repeat=5):
+    """Times the direct series against the sin/cos quotient at r = 0.7·10**-e.
+
+    Parameters:
+    -----------
+    precisions : iterable of int, optional
+        Significant digits to time (default BENCHMARK_PRECISIONS).
+    exponents : iterable of int, optional
+        Values of e (default BENCHMARK_EXPONENTS).
+    repeat : int, optional
+        Evaluations per path; the best is kept (default 5).
+
+    Returns:
+    --------
+    list of dict
+        One dict per function, precision and e with the seconds per
+        evaluation for "direct" and "quotient", and whether the cost
+        model "chooses" the direct series there.
+    """
+    results = []
+    for precision in precisions:
+        for exponent in exponents:
+            with mp.workdps(precision + GUARD_DIGITS):
+                r = mpf(7) / 10 ** (exponent + 1)
+            for func in FUNCTIONS:
+                timings = {}
+                for path, run in (
+                        ("direct", lambda: direct_series_reduced(func, r, 0, precision, True)),
+                        ("quotient", lambda: _quotient(func, r, precision))):
+                    best = float("inf")
+                    for _ in range(repeat):
+                        start = time.perf_counter()
+                        run()
+                        best = min(best, time.perf_counter() - start)
+                    timings[path] = best
+                results.append({
+                    "function": func,
+                    "precision": precision,
+                    "exponent": exponent,
+                    "direct": timings["direct"],
+                    "quotient": timings["quotient"],
+                    "chosen": direct_series_reduced(func, r, 0, precision) is not None,
+                })
+    return results
+
+
+if __name__ == "__main__":
+    for row in benchmark_direct():
+        ratio = row["direct"] / row["quotient"]
+        chosen = "direct" if row["chosen"] else "quotient"
+        print(f"{row['function']:9} {row['precision']:5} 1e-{row['exponent']:<3} "
+              f"direct/quotient {ratio:5.2f}  chosen: {chosen}")
@@ -0,0 +1,186 @@
+"""
+rotation_table.py
+Sine and cosine tables over evenly spaced angle grids by a rotation recurrence.
+
+Evaluating the series at every point of a grid costs points × terms. For
+angles a + n·δ, sin and cos of the next point follow from the current
+ones by a rotation through δ:
+
+    cos(t + δ) = cos(t) - (α·cos(t) + β·sin(t))
+    sin(t + δ) = sin(t) - (α·sin(t) - β·cos(t))
+
+with α = 2·sin²(δ/2) and β = sin(δ), computed once per table, and four
+multiplications per row. This form (rather than cos δ·c - sin δ·s) keeps α
+exact to full relative precision for tiny steps, where 1 - cos δ would
+cancel. Rounding errors
+still drift, by about one unit per row, so the grid is cut into blocks of
+anchor_every rows: each block starts from a direct evaluation
+(sincos_power_series, at the exact angle a + n·δ) and the recurrence runs
+with enough guard digits to absorb the drift over one block.
+
+Grids are in degrees (the default) or radians. start and step are taken
+exactly (exact_angle.exact_fraction), so a step of 1/3600 degree (one
+second) accumulates no error in the angles; degree anchors at special
+angles use their closed forms.
+
+Rows are produced one block at a time, so neither generator nor writer
+holds the whole table:
+
+    sincos_table(...)          yields (angle, sin, cos)
+    write_sincos_table(...)    streams rows to a CSV file
+    fill_sincos_table(...)     fills preallocated sequences, e.g. NumPy
+                               arrays or memmaps
+
+Functions:
+    sincos_table(start, step, count, precision, unit, anchor_every): Generator of rows
+    write_sincos_table(path, start, step, count, precision, unit, anchor_every): CSV file
+    fill_sincos_table(sin_out, cos_out, start, step, precision, unit, anchor_every): Fill arrays
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+"""
+
+import csv
+
+from .precision_context import mp, mpf, isolated_precision
+from .exact_angle import DegreeAngle, exact_fraction
+from .trigo_sin_cos_tan import sincos_power_series
+
+# Rows computed by the recurrence from one direct evaluation.
+DEFAULT_ANCHOR_EVERY = 256
+
+# Extra digits carried through a block, on top of the digits of anchor_every.
+GUARD_DIGITS = 3
+
+UNITS = ("degree", "radian")
+
+
+def _exact_sincos(angle, precision, unit):
+    """sin and cos of an exact angle (Fraction) in the grid's unit."""
+    if unit == "degree":
+        s, c, _, _ = sincos_power_series(DegreeAngle(angle), precision, backend="mpmath")
+    else:
+        with mp.workdps(precision):
+            x = mpf(angle.numerator) / angle.denominator
+        s, c, _, _ = sincos_power_series(x, precision, backend="mpmath")
+    return s, c
+
+
+@isolated_precision
+def _step_constants(step, work, unit):
+    """α = 2·sin²(δ/2) and β = sin(δ) for the step δ, at work digits."""
+    half_sine, _ = _exact_sincos(step / 2, work, unit)
+    beta, _ = _exact_sincos(step, work, unit)
+    mp.dps = work
+    return 2 * half_sine * half_sine, beta
+
+
+@isolated_precision
+def _block(start, step, first, rows, precision, work, unit, alpha, beta):
+    """Rows first, ..., first + rows - 1 of the grid as (angle, sin, cos).
+
+    Anchored by a direct evaluation at row first, then rotated with the
+    step constants alpha and beta (computed once per table at work digits).
+    """
+    s, c = _exact_sincos(start + first * step, work, unit)
+    mp.dps = work
+    values = [(s, c)]
+    for _ in range(rows - 1):
+        s, c = s - (alpha * s - beta * c), c - (alpha * c + beta * s)
+        values.append((s, c))
+    mp.dps = precision
+    table = []
+    for n, (s, c) in enumerate(values):
+        angle = start + (first + n) * step
+        table.append((mpf(angle.numerator) / angle.denominator, +s, +c))
+    return table
+
+
+def _check(count, precision, unit, anchor_every):
+    """Validate the grid arguments."""
+    if count < 0:
+        raise ValueError("count must not be negative.")
+    if precision < 1:
+        raise ValueError("Precision must be at least 1 digit.")
+    if unit not in UNITS:
+        raise ValueError(f"Unknown unit {unit!r}; choose from {', '.join(UNITS)}")
+    if anchor_every < 1:
+        raise ValueError("anchor_every must be at least 1 row.")
+
+
+def _rows(start, step, count, precision, unit, anchor_every):
+    """Yields the rows block by block, all rotated by the same step constants."""
+    if count == 0:
+        return
+    work = precision + GUARD_DIGITS + len(str(min(anchor_every, count)))
+    alpha, beta = _step_constants(step, work, unit)
+    for first in range(0, count, anchor_every):
+        rows = min(anchor_every, count - first)
+        yield from _block(start, step, first, rows, precision, work, unit, alpha, beta)
+
+
+def sincos_table(start, step, count, precision, unit="degree",
+                 anchor_every=DEFAULT_ANCHOR_EVERY):
+    """Yields sin and cos over the grid start + n·step, n = 0, ..., count - 1.
+
+    Parameters:
+    -----------
+    start, step : int, Fraction, Decimal, str, float or mpf
+        First angle and spacing, taken exactly (floats by their repr).
+    count : int
+        Number of rows.
+    precision : int
+        Significant digits of every value.
+    unit : str, optional
+        "degree" (default) or "radian".
+    anchor_every : int, optional
+        Rows per direct evaluation; more is faster and needs more guard
+        digits (default DEFAULT_ANCHOR_EVERY).
+
+    Returns:
+    --------
+    generator of (mpf, mpf, mpf)
+        The angle (in unit), its sine and its cosine.
+
+    Raises:
+    -------
+    ValueError
+        If count is negative, precision or anchor_every is not positive,
+        or unit is unknown (raised by the call, before iteration).
+    """
+    _check(count, precision, unit, anchor_every)
+    return _rows(exact_fraction(start), exact_fraction(step), count, precision, unit, anchor_every)
+
+
+def write_sincos_table(path, start, step, count, precision, unit="degree",
+                       anchor_every=DEFAULT_ANCHOR_EVERY):
+    """Streams the grid of sincos_table to a CSV file with columns angle, sin, cos.
+
+    Values are written with precision significant digits. Returns the
+    number of rows written.
+    """
+    rows = sincos_table(start, step, count, precision, unit, anchor_every)
+    written = 0
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(("angle", "sin", "cos"))
+        for row in rows:
+            writer.writerow([mp.nstr(value, precision, strip_zeros=False) for value in row])
+            written += 1
+    return written
+
+
+def fill_sincos_table(sin_out, cos_out, start, step, precision, unit="degree",
+                      anchor_every=DEFAULT_ANCHOR_EVERY):
+    """Fills sin_out[n] and cos_out[n] for the grid start + n·step.
+
+    The number of rows is len(sin_out). Any sequences supporting item
+    assignment work: lists, NumPy object arrays (mpf values), float arrays
+    or memmaps (values converted to float).
+    """
+    if len(cos_out) != len(sin_out):
+        raise ValueError("sin_out and cos_out must have the same length.")
+    rows = sincos_table(start, step, len(sin_out), precision, unit, anchor_every)
+    for n, (_, s, c) in enumerate(rows):
+        sin_out[n] = s
+        cos_out[n] = c
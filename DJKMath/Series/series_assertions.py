@@ -0,0 +1,54 @@
+"""
+series_assertions.py
+Shared checks for the unit tests of the series modules (test_*.py).
+
+Every test compares a series value with an mpmath reference computed with
+guard digits; SeriesTestCase holds that comparison once. Run the tests from
+the repository root with
+
+    python -m unittest discover DJKMath/Series
+
+Functions:
+    reference(function, x, digits): function(x) with GUARD_DIGITS extra digits
+    SeriesTestCase.assertDigits(value, expected, digits, relative): Agreement
+        to 10**-digits, absolute or relative
+
+Dependencies:
+    mpmath: For high-precision arithmetic
+"""
+
+import unittest
+
+from mpmath import mp, mpf
+
+# Digits beyond the checked ones for references and error computations.
+GUARD_DIGITS = 20
+
+
+def reference(function, x, digits):
+    """Returns function(x) computed with GUARD_DIGITS more than digits.
+
+    x may be anything mpmath converts (int, float, str, Fraction, Decimal,
+    complex, mpf or mpc).
+    """
+    with mp.workdps(digits + GUARD_DIGITS):
+        return function(mp.mpmathify(x))
+
+
+class SeriesTestCase(unittest.TestCase):
+    """TestCase with the agreement check of the series tests."""
+
+    def assertDigits(self, value, expected, digits, relative=False):
+        """Check that |value - expected| < 10**-digits, times |expected| if relative.
+
+        value and expected may be anything mpmath converts (float, Decimal,
+        Fraction, mpf, mpc, ...); the error is computed with GUARD_DIGITS
+        extra digits.
+        """
+        with mp.workdps(digits + GUARD_DIGITS):
+            expected = mp.mpmathify(expected)
+            error = abs(mp.mpmathify(value) - expected)
+            bound = mpf(10) ** -digits
+            if relative:
+                bound *= abs(expected)
+            self.assertLess(error, bound, f"{value} differs from {expected}")
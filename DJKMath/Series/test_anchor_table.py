@@ -0,0 +1,63 @@
+"""
+Test suite for anchor_table.py.
+Checks degree inputs evaluated from anchor angles.
+"""
+
+import unittest
+
+from mpmath import mp
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series import anchor_table
+from DJKMath.Series.exact_angle import DegreeAngle
+from DJKMath.Series.trigo_sin_cos_tan import sine_power_series, cosine_power_series
+
+
+class TestAnchorTable(SeriesTestCase):
+    """Test cases for degree inputs evaluated from anchor angles."""
+
+    def setUp(self):
+        anchor_table.clear_anchor_tables()
+
+    def test_matches_mpmath(self):
+        """Anchored values agree with mpmath in every quadrant."""
+        for precision in (20, 200):
+            for angle in ("30", "45.5", "-123.4567", "359.99", "1000000", "270"):
+                value, cos_value, _ = anchor_table.sincos_degrees(angle, precision)
+                x = reference(mp.radians, angle, precision)
+                self.assertDigits(value, reference(mp.sin, x, precision), precision - 1)
+                self.assertDigits(cos_value, reference(mp.cos, x, precision), precision - 1)
+
+    def test_degree_angle(self):
+        """Degrees, minutes and seconds use the anchors, also through the series."""
+        angle = DegreeAngle(-1000, 30, "12.345")
+        x = reference(mp.radians, angle.degrees, 60)
+        value, terms = anchor_table.sine_degrees(angle, 60)
+        self.assertDigits(value, reference(mp.sin, x, 60), 59)
+        self.assertEqual(sine_power_series(angle, 60), (value, terms))
+        value, terms = cosine_power_series(angle, 60)
+        self.assertDigits(value, reference(mp.cos, x, 60), 59)
+        self.assertEqual(anchor_table.anchor_table_info()[0][2], 1)
+
+    def test_high_precision(self):
+        """Anchors near 90° and their remainders converge at thousands of digits."""
+        angle = DegreeAngle(89, 30, 1)
+        x = reference(mp.radians, angle.degrees, 3000)
+        value, terms = sine_power_series(angle, 3000)
+        self.assertGreater(terms, 0)
+        self.assertDigits(value, reference(mp.sin, x, 3000), 2999)
+        value, _ = cosine_power_series(angle, 3000)
+        self.assertDigits(value, reference(mp.cos, x, 3000), 2999)
+
+    def test_lazy_per_precision(self):
+        """Only the anchors used are built, in one table per precision."""
+        anchor_table.sine_degrees("10.01", 30)
+        anchor_table.cosine_degrees("10.02", 30)
+        anchor_table.sine_degrees("10.01", 60, resolution=1)
+        info = anchor_table.anchor_table_info()
+        self.assertEqual(len(info), 2)
+        self.assertEqual(sorted(size for _, _, size in info), [1, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
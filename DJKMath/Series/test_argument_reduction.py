@@ -0,0 +1,37 @@
+"""
+Test suite for argument_reduction.py.
+Checks that large radian arguments are reduced without losing digits.
+"""
+
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.argument_reduction import reduce_argument
+from DJKMath.Series.trigo_sin_cos_tan import sine_power_series, cosine_power_series
+
+
+class TestArgumentReduction(SeriesTestCase):
+    """Test cases for reduction of large radian arguments."""
+
+    def test_huge_arguments(self):
+        """Huge angles keep every requested digit and converge quickly."""
+        precision = 30
+        for x in (mpf('1e50'), mpf(10) ** 300, mpf(-355)):
+            value, terms = sine_power_series(x, precision)
+            cos_value, cos_terms = cosine_power_series(x, precision)
+            self.assertDigits(value, reference(mp.sin, x, 480), precision - 1)
+            self.assertDigits(cos_value, reference(mp.cos, x, 480), precision - 1)
+            self.assertLess(max(terms, cos_terms), 20)
+
+    def test_reduced_range(self):
+        """The reduced argument lies in [-π/4, π/4]."""
+        with mp.workdps(40):
+            r, quadrant = reduce_argument(mpf('1e50'))
+            self.assertLessEqual(abs(r), mp.pi / 4)
+        self.assertIn(quadrant, range(4))
+
+
+if __name__ == '__main__':
+    unittest.main()
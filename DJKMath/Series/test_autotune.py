@@ -0,0 +1,103 @@
+"""
+Test suite for autotune.py.
+Checks the strategy registry, the calibrated dispatch table and its default.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series import autotune
+from DJKMath.Series.exact_angle import DegreeAngle
+
+
+class TestAutotune(SeriesTestCase):
+    """Test cases for the strategy registry and dispatch table."""
+
+    def use_dispatch_table(self, path):
+        """Point autotune at path until the end of the test."""
+        original = autotune.DISPATCH_PATH
+        autotune.DISPATCH_PATH = path
+        autotune._reset()
+
+        def restore():
+            autotune.DISPATCH_PATH = original
+            autotune._reset()
+        self.addCleanup(restore)
+
+    def test_strategies_agree(self):
+        """Every applicable strategy is accurate to the requested digits."""
+        for precision in (12, 40):
+            for x in (0.5, -2.5, mpf(7) / 3, 1e10):
+                references = (reference(mp.sin, x, precision), reference(mp.cos, x, precision))
+                for name in autotune.strategy_names():
+                    sine, cosine, applies = autotune._strategies[name]
+                    if not applies(x, precision):
+                        continue
+                    for function, expected in zip((sine, cosine), references):
+                        value, terms = function(x, precision)
+                        self.assertGreater(terms, 0)
+                        self.assertDigits(value, expected, precision - 1)
+
+    def test_calibrated_dispatch(self):
+        """A calibrated bucket's ranking is followed, skipping strategies that do not apply."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "dispatch.json")
+            data = autotune.calibrate(precisions=(50,), magnitudes=(0,), repeat=1, path=path)
+            ranking = data["table"]["sine"]["50:0"]
+            self.assertIn("taylor", ranking)
+            self.assertNotIn("float", ranking)
+            self.assertEqual(autotune.load_dispatch_table(path)["sine"]["50:0"], ranking)
+            data["table"]["sine"]["50:0"] = ["float", "symmetry"]
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump(data, handle)
+            self.use_dispatch_table(path)
+            x = mpf(1) / 3
+            self.assertEqual(autotune.choose_strategy("sine", x, 45), "symmetry")
+            value, _ = autotune.tuned_sine(x, 45)
+            self.assertDigits(value, reference(mp.sin, x, 45), 44)
+
+    def test_default_ranking(self):
+        """Without a dispatch table the fixed-point backend is never chosen."""
+        with tempfile.TemporaryDirectory() as folder:
+            self.use_dispatch_table(os.path.join(folder, "missing.json"))
+            self.assertEqual(autotune.choose_strategy("sine", mpf(2), 60), "taylor")
+            self.assertEqual(autotune.choose_strategy("cosine", mpf('1e-30'), 300),
+                             "plain_taylor")
+
+    def test_unbucketed_arguments(self):
+        """DegreeAngle and complex arguments, with no float magnitude, use "taylor"."""
+        angle = DegreeAngle(30, 0, 0)
+        self.assertEqual(autotune.choose_strategy("sine", angle, 40), "taylor")
+        value, _ = autotune.tuned_sine(angle, 40)
+        self.assertDigits(value, mpf(1) / 2, 39)
+        value, _ = autotune.tuned_cosine(2 + 1j, 40)
+        self.assertDigits(value, reference(mp.cos, 2 + 1j, 40), 39, relative=True)
+
+    def test_version_check(self):
+        """A dispatch table of another version is refused."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "dispatch.json")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write('{"version": 0, "table": {}}')
+            with self.assertRaises(ValueError):
+                autotune.load_dispatch_table(path)
+
+
+    def test_damaged_table(self):
+        """A damaged dispatch table file gives a warning and the default ranking."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "dispatch.json")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write('{"version": 1, "table"')
+            self.use_dispatch_table(path)
+            with self.assertWarns(UserWarning):
+                self.assertEqual(autotune.choose_strategy("sine", mpf(2), 60), "taylor")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+Test suite for binary_splitting.py.
+Checks sine, cosine and tangent of exact rational arguments.
+"""
+
+import unittest
+from fractions import Fraction
+
+from mpmath import mp
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.trigo_sin_cos_tan import (
+    sine_power_series,
+    cosine_power_series,
+    tangent_power_series
+)
+
+
+class TestBinarySplitting(SeriesTestCase):
+    """Test cases for exact rational arguments."""
+
+    def test_rational_arguments(self):
+        """Sine and cosine of p/q match mpmath, also at high precision."""
+        for precision in (50, 3000):
+            for x in (Fraction(1, 3), Fraction(-22, 7), 2):
+                value, _ = sine_power_series(x, precision, method="binary_splitting")
+                cos_value, _ = cosine_power_series(x, precision, method="binary_splitting")
+                self.assertDigits(value, reference(mp.sin, x, precision), precision)
+                self.assertDigits(cos_value, reference(mp.cos, x, precision), precision)
+
+    def test_tangent(self):
+        """Derived functions accept exact arguments."""
+        value, _, _ = tangent_power_series(Fraction(1, 2), 40, method="binary_splitting")
+        self.assertDigits(value, reference(mp.tan, Fraction(1, 2), 40), 38)
+
+    def test_float_rejected(self):
+        """Inexact arguments are refused."""
+        with self.assertRaises(TypeError):
+            sine_power_series(0.5, 20, method="binary_splitting")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Test suite for certified.py.
+Checks that the interval enclosures contain the true values and meet the tolerance.
+"""
+
+import unittest
+from fractions import Fraction
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series import certified
+
+
+class TestCertified(SeriesTestCase):
+    """Test cases for the certified interval enclosures."""
+
+    def assertEncloses(self, interval, value):
+        """Check that value lies in the interval."""
+        low, high = interval.a, interval.b
+        self.assertTrue(low <= value <= high, f"{value} not in {interval}")
+
+    def test_enclosures(self):
+        """Enclosures contain the true value and meet the tolerance."""
+        functions = [
+            (certified.sine_interval, mp.sin),
+            (certified.cosine_interval, mp.cos),
+            (certified.tangent_interval, mp.tan),
+            (certified.cotangent_interval, mp.cot),
+        ]
+        for x in (1, Fraction(355, 113), "0.1", 10**30):
+            for function, exact in functions:
+                result = function(x, "1e-60")
+                with mp.workdps(100):
+                    self.assertEncloses(result[0], reference(exact, x, 80))
+                    self.assertLessEqual(result[0].delta.b, mpf("1e-60"))
+
+    def test_relative_tolerance(self):
+        """A relative tolerance adapts to tiny values."""
+        interval, terms, prec = certified.sine_interval("1e-40", "1e-30", relative=True)
+        with mp.workdps(80):
+            self.assertEncloses(interval, mpf("1e-40"))
+            self.assertLessEqual(interval.delta.b, mpf("1e-70"))
+        self.assertLess(prec, 150)
+
+    def test_exact_pole(self):
+        """An exactly zero denominator is refused."""
+        with self.assertRaises(ValueError):
+            certified.cotangent_interval(0, "1e-10")
+
+
+if __name__ == '__main__':
+    unittest.main()
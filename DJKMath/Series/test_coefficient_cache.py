@@ -0,0 +1,45 @@
+"""
+Test suite for coefficient_cache.py.
+Checks the precision-keyed coefficient tables and their LRU eviction.
+"""
+
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series import coefficient_cache
+
+
+class TestCoefficientCache(unittest.TestCase):
+    """Test cases for the precision-keyed coefficient tables."""
+
+    def tearDown(self):
+        """Restore the default cache limit."""
+        coefficient_cache.MAX_CACHE_BYTES = 32 * 1024 * 1024
+        coefficient_cache.clear_coefficient_cache()
+
+    def test_values(self):
+        """Tables hold ±1/(2k+1)! and ±1/(2k)! at the requested precision."""
+        table = coefficient_cache.sine_coefficients(5, 200)
+        self.assertIs(table, coefficient_cache.sine_coefficients(3, 200))
+        with mp.workprec(200):
+            self.assertEqual(table[2], mpf(1) / 120)
+            self.assertEqual(coefficient_cache.cosine_coefficients(4, 200)[3], mpf(-1) / 720)
+
+    def test_lru_eviction(self):
+        """The least recently used precision is evicted once over the cap."""
+        coefficient_cache.clear_coefficient_cache()
+        coefficient_cache.MAX_CACHE_BYTES = 30000
+        coefficient_cache.sine_coefficients(50, 1000)
+        coefficient_cache.sine_coefficients(50, 2000)
+        coefficient_cache.sine_coefficients(50, 1000)
+        coefficient_cache.sine_coefficients(50, 3000)
+        precisions, used = coefficient_cache.coefficient_cache_info()
+        self.assertNotIn(2000, precisions)
+        self.assertIn(3000, precisions)
+        self.assertLessEqual(used, coefficient_cache.MAX_CACHE_BYTES)
+        self.assertEqual(used, sum(50 * coefficient_cache._entry_bytes(prec) for prec in precisions))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Test suite for complex_series.py.
+Checks sine, cosine and tangent of complex arguments.
+"""
+
+import unittest
+
+from mpmath import mp
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.complex_series import complex_sincos, complex_tangent, complex_sincos_batch
+from DJKMath.Series.trigo_sin_cos_tan import (
+    sine_power_series,
+    cosine_power_series,
+    tangent_power_series,
+    sine_power_series_batch
+)
+
+
+class TestComplexSeries(SeriesTestCase):
+    """Test cases for complex arguments."""
+
+    def test_values(self):
+        """sin, cos and tan of complex and mpc arguments match mpmath, both methods."""
+        arguments = (1 + 2j, 3 - 4j, 0.5j, 40 - 30j, mp.mpc('1.3', '-0.2'), 1e20 + 1j)
+        for z in arguments:
+            for method in ("taylor", "paterson_stockmeyer"):
+                s, c, _ = complex_sincos(z, 50, method)
+                t, _ = complex_tangent(z, 50, method)
+                for value, function in ((s, mp.sin), (c, mp.cos), (t, mp.tan)):
+                    self.assertDigits(value, reference(function, z, 60), 48, relative=True)
+
+    def test_power_series_dispatch(self):
+        """The sine, cosine and tangent series take complex arguments."""
+        s, c, _ = complex_sincos(1 + 2j, 30)
+        self.assertEqual(sine_power_series(1 + 2j, 30)[0], s)
+        self.assertEqual(cosine_power_series(1 + 2j, 30)[0], c)
+        self.assertEqual(tangent_power_series(1 + 2j, 30)[2], 0)
+        with self.assertRaises(ValueError):
+            sine_power_series(1 + 2j, 30, method="minimax")
+
+    def test_batch(self):
+        """A get_bunch_complex list gives the same values in one call."""
+        values = [1 + 2j, 3 - 4j, 5 + 0j, 1 - 4j]
+        batch = complex_sincos_batch(values, 40)
+        self.assertEqual(len(batch), len(values))
+        for z, (s, c, terms) in zip(values, batch):
+            self.assertEqual((s, c, terms), complex_sincos(z, 40))
+        streamed = [value for value, _ in sine_power_series_batch(values, 40)]
+        self.assertEqual(streamed, [s for s, _, _ in batch])
+
+
+if __name__ == '__main__':
+    unittest.main()
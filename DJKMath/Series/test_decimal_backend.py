@@ -0,0 +1,50 @@
+"""
+Test suite for decimal_backend.py.
+Checks the decimal module backend and the decimal DMS conversion.
+"""
+
+import decimal
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.trigo_sin_cos_tan import (
+    sine_power_series,
+    cosine_power_series,
+    tangent_power_series,
+    process_degree
+)
+
+
+class TestDecimalBackend(SeriesTestCase):
+    """Test cases for the decimal module backend."""
+
+    def test_matches_mpmath(self):
+        """Decimal results agree with mpmath and leave the decimal context alone."""
+        caller_precision = decimal.getcontext().prec
+        for precision in (20, 100):
+            for x in ("0.5", "-2.5", "1e10", 3):
+                for func, function in ((sine_power_series, mp.sin), (cosine_power_series, mp.cos)):
+                    value, terms = func(x, precision, backend="decimal")
+                    self.assertIsInstance(value, decimal.Decimal)
+                    self.assertEqual(terms, func(x, precision, backend="mpmath")[1])
+                    expected = reference(function, x, precision)
+                    with mp.workdps(precision + 20):
+                        error = abs(mpf(str(value)) - expected)
+                        self.assertLess(error, 2 * mpf(10) ** -precision)
+        self.assertEqual(decimal.getcontext().prec, caller_precision)
+
+    def test_tangent_and_conversion(self):
+        """Derived ratios and the DMS conversion stay in decimal."""
+        value, _, _ = tangent_power_series("1.2", 40, backend="decimal")
+        self.assertDigits(value, reference(mp.tan, "1.2", 40), 38)
+        with redirect_stdout(io.StringIO()):
+            radian = process_degree(400, 30, 0, backend="decimal", precision=40)
+        self.assertDigits(radian, reference(mp.radians, mpf(81) / 2, 40), 38)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Test suite for double_double.py.
+Checks the double-double backend between 16 and 31 digits.
+"""
+
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series import double_double
+from DJKMath.Series.exact_angle import DegreeAngle
+from DJKMath.Series.trigo_numpy import np
+from DJKMath.Series.trigo_sin_cos_tan import (
+    sine_power_series,
+    cosine_power_series,
+    tangent_power_series,
+    sine_power_series_batch
+)
+
+
+class TestDoubleDouble(SeriesTestCase):
+    """Test cases for the double-double backend between 16 and 31 digits."""
+
+    def test_matches_mpmath(self):
+        """Values and term counts agree with the mpmath backend."""
+        for precision in (16, 24, 31):
+            for x in (0.0, 1e-9, 0.7, -2.5, 1e6, 1e300):
+                for func in (sine_power_series, cosine_power_series):
+                    value, terms = func(x, precision)
+                    expected, expected_terms = func(x, precision, backend="mpmath")
+                    self.assertEqual(terms, expected_terms)
+                    self.assertDigits(value, expected, precision)
+
+    def test_derived_ratios(self):
+        """Tangent is divided in double-double and stays accurate."""
+        value, _, _ = tangent_power_series(2.5, 30)
+        self.assertDigits(value, reference(mp.tan, 2.5, 30), 29)
+        with self.assertRaises(ValueError):
+            sine_power_series(1.0, 40, backend="double_double")
+
+    def test_batch_values_are_callers(self):
+        """Batch results do not follow the thread's context into a later call."""
+        with mp.workdps(30):
+            (value, _), = sine_power_series_batch([0.5], 25)
+            (special, _), = sine_power_series_batch([DegreeAngle(30)], 25)
+            sine_power_series(mpf(1) / 3, 5)
+            self.assertDigits(value * 1, reference(mp.sin, 0.5, 25), 24)
+            self.assertDigits(special * 1, mpf(1) / 2, 29)
+
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_array(self):
+        """The vectorized kernel matches the scalar one element by element."""
+        x = np.array([0.0, 0.3, -2.5, 1e5, 1e300, np.nan])
+        (hi, lo), terms = double_double.dd_sine_array(x, 31)
+        for i, value in enumerate(x[:-1]):
+            (s_hi, s_lo), s_terms = double_double.dd_sine(float(value), 31)
+            self.assertEqual(terms[i], s_terms)
+            self.assertLess(abs((hi[i] - s_hi) + (lo[i] - s_lo)), 1e-31)
+        self.assertTrue(np.isnan(hi[-1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Test suite for exact_angle.py.
+Checks exact DMS angles, closed forms at special angles and exact poles.
+"""
+
+import io
+import sys
+import types
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.exact_angle import DegreeAngle, degrees_to_radians, special_sincos
+from DJKMath.Series.trigo_sin_cos_tan import (
+    sine_power_series,
+    cosine_power_series,
+    tangent_power_series,
+    cosecant_power_series,
+    cotangent_power_series,
+    process_degree
+)
+
+
+class TestExactAngle(SeriesTestCase):
+    """Test cases for exact DMS angles, closed forms and poles."""
+
+    def test_conversion_rounds_once(self):
+        """DMS with decimal seconds converts to radians at full precision."""
+        with redirect_stdout(io.StringIO()):
+            radian = process_degree(400, 30, 0.1, precision=60)
+        expected = reference(mp.radians, DegreeAngle(40, 30, "0.1").degrees, 60)
+        self.assertDigits(radian, expected, 59)
+
+    def test_special_angles(self):
+        """Multiples of 15° and 18° come from closed forms in 0 terms."""
+        s, c, s_text, c_text = special_sincos(DegreeAngle(240), 30)
+        self.assertEqual((s_text, c_text), ("-√3/2", "-1/2"))
+        for degree in range(-360, 721, 3):
+            angle = DegreeAngle(degree)
+            x = degrees_to_radians(angle, 70)
+            for func, function in ((sine_power_series, mp.sin), (cosine_power_series, mp.cos)):
+                value, terms = func(angle, 50)
+                self.assertDigits(value, reference(function, x, 50), 49)
+                if degree % 15 == 0 or degree % 18 == 0:
+                    self.assertEqual(terms, 0)
+
+    def test_exact_poles(self):
+        """Poles are found exactly; an angle a hair away is evaluated."""
+        console = types.SimpleNamespace(wait_for_key=lambda: None)
+        with mock.patch.dict(sys.modules, {"Utils": console}):
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(tangent_power_series(DegreeAngle(-270), 50)[0], "undefined")
+                self.assertEqual(cotangent_power_series(DegreeAngle(540), 50)[0], "undefined")
+                self.assertEqual(cosecant_power_series(0, 30)[0], "undefined")
+                value, _, _ = tangent_power_series(DegreeAngle(89, 59, "59.9999999999"), 30)
+        x = reference(mp.radians, DegreeAngle(89, 59, "59.9999999999").degrees, 30)
+        self.assertDigits(value, reference(mp.tan, x, 30), 10, relative=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
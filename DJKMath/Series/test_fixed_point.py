@@ -0,0 +1,55 @@
+"""
+Test suite for fixed_point.py.
+Checks the fixed-point integer backend against the mpf loops.
+"""
+
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.trigo_sin_cos_tan import (
+    sine_power_series,
+    sincos_power_series,
+    tangent_power_series,
+    cosecant_power_series,
+    cotangent_power_series,
+    sine_power_series_batch
+)
+
+
+class TestFixedBackend(SeriesTestCase):
+    """Test cases for the fixed-point integer backend."""
+
+    def test_matches_mpmath(self):
+        """Values and term counts agree with the mpf loops."""
+        for precision in (50, 500):
+            with mp.workdps(precision):
+                angles = (mpf(0), mpf(1) / 7, mpf(-2), mpf('1e10'))
+            for x in angles:
+                expected = sincos_power_series(x, precision, backend="mpmath")
+                value = sincos_power_series(x, precision, backend="fixed")
+                self.assertEqual(value[2:], expected[2:])
+                for got, want in zip(value[:2], expected[:2]):
+                    self.assertDigits(got, want, precision - 1)
+
+    def test_tiny_arguments(self):
+        """Small arguments keep their significant digits in sin, csc and cot."""
+        for x in (mpf('1e-40'), mpf('1e-12')):
+            value, _ = sine_power_series(x, 30, backend="fixed")
+            self.assertDigits(value, reference(mp.sin, x, 40), 29, relative=True)
+        x = mpf('1e-20')
+        for func, function in ((cosecant_power_series, mp.csc), (cotangent_power_series, mp.cot)):
+            value = func(x, 30, backend="fixed")[0]
+            self.assertDigits(value, reference(function, x, 40), 29, relative=True)
+
+    def test_derived_and_batch(self):
+        """Tangent and the batch functions accept the backend."""
+        value, _, _ = tangent_power_series(mpf(1), 60, backend="fixed")
+        self.assertDigits(value, reference(mp.tan, 1, 60), 58)
+        rows = list(sine_power_series_batch([1, 2], 60, backend="fixed"))
+        self.assertEqual(rows[1][1], sine_power_series(2, 60, backend="mpmath")[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Test suite for float_kernel.py.
+Checks the float64 fast path the series take at low precision.
+"""
+
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.trigo_sin_cos_tan import sine_power_series, sincos_power_series
+
+
+class TestFloatBackend(SeriesTestCase):
+    """Test cases for the float64 fast path at low precision."""
+
+    def test_dispatch(self):
+        """Precision <= 15 with an exact float argument gives a plain float."""
+        value, terms = sine_power_series(0.5, 15)
+        self.assertIsInstance(value, float)
+        mpf_value, mpf_terms = sine_power_series(0.5, 15, backend="mpmath")
+        self.assertNotIsInstance(mpf_value, float)
+        self.assertEqual(terms, mpf_terms)
+        self.assertLess(abs(value - mpf_value), 1e-15)
+        with mp.workprec(53):
+            third = mpf(1) / 3
+        self.assertIsInstance(sine_power_series(third, 12)[0], float)
+        with mp.workprec(80):
+            third = mpf(1) / 3  # Would lose bits as a float
+        self.assertNotIsInstance(sine_power_series(third, 12)[0], float)
+        self.assertNotIsInstance(sine_power_series(0.5, 16)[0], float)
+
+    def test_accuracy(self):
+        """Cody-Waite and Payne-Hanek reduction keep full accuracy."""
+        worst = 6381956970095103 * 2.0**797  # Closest double to a multiple of π/2
+        for x in (0.1, -2.5, 1e6, -1e22, 1e300, worst):
+            s, c, _, _ = sincos_power_series(x, 15)
+            self.assertLess(abs(s - reference(mp.sin, x, 360)), 2e-15)
+            self.assertLess(abs(c - reference(mp.cos, x, 360)), 2e-15)
+        value, _ = sine_power_series(worst, 15)
+        self.assertDigits(value, reference(mp.sin, worst, 360), 14, relative=True)
+
+    def test_forced_float(self):
+        """The float backend refuses precisions it cannot honour."""
+        with self.assertRaises(ValueError):
+            sine_power_series(1.0, 20, backend="float")
+        with self.assertRaises(ValueError):
+            sine_power_series(1.0, 10, backend="double")
+
+
+if __name__ == '__main__':
+    unittest.main()
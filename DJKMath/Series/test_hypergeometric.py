@@ -0,0 +1,76 @@
+"""
+Test suite for hypergeometric.py.
+Checks the shared series engine and exp, sinh and cosh.
+"""
+
+import unittest
+from fractions import Fraction
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series import hypergeometric
+
+
+class TestHypergeometric(SeriesTestCase):
+    """Test cases for the shared series engine and exp, sinh, cosh."""
+
+    def test_exp_sinh_cosh(self):
+        """exp, sinh and cosh match mpmath for small, large and negative x, both strategies."""
+        references = ((hypergeometric.exp_power_series, mp.exp),
+                      (hypergeometric.sinh_power_series, mp.sinh),
+                      (hypergeometric.cosh_power_series, mp.cosh))
+        for x in (mpf('1e-30'), mpf('-0.9'), mpf('2.5'), mpf(-40), mpf(300)):
+            for strategy in hypergeometric.STRATEGIES:
+                for func, function in references:
+                    value, _ = func(x, 50, strategy)
+                    self.assertDigits(value, reference(function, x, 50), 49, relative=True)
+
+    def test_strategies_agree(self):
+        """Paterson-Stockmeyer and Taylor give the same sine and cosine sums."""
+        for name in ("sine", "cosine"):
+            taylor, taylor_terms = hypergeometric.hypergeometric_series(name, '0.7', 60)
+            ps, ps_terms = hypergeometric.hypergeometric_series(
+                name, '0.7', 60, strategy="paterson_stockmeyer")
+            self.assertEqual(taylor_terms, ps_terms)
+            self.assertDigits(taylor, ps, 59)
+
+    def test_ratio_tables_cached(self):
+        """The integer inverse ratios are built once per series and extended in place."""
+        hypergeometric.hypergeometric_series("cosine", '0.7', 200, strategy="paterson_stockmeyer")
+        inverses = hypergeometric._inverse_ratio_table("cosine", 1)
+        self.assertEqual(inverses[:3], [-2, -12, -30])
+        hypergeometric.hypergeometric_series("cosine", '0.7', 2000, strategy="paterson_stockmeyer")
+        self.assertIs(hypergeometric._inverse_ratio_table("cosine", len(inverses)), inverses)
+
+    def test_registration(self):
+        """Names are unique, and PS is refused for non-unit ratios."""
+        self.assertIn("exp", hypergeometric.series_names())
+        with self.assertRaises(ValueError):
+            hypergeometric.register_series("sine", lambda k: Fraction(1, k + 1))
+        hypergeometric.register_series("test_geometric", lambda k: Fraction(2, 3), squared=False)
+        self.addCleanup(hypergeometric.unregister_series, "test_geometric")
+        value, _ = hypergeometric.hypergeometric_series("test_geometric", '0.5', 30)
+        self.assertDigits(value, Fraction(3, 2), 29)
+        with self.assertRaises(ValueError):
+            hypergeometric.hypergeometric_series("test_geometric", '0.5', 30,
+                                                 strategy="paterson_stockmeyer")
+
+    def test_unregister(self):
+        """An unregistered name is gone with its tables and can take another ratio."""
+        hypergeometric.register_series("test_halves", lambda k: Fraction(1, 2), squared=False)
+        hypergeometric.hypergeometric_series("test_halves", '0.5', 30)
+        hypergeometric.unregister_series("test_halves")
+        self.assertNotIn("test_halves", hypergeometric.series_names())
+        self.assertNotIn("test_halves", hypergeometric._exact)
+        self.assertNotIn("test_halves", hypergeometric._log_ratios)
+        with self.assertRaises(ValueError):
+            hypergeometric.unregister_series("test_halves")
+        hypergeometric.register_series("test_halves", lambda k: Fraction(1, 4), squared=False)
+        self.addCleanup(hypergeometric.unregister_series, "test_halves")
+        value, _ = hypergeometric.hypergeometric_series("test_halves", '0.5', 30)
+        self.assertDigits(value, Fraction(8, 7), 29)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Test suite for inverse_trig.py.
+Checks the Newton-iterated arcsine, arccosine and arctangent.
+"""
+
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.inverse_trig import arcsine, arccosine, arctangent
+
+
+class TestInverseTrig(SeriesTestCase):
+    """Test cases for the Newton-iterated inverse functions."""
+
+    def test_values(self):
+        """arcsin, arccos and arctan match mpmath across their domains."""
+        precision = 120
+        with mp.workdps(precision + 20):
+            arguments = [mpf(0), mpf('1e-30'), mpf('0.3'), mpf('-0.7'), mpf(1),
+                         mpf(-1), 1 - mpf('1e-40')]
+        for x in arguments:
+            for func, function in ((arcsine, mp.asin), (arccosine, mp.acos),
+                                   (arctangent, mp.atan)):
+                value, _ = func(x, precision)
+                expected = reference(function, x, precision)
+                with mp.workdps(precision + 20):
+                    self.assertLessEqual(abs(value - expected),
+                                         abs(expected) * mpf(10) ** (1 - precision))
+
+    def test_large_tangent(self):
+        """Large and infinite tangents use the complement identity."""
+        for x in ('1e30', '-7', mpf('inf')):
+            value, _ = arctangent(x, 60)
+            self.assertDigits(value, reference(mp.atan, x, 60), 59, relative=True)
+
+    def test_domain(self):
+        """Arguments outside [-1, 1] are refused."""
+        with self.assertRaises(ValueError):
+            arcsine('1.5', 30)
+        with self.assertRaises(ValueError):
+            arccosine(-2, 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Test suite for minimax.py.
+Checks the Remez minimax tables and their fallback to Taylor.
+"""
+
+import os
+import tempfile
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase
+from DJKMath.Series import minimax
+from DJKMath.Series.trigo_sin_cos_tan import sine_power_series, cosine_power_series
+
+
+class TestMinimax(SeriesTestCase):
+    """Test cases for the Remez minimax tables."""
+
+    def test_matches_taylor(self):
+        """Tabulated precisions agree with Taylor in fewer terms."""
+        for precision in (30, 100):
+            for x in (mpf(3) / 4, mpf(-2), mpf('1e10')):
+                for func in (sine_power_series, cosine_power_series):
+                    expected, expected_terms = func(x, precision, backend="mpmath")
+                    value, terms = func(x, precision, method="minimax")
+                    self.assertLess(terms, expected_terms)
+                    self.assertDigits(value, expected, precision - 1)
+
+    def test_low_precision_falls_back(self):
+        """Below the tables' reach the Taylor term counts are kept."""
+        x = mpf(3) / 4
+        for precision in (5, 8):
+            self.assertIsNone(minimax.minimax_coefficients("sin", precision))
+            for func in (sine_power_series, cosine_power_series):
+                expected, expected_terms = func(x, precision, backend="mpmath")
+                value, terms = func(x, precision, method="minimax")
+                self.assertEqual(terms, expected_terms)
+                self.assertDigits(value, expected, precision - 1)
+        self.assertIsNotNone(minimax.minimax_coefficients("sin", 16))
+
+    def test_remez_levels_error(self):
+        """A low-degree run equioscillates and beats the Taylor polynomial."""
+        with mp.workdps(30):
+            coefficients, error = minimax.remez("cos", 3)
+            r = mpf(minimax.INTERVAL)
+            taylor_error = abs(mp.cos(r) - (1 - r ** 2 / 2 + r ** 4 / 24 - r ** 6 / 720))
+            self.assertLess(error, taylor_error / 10)
+            self.assertLess(abs(coefficients[0] - 1), error * 2)
+
+    def test_version_check(self):
+        """A table file of another version is refused."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "tables.json")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write('{"version": 0, "interval": "0.7854", "tables": {}}')
+            with self.assertRaises(ValueError):
+                minimax.load_tables(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
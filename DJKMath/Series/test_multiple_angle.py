@@ -0,0 +1,42 @@
+"""
+Test suite for multiple_angle.py.
+Checks argument scaling with triple-angle reconstruction.
+"""
+
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.multiple_angle import sine_triple_angle, cosine_triple_angle
+from DJKMath.Series.trigo_sin_cos_tan import sine_power_series
+
+
+class TestTripleAngle(SeriesTestCase):
+    """Test cases for argument scaling with triple-angle reconstruction."""
+
+    def test_matches_mpmath(self):
+        """Rebuilt values are accurate, including tiny and large angles."""
+        for precision in (20, 500):
+            with mp.workdps(precision):
+                angles = (mpf("0.7"), mpf("-2.5"), mpf("1e-30"), mpf(123456))
+            for x in angles:
+                value, _, _ = sine_triple_angle(x, precision)
+                cos_value, _, _ = cosine_triple_angle(x, precision)
+                self.assertDigits(value, reference(mp.sin, x, precision), precision - 1)
+                self.assertDigits(cos_value, reference(mp.cos, x, precision), precision - 1)
+
+    def test_fewer_terms(self):
+        """At high precision the scaled series is much shorter than Taylor."""
+        with mp.workdps(500):
+            x = mpf(7) / 9
+        _, taylor_terms = sine_power_series(x, 500)
+        value, terms, steps = sine_triple_angle(x, 500)
+        self.assertGreater(steps, 0)
+        self.assertLess(2 * terms, taylor_terms)
+        method_value, _ = sine_power_series(x, 500, method="triple_angle")
+        self.assertEqual(method_value, value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Test suite for parallel_sweep.py.
+Checks the process-pool sweep against the serial batch functions.
+"""
+
+import unittest
+from fractions import Fraction
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.parallel_sweep import parallel_sweep, _pack, _unpack
+from DJKMath.Series.exact_angle import DegreeAngle
+from DJKMath.Series.trigo_numpy import np
+from DJKMath.Series.trigo_sin_cos_tan import sine_power_series_batch, tangent_power_series
+
+
+class TestParallelSweep(SeriesTestCase):
+    """Test cases for the process-pool sweep."""
+
+    def test_matches_serial_in_order(self):
+        """Chunks from several processes come back exact and in input order."""
+        with mp.workdps(15):
+            angles = [mpf(k) / 13 for k in range(-40, 40)] + [Fraction(1, 3), 7]
+        rows = parallel_sweep(angles, 40, workers=2, chunk_size=7)
+        self.assertEqual(rows, list(sine_power_series_batch(angles, 40)))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_array(self):
+        """A NumPy array of angles gives the rows of the same list of floats."""
+        angles = np.linspace(-3.0, 3.0, 25)
+        rows = parallel_sweep(angles, 40, workers=2, chunk_size=5)
+        self.assertEqual(rows, parallel_sweep(angles.tolist(), 40, workers=1))
+
+    def test_functions(self):
+        """sincos and tangent rows have the shapes of the scalar functions."""
+        sin_val, cos_val, _, _ = parallel_sweep([1], 30, "sincos")[0]
+        tan_val, _, _ = parallel_sweep([1], 30, "tangent")[0]
+        self.assertDigits(sin_val, reference(mp.sin, 1, 30), 29)
+        self.assertDigits(cos_val, reference(mp.cos, 1, 30), 29)
+        self.assertDigits(tan_val, reference(mp.tan, 1, 30), 29)
+        with self.assertRaises(ValueError):
+            parallel_sweep([1], 30, "arcsine")
+
+    def test_tangent_poles_and_tuples(self):
+        """Tangent rows use the library's pole test; tuples survive the trip."""
+        with mp.workdps(40):
+            near_pole = mp.pi / 2
+        rows = parallel_sweep([near_pole, DegreeAngle(90), 1], 30, "tangent")
+        self.assertEqual([row[0] for row in rows[:2]], ["undefined", "undefined"])
+        self.assertEqual(rows[2], tangent_power_series(1, 30))
+        self.assertEqual(_unpack(_pack((1, 2))), (1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+"""
+Test suite for paterson_stockmeyer.py.
+Checks the baby-step/giant-step evaluation method against the Taylor loops.
+"""
+
+import unittest
+
+from mpmath import mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase
+from DJKMath.Series.trigo_sin_cos_tan import sine_power_series, cosine_power_series
+
+
+class TestPatersonStockmeyer(SeriesTestCase):
+    """Test cases for the baby-step/giant-step evaluation method."""
+
+    def test_matches_taylor(self):
+        """Both methods agree in value and term count."""
+        for precision in (30, 400):
+            for x in (mpf(0), mpf(1) / 3, mpf(-2), mpf('1e10')):
+                for func in (sine_power_series, cosine_power_series):
+                    expected, expected_terms = func(x, precision)
+                    value, terms = func(x, precision, method="paterson_stockmeyer")
+                    self.assertEqual(terms, expected_terms)
+                    self.assertDigits(value, expected, precision - 1)
+
+    def test_unknown_method(self):
+        """An unknown method name is rejected."""
+        with self.assertRaises(ValueError):
+            sine_power_series(mpf(1), 20, method="horner")
+
+
+if __name__ == '__main__':
+    unittest.main()
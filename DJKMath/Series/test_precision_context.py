@@ -0,0 +1,62 @@
+"""
+Test suite for precision_context.py.
+Checks that the series run in their own context and never touch mp.dps.
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.argument_reduction import reduce_argument, normalize_radian
+from DJKMath.Series.anchor_table import sine_degrees
+from DJKMath.Series.trigo_sin_cos_tan import (
+    sine_power_series,
+    sincos_power_series,
+    tangent_power_series
+)
+
+
+class TestPrecisionContext(SeriesTestCase):
+    """Test cases for running the series without touching mp.dps."""
+
+    def test_caller_precision_untouched(self):
+        """The global precision survives every public entry point."""
+        mp.dps = 15
+        x = mpf(2) / 3
+        sine_power_series(x, 80)
+        sincos_power_series(x, 80, method="paterson_stockmeyer")
+        tangent_power_series(x, 60)
+        reduce_argument(mpf(10) ** 30, 50)
+        sine_degrees(33, 70)
+        self.assertEqual(mp.dps, 15)
+
+    def test_default_precision_is_callers(self):
+        """precision=None means the caller's mp.dps, whatever ran before in the thread."""
+        expected = reference(lambda x: mp.fmod(x, 2 * mp.pi), '1e30', 60)
+        for previous in (15, 300):
+            sine_power_series(mpf(1) / 3, previous, backend="mpmath")
+            with mp.workdps(50):
+                value = normalize_radian(mpf('1e30'))
+            self.assertDigits(value, expected, 48)
+
+    def test_arguments_used_exactly(self):
+        """An argument built at high precision is not rounded to mp.dps."""
+        with mp.workdps(60):
+            x = mpf(1) / 3
+        mp.dps = 15
+        value, _ = sine_power_series(x, 60)
+        self.assertDigits(value, reference(mp.sin, x, 60), 59)
+
+    def test_threads(self):
+        """Threads at different precisions do not disturb each other."""
+        jobs = [(mpf(k) / 7, 20 + 30 * (k % 4)) for k in range(1, 25)]
+        serial = [sine_power_series(x, precision) for x, precision in jobs]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            threaded = list(pool.map(lambda job: sine_power_series(*job), jobs))
+        self.assertEqual(threaded, serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Test suite for progressive.py.
+Checks the progressive-refinement generators.
+"""
+
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.progressive import (
+    sine_power_series_progressive,
+    cosine_power_series_progressive
+)
+from DJKMath.Series.trigo_sin_cos_tan import sine_power_series, cosine_power_series
+
+
+class TestProgressive(SeriesTestCase):
+    """Test cases for the progressive-refinement generators."""
+
+    def test_refinements(self):
+        """Each value is good to its digits; the last equals the blocking call."""
+        for x in (mpf(1) / 3, mpf(-2), mpf('1e10')):
+            for generator, func, function in (
+                (sine_power_series_progressive, sine_power_series, mp.sin),
+                (cosine_power_series_progressive, cosine_power_series, mp.cos),
+            ):
+                expected, expected_terms = func(x, 200, backend="mpmath")
+                exact = reference(function, x, 200)
+                for every in (None, 7):
+                    refinements = list(generator(x, 200, every=every))
+                    self.assertGreater(len(refinements), 3)
+                    self.assertEqual(refinements[-1], (expected, expected_terms, 200))
+                    terms = [item[1] for item in refinements]
+                    self.assertEqual(terms, sorted(terms))
+                    with mp.workdps(220):
+                        for value, _, digits in refinements:
+                            self.assertLessEqual(abs(value - exact), mpf(10) ** -digits)
+
+    def test_early_stop(self):
+        """Stopping after the first value sums only a few terms."""
+        refinements = sine_power_series_progressive(mpf(1), 5000)
+        _, terms, digits = next(refinements)
+        refinements.close()
+        self.assertGreaterEqual(digits, 10)
+        self.assertLess(terms, 15)
+
+    def test_invalid_arguments(self):
+        """Bad arguments are refused when the generator is created."""
+        with self.assertRaises(ValueError):
+            sine_power_series_progressive(1, 0)
+        with self.assertRaises(ValueError):
+            cosine_power_series_progressive(1, 20, every=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
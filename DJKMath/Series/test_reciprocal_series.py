@@ -0,0 +1,66 @@
+"""
+Test suite for reciprocal_series.py.
+Checks the direct tangent, secant, cosecant and cotangent series.
+"""
+
+import unittest
+from fractions import Fraction
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series import reciprocal_series
+from DJKMath.Series.trigo_sin_cos_tan import tangent_power_series, sincos_power_series
+
+
+class TestReciprocalSeries(SeriesTestCase):
+    """Test cases for the direct tangent, secant, cosecant and cotangent series."""
+
+    def test_exact_numbers(self):
+        """Bernoulli and Euler numbers from the zigzag triangle are exact."""
+        self.assertEqual(reciprocal_series.zigzag_numbers(8), [1, 1, 1, 2, 5, 16, 61, 272])
+        self.assertEqual(reciprocal_series.bernoulli_number(12), Fraction(-691, 2730))
+        self.assertEqual(reciprocal_series.bernoulli_number(7), 0)
+        self.assertEqual(reciprocal_series.euler_number(10), -50521)
+
+    def test_direct_values(self):
+        """The forced direct series match mpmath in every quadrant."""
+        references = {"tangent": mp.tan, "secant": mp.sec,
+                      "cosecant": mp.csc, "cotangent": mp.cot}
+        for x in (mpf('1e-20'), mpf('0.3'), mpf(-2), mpf('1e15')):
+            for func, function in references.items():
+                value, _ = reciprocal_series.direct_series(func, x, 60, force=True)
+                self.assertDigits(value, reference(function, x, 60), 59, relative=True)
+
+    def test_cost_switch(self):
+        """Small reduced angles take the direct series, r near π/4 the quotient."""
+        self.assertIsNotNone(reciprocal_series.direct_series("tangent", mpf('0.01'), 100))
+        self.assertIsNone(reciprocal_series.direct_series("tangent", mpf('0.78'), 100))
+        x = mpf('0.01')
+        value, _, cos_terms = tangent_power_series(x, 100)
+        self.assertEqual(cos_terms, 0)
+        self.assertDigits(value, reference(mp.tan, x, 100), 101)
+        for func in ("secant", "cosecant"):
+            self.assertIsNone(reciprocal_series.direct_series(func, x, 100))
+
+    def test_chosen_direct_is_cheaper(self):
+        """Where the direct series is chosen, its counted terms cost less than the quotient's."""
+        for precision in (50, 200):
+            for x in (mpf('0.7'), mpf('0.05'), mpf('0.001'), mpf('1e-8')):
+                for func in ("tangent", "cotangent"):
+                    chosen = reciprocal_series.direct_series(func, x, precision)
+                    if chosen is None:
+                        continue
+                    _, terms = chosen
+                    _, _, sin_terms, cos_terms = sincos_power_series(x, precision)
+                    direct = (reciprocal_series.DIRECT_SETUP_COST
+                              + reciprocal_series.DIRECT_TERM_COST * terms)
+                    if func == "cotangent":
+                        direct += reciprocal_series.DIVISION_COST  # the leading 1/r
+                    quotient = (reciprocal_series.PAIR_TERM_COST * max(sin_terms, cos_terms)
+                                + reciprocal_series.DIVISION_COST)
+                    self.assertLess(direct, quotient, (func, x, precision))
+
+
+if __name__ == '__main__':
+    unittest.main()
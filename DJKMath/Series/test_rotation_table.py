@@ -0,0 +1,68 @@
+"""
+Test suite for rotation_table.py.
+Checks the recurrence-based angle grids, the CSV writer and the array filler.
+"""
+
+import os
+import tempfile
+import unittest
+from fractions import Fraction
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.exact_angle import DegreeAngle
+from DJKMath.Series.rotation_table import (
+    sincos_table,
+    write_sincos_table,
+    fill_sincos_table
+)
+from DJKMath.Series.trigo_sin_cos_tan import sincos_power_series
+
+
+class TestRotationTable(SeriesTestCase):
+    """Test cases for the recurrence-based angle grids."""
+
+    def test_degree_grid(self):
+        """One-second steps agree with the series at every row, across anchors."""
+        rows = list(sincos_table(DegreeAngle(29, 59, 0).degrees, Fraction(1, 3600), 300, 40,
+                                 anchor_every=128))
+        self.assertEqual(len(rows), 300)
+        self.assertEqual(rows[60][1], mpf(1) / 2)  # 30°, anchored by its closed form
+        for n in range(0, 300, 13):
+            angle = DegreeAngle(29, 59, n)
+            s, c, _, _ = sincos_power_series(angle, 40, backend="mpmath")
+            self.assertDigits(rows[n][1], s, 39)
+            self.assertDigits(rows[n][2], c, 39)
+            self.assertDigits(rows[n][0], angle.degrees, 38)
+
+    def test_radian_grid(self):
+        """A coarse radian grid over several turns stays within one unit."""
+        rows = sincos_table("-1.5", "0.37", 200, 30, unit="radian", anchor_every=100)
+        with mp.workdps(50):
+            angles = [mpf("-1.5") + n * mpf("0.37") for n in range(200)]
+        for (_, s, c), angle in zip(rows, angles):
+            self.assertDigits(s, reference(mp.sin, angle, 30), 29)
+            self.assertDigits(c, reference(mp.cos, angle, 30), 29)
+
+    def test_streaming(self):
+        """The CSV writer and the array filler produce the generator's rows."""
+        rows = list(sincos_table(0, "0.5", 20, 25))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.csv")
+            self.assertEqual(write_sincos_table(path, 0, "0.5", 20, 25), 20)
+            with open(path, encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+        self.assertEqual(lines[0], "angle,sin,cos")
+        self.assertEqual(len(lines), 21)
+        self.assertEqual(lines[5].split(",")[1], mp.nstr(rows[4][1], 25, strip_zeros=False))
+        sines, cosines = [None] * 20, [None] * 20
+        fill_sincos_table(sines, cosines, 0, "0.5", 25)
+        self.assertEqual(sines, [row[1] for row in rows])
+        self.assertEqual(cosines, [row[2] for row in rows])
+        with self.assertRaises(ValueError):
+            sincos_table(0, 1, 10, 20, unit="grad")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Test suite for trigo_numpy.py.
+Checks the NumPy batch mode for sine and cosine of whole arrays.
+"""
+
+import unittest
+
+from mpmath import mp
+
+from DJKMath.Series.series_assertions import reference
+from DJKMath.Series.trigo_numpy import (
+    np,
+    sine_power_series_array,
+    cosine_power_series_array
+)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestArraySeries(unittest.TestCase):
+    """Test cases for the NumPy batch mode."""
+
+    def test_matches_mpmath(self):
+        """Array results agree with mpmath to float64 accuracy."""
+        x = np.array([0.0, 0.5, -1.25, 3.0, 100.0, -2.5e4, 1e9, 1e300])
+        sin_vals, sin_terms = sine_power_series_array(x)
+        cos_vals, cos_terms = cosine_power_series_array(x)
+        for i, angle in enumerate(x):
+            self.assertAlmostEqual(sin_vals[i], float(reference(mp.sin, angle, 10)), places=14)
+            self.assertAlmostEqual(cos_vals[i], float(reference(mp.cos, angle, 10)), places=14)
+        self.assertTrue((sin_terms >= 1).all())
+        self.assertTrue((cos_terms >= 1).all())
+
+    def test_non_finite(self):
+        """nan and inf give nan with zero terms."""
+        values, terms = sine_power_series_array([np.nan, np.inf])
+        self.assertTrue(np.isnan(values).all())
+        self.assertEqual(terms.tolist(), [0, 0])
+
+    def test_precision_limit(self):
+        """Precision beyond float64 is rejected."""
+        with self.assertRaises(ValueError):
+            sine_power_series_array([1.0], 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Test suite for trigo_sin_cos_tan.py.
+Checks the fused sine/cosine kernel and the batch evaluators.
+"""
+
+import unittest
+
+from mpmath import mp, mpf
+
+from DJKMath.Series.series_assertions import SeriesTestCase, reference
+from DJKMath.Series.trigo_sin_cos_tan import (
+    sine_power_series,
+    cosine_power_series,
+    sincos_power_series,
+    tangent_power_series,
+    sine_power_series_batch,
+    cosine_power_series_batch
+)
+
+
+class TestSinCos(SeriesTestCase):
+    """Test cases for the fused sine/cosine kernel."""
+
+    def test_matches_separate_series(self):
+        """Fused values and term counts equal the separate series."""
+        precision = 50
+        for x in (mpf(0), mpf('0.3'), mpf(2), mpf(-4), mpf('1e20')):
+            s, c, s_terms, c_terms = sincos_power_series(x, precision)
+            expected_s, expected_s_terms = sine_power_series(x, precision)
+            expected_c, expected_c_terms = cosine_power_series(x, precision)
+            self.assertEqual((s_terms, c_terms), (expected_s_terms, expected_c_terms))
+            self.assertDigits(s, expected_s, precision - 1)
+            self.assertDigits(c, expected_c, precision - 1)
+
+    def test_small_arguments(self):
+        """Sine keeps its relative precision for arguments below the threshold."""
+        for x in (mpf('1e-40'), mpf('1e-12')):
+            s, _, _, _ = sincos_power_series(x, 30, backend="mpmath")
+            self.assertDigits(s, reference(mp.sin, x, 30), 29, relative=True)
+
+    def test_tangent(self):
+        """Tangent from the fused kernel matches mpmath."""
+        value, _, _ = tangent_power_series(mpf(1), 40)
+        self.assertDigits(value, reference(mp.tan, 1, 40), 38)
+
+
+class TestBatchSeries(SeriesTestCase):
+    """Test cases for the shared-setup batch evaluators."""
+
+    def test_matches_scalar(self):
+        """Batch results match the scalar functions term for term."""
+        precision = 60
+        angles = [mpf(i) / 7 for i in range(-10, 11)]
+        for batch, scalar in ((sine_power_series_batch, sine_power_series),
+                              (cosine_power_series_batch, cosine_power_series)):
+            for x, (value, terms) in zip(angles, batch(angles, precision)):
+                expected, expected_terms = scalar(x, precision)
+                self.assertEqual(terms, expected_terms)
+                self.assertDigits(value, expected, precision - 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
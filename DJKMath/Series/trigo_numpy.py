@@ -0,0 +1,161 @@
+"""
+trigo_numpy.py
+Vectorized NumPy batch mode for the sine and cosine power series.
+
+sine_power_series / cosine_power_series in trigo_sin_cos_tan.py evaluate one
+mpf angle at a time. For large batches at float64 precision (at most 15
+significant digits) this module evaluates the same Taylor series on whole
+NumPy arrays at once:
+
+    1. Argument reduction: x = k·(π/2) + r with |r| <= π/4, using the
+       three-part Cody-Waite split of π/2 of float_kernel.py, so that
+       k·(π/2) is subtracted without rounding error (larger elements go
+       through its exact integer reduction).
+    2. The sine and cosine series of r are summed term by term with array
+       operations; each element stops contributing once its own term drops
+       below 10**(-precision), exactly like the scalar loops.
+    3. The quadrant k mod 4 selects ±sin(r) or ±cos(r).
+
+Functions:
+    sine_power_series_array(x, precision): Sine of every element of x
+    cosine_power_series_array(x, precision): Cosine of every element of x
+
+Both return (values, terms) where terms holds the per-element term count,
+counted the same way as the scalar functions.
+
+Dependencies:
+    numpy: For array arithmetic (optional for the rest of the package)
+"""
+
+from .float_kernel import CODY_WAITE_LIMIT, cody_waite, reduce_float
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only this batch API needs it.
+    np = None
+
+
+# Largest precision float64 can honour (53 bits ≈ 15.95 decimal digits).
+MAX_ARRAY_PRECISION = 15
+
+
+def _require_numpy():
+    """Raise a helpful error when NumPy is not installed."""
+    if np is None:
+        raise ImportError("NumPy is required for the array API: pip install numpy")
+
+
+def _check_precision(precision):
+    """Validate that the requested precision fits in float64."""
+    if not 1 <= precision <= MAX_ARRAY_PRECISION:
+        raise ValueError(
+            f"Array precision must be between 1 and {MAX_ARRAY_PRECISION} digits."
+        )
+
+
+def _reduce_large(values):
+    """Reduce the few elements beyond the Cody-Waite limit one by one."""
+    r = np.empty(values.shape)
+    k = np.empty(values.shape, dtype=np.int64)
+    for i, value in enumerate(values):
+        r[i], k[i] = reduce_float(float(value))
+    return r, k
+
+
+def reduce_array(x):
+    """Reduce every element to x = k·(π/2) + r with |r| <= π/4.
+
+    Returns (r, k) where k holds the quadrant (k mod 4) as int64.
+    """
+    _require_numpy()
+    x = np.asarray(x, dtype=np.float64)
+    r, k = cody_waite(x, np.rint)
+    quadrant = np.mod(k, 4).astype(np.int64)
+
+    large = np.abs(x) >= CODY_WAITE_LIMIT
+    large &= np.isfinite(x)
+    if large.any():
+        r[large], quadrant[large] = _reduce_large(x[large])
+    return r, quadrant
+
+
+def _sin_cos_series(r, precision):
+    """Sum the sine and cosine series of reduced arguments element-wise."""
+    threshold = 10.0 ** (-precision)
+    r2 = r * r
+
+    # Sine: term = r, total_terms = 1, stop when |term| <= threshold.
+    sin_val = np.zeros_like(r)
+    sin_term = r.copy()
+    sin_terms = np.ones(r.shape, dtype=np.int64)
+    active = np.abs(sin_term) > threshold
+    n = 1
+    while active.any():
+        sin_val += np.where(active, sin_term, 0.0)
+        n += 2
+        sin_term *= -r2 / (n * (n - 1))
+        sin_terms += active
+        active &= np.abs(sin_term) > threshold
+
+    # Cosine: result = 1, term = 1, add each new term while still active.
+    cos_val = np.ones_like(r)
+    cos_term = np.ones_like(r)
+    cos_terms = np.ones(r.shape, dtype=np.int64)
+    active = np.abs(cos_term) > threshold
+    n = 0
+    while active.any():
+        n += 2
+        cos_term *= -r2 / (n * (n - 1))
+        cos_val += np.where(active, cos_term, 0.0)
+        cos_terms += active
+        active &= np.abs(cos_term) > threshold
+
+    return sin_val, sin_terms, cos_val, cos_terms
+
+
+def _evaluate(x, precision, shift):
+    """Evaluate sin (shift=0) or cos (shift=1) of an array via its quadrant."""
+    _require_numpy()
+    _check_precision(precision)
+    x = np.asarray(x, dtype=np.float64)
+    finite = np.isfinite(x)
+    r, quadrant = reduce_array(np.where(finite, x, 0.0))
+    sin_val, sin_terms, cos_val, cos_terms = _sin_cos_series(r, precision)
+
+    # cos(x) = sin(x + π/2), so cosine is the sine table shifted by one quadrant.
+    quadrant = (quadrant + shift) % 4
+    use_cos = (quadrant % 2) == 1
+    values = np.where(use_cos, cos_val, sin_val)
+    values = np.where(quadrant >= 2, -values, values)
+    terms = np.where(use_cos, cos_terms, sin_terms)
+
+    values = np.where(finite, values, np.nan)
+    terms = np.where(finite, terms, 0)
+    return values, terms
+
+
+def sine_power_series_array(x, precision=MAX_ARRAY_PRECISION):
+    """Computes sine of every element of x using the Taylor series.
+
+    Parameters:
+    -----------
+    x : array_like
+        Angles in radians.
+    precision : int, optional
+        Significant digits, 1 to 15 (default 15).
+
+    Returns:
+    --------
+    (numpy.ndarray, numpy.ndarray)
+        Sine values and the number of terms used for each element.
+        Non-finite inputs give nan with a term count of 0.
+    """
+    return _evaluate(x, precision, 0)
+
+
+def cosine_power_series_array(x, precision=MAX_ARRAY_PRECISION):
+    """Computes cosine of every element of x using the Taylor series.
+
+    See sine_power_series_array for parameters and return values.
+    """
+    return _evaluate(x, precision, 1)
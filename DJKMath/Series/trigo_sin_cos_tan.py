@@ -7,17 +7,36 @@
 
 Functions:
     sine_power_series(x, precision): Calculate sine using Taylor series
+        (float64 kernel for precision <= 15, see float_kernel.py, and
+        double-double for 16 to 31 digits, see double_double.py)
     cosine_power_series(x, precision): Calculate cosine using Taylor series
+    sincos_power_series(x, precision): Calculate sine and cosine in one pass
     tangent_power_series(x, precision): Calculate tangent as sine/cosine
+        (or by its own series where that is cheaper, see reciprocal_series.py)
+    tangent_pole(x, precision): The pole test of tangent_power_series, silent
     secant_power_series(x, precision): Calculate secant as 1/cosine
     cosecant_power_series(x, precision): Calculate cosecant as 1/sine
     cotangent_power_series(x, precision): Calculate cotangent as cosine/sine
-    process_degree(degree, minute, second): Convert DMS to radians
+    sine_power_series_batch(angles, precision): Stream sines sharing one setup
+    cosine_power_series_batch(angles, precision): Stream cosines sharing one setup
+        (sine, cosine, sincos, tangent and the batches also take complex/mpc
+        arguments, see complex_series.py)
+    process_degree(degree, minute, second): Convert DMS to radians (exactly,
+        see exact_angle.py)
+        (mpmath, or decimal with backend="decimal")
     process_radian(radian): Convert and normalize radians
     get_precision(): Get user input for calculation precision
     flprint(value, precision, message): Format and print values
     main(): Run the interactive calculator
 
+Angles are first reduced to [-π/4, π/4] plus a quadrant (argument_reduction.py),
+so the series converge in a few terms however large the input is.
+
+The series work in a private mpmath context per thread (precision_context.py):
+they never change the caller's mp.dps and may run concurrently in threads.
+Certified interval enclosures of the same functions, at the smallest
+precision that meets a tolerance, are in certified.py.
+
 Each trigonometric function returns:
     - The calculated result with specified precision
     - Number of terms used in the series expansion
@@ -25,17 +44,21 @@
 
 Dependencies:
     mpmath: For high-precision arithmetic
-    Utils: For menu operations and input handling
+    Utils: For menu operations and input handling (imported where used, by
+        main() and the pole message: its keyboard code needs msvcrt, so the
+        series themselves import on every platform)
 
 Author: Dinesh Karia
 Date: 16 April 2025
 Version: 1.0
 """
 
+import math
 import os
 import sys
+from decimal import Decimal
 
-from mpmath import mp, mpf, radians, degrees, fmod, sin, cos, tan, inf
+from mpmath import mp, mpf, degrees, fmod, sin, cos, tan, inf
 
 
 
@@ -47,130 +70,731 @@
 # The second is robust
 # The third is the most robust and preferred.
 
-from Utils import operate_menu, get_single_key, get_integer, get_float, wait_for_key
+from DJKMath.Series.precision_context import (
+    mp as local_mp,
+    mpf as local_mpf,
+    isolated_precision,
+    to_caller,
+)
+from DJKMath.Series.argument_reduction import reduce_argument, normalize_radian
+from DJKMath.Series.coefficient_cache import sine_coefficients, cosine_coefficients
+from DJKMath.Series.paterson_stockmeyer import ps_sine, ps_cosine, ps_sincos
+from DJKMath.Series.multiple_angle import ta_sine, ta_cosine, ta_sincos
+from DJKMath.Series.minimax import mm_sine, mm_cosine, mm_sincos
+from DJKMath.Series.float_kernel import (
+    FLOAT_MAX_PRECISION,
+    as_exact_float,
+    float_sine,
+    float_cosine,
+    float_sincos,
+)
+from DJKMath.Series.double_double import (
+    DD_MAX_PRECISION,
+    as_dd,
+    dd_div,
+    dd_to_mpf,
+    dd_sine,
+    dd_cosine,
+    dd_sincos,
+)
+from DJKMath.Series.fixed_point import fixed_sine, fixed_cosine, fixed_sincos
+from DJKMath.Series.exact_angle import (
+    DegreeAngle,
+    exact_fraction,
+    degrees_to_radians,
+    special_sincos,
+    pole_multiple,
+)
+from DJKMath.Series.decimal_backend import (
+    decimal_sine,
+    decimal_cosine,
+    decimal_sincos,
+    decimal_divide,
+    dms_to_radians,
+    radians_to_degrees,
+    degrees_to_dms,
+)
+from DJKMath.Series.reciprocal_series import (
+    GUARD_DIGITS as DIRECT_GUARD_DIGITS,
+    direct_series_reduced,
+)
+from DJKMath.Series.anchor_table import sine_degrees, cosine_degrees, sincos_degrees
+from DJKMath.Series.hypergeometric import taylor_sum
+from DJKMath.Series.complex_series import is_complex, complex_sincos, complex_tangent
+from DJKMath.Series.binary_splitting import (
+    sine_binary_splitting,
+    cosine_binary_splitting,
+    sincos_binary_splitting,
+)
 
 
 
 # from math_utils import *
 
 
-def sine_power_series(x, precision):
-    """Computes sine using Taylor series expansion around 0."""
+def _sine_series(x, precision, threshold=None):
+    """Sums the sine Taylor series of x as given (no argument reduction).
+
+    The series is the "sine" instance of the shared engine
+    (hypergeometric.py): cached coefficients ±1/(2k+1)! times powers of x,
+    so the loop does multiply-adds only.
+    """
+    return taylor_sum("sine", x, precision, threshold)
+
+
+def _cosine_series(x, precision, threshold=None):
+    """Sums the cosine Taylor series of x as given (no argument reduction).
+
+    The series is the "cosine" instance of the shared engine
+    (hypergeometric.py), with coefficients ±1/(2k)!.
+    """
+    return taylor_sum("cosine", x, precision, threshold)
+
+
+def _series_kernels(method):
+    """Returns the (sine, cosine, sincos) kernels for an evaluation method."""
+    if method in SERIES_METHODS:
+        return SERIES_METHODS[method]
+    if method in EXACT_METHODS:
+        return EXACT_METHODS[method]
+    names = ", ".join(list(SERIES_METHODS) + list(EXACT_METHODS))
+    raise ValueError(f"Unknown method {method!r}; choose from {names}")
+
+
+# Backends: "auto" evaluates with method "taylor" on float64 when that honours
+# the request (precision <= 15, x exactly a float), on double-double up to 31
+# digits (x exactly a sum of two floats) and with mpmath otherwise. "fixed"
+# runs the Taylor loops on integers scaled by 2**wp (fixed_point.py) and
+# "decimal" on the C decimal module, returning Decimal (decimal_backend.py).
+BACKENDS = ("auto", "mpmath", "float", "double_double", "fixed", "decimal")
+
+
+def _check_backend(backend, precision):
+    """Validates the backend name (and the precision a forced backend allows)."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; choose from {', '.join(BACKENDS)}")
+    if backend == "float" and precision > FLOAT_MAX_PRECISION:
+        raise ValueError(f"The float backend gives at most {FLOAT_MAX_PRECISION} digits.")
+    if backend == "double_double" and precision > DD_MAX_PRECISION:
+        raise ValueError(f"The double_double backend gives at most {DD_MAX_PRECISION} digits.")
+
+
+def _fast_argument(x, precision, method, backend):
+    """Returns ("float", x as a float), ("double_double", x as a (hi, lo)
+    pair), ("fixed", x) or ("decimal", x) when that kernel should evaluate
+    x, else (None, None)."""
+    if backend == "mpmath" or method != "taylor":
+        return None, None
+    if backend in ("fixed", "decimal"):
+        return backend, x
+    if backend == "float":
+        return "float", float(x)
+    if backend == "double_double":
+        return "double_double", as_dd(x, exact=False)
+    if precision <= FLOAT_MAX_PRECISION:
+        fx = as_exact_float(x)
+        if fx is not None:
+            return "float", fx
+    if precision <= DD_MAX_PRECISION:
+        pair = as_dd(x)
+        if pair is not None:
+            return "double_double", pair
+    return None, None
+
+
+def _from_dd(pair, precision):
+    """Rounds a double-double result to an mpf of precision digits."""
+    local_mp.dps = precision
+    return dd_to_mpf(pair)
+
+
+def _pole_constants(fast):
+    """Returns (π, 10) as floats for the float64 path, as mpf otherwise."""
+    if fast:
+        return math.pi, 10.0
+    return local_mp.pi, local_mpf(10)
+
+
+def _degree_argument(x, precision):
+    """Returns (radians, special) for a DegreeAngle x: the angle in radians
+    and its closed-form (sin, cos, sin_text, cos_text), or None if it is not
+    a special angle (exact_angle.py). Other x are returned as (x, None)."""
+    if not isinstance(x, DegreeAngle):
+        return x, None
+    return degrees_to_radians(x, precision), special_sincos(x, precision)
+
+
+def _special_value(value, kind, precision):
+    """A closed-form mpf value as the type the chosen backend returns."""
+    if kind == "float":
+        return float(value)
+    if kind == "decimal":
+        return Decimal(local_mp.nstr(value, precision))
+    return value
+
+
+@isolated_precision
+def _quadrant_series(x, precision, shift, threshold=None, method="taylor"):
+    """Evaluates sin (shift=0) or cos (shift=1) of x after reduction to [-π/4, π/4].
+
+    With x = q·(π/2) + r, sin(x) is sin(r), cos(r), -sin(r), -cos(r) for
+    q = 0, 1, 2, 3, and cos(x) = sin(x + π/2) is the same with q + 1.
+    """
+    sine_kernel, cosine_kernel, _ = _series_kernels(method)
+    if method in EXACT_METHODS:
+        # Exact arguments are summed as given; reducing by π would lose exactness.
+        kernel = cosine_kernel if shift else sine_kernel
+        return kernel(x, precision)
+    r, quadrant = reduce_argument(x, precision)
+    return _reduced_series(r, quadrant, precision, shift, threshold, method)
+
+
+def _reduced_series(r, quadrant, precision, shift, threshold=None, method="taylor"):
+    """sin (shift=0) or cos (shift=1) of x = quadrant·(π/2) + r, reduced already."""
+    sine_kernel, cosine_kernel, _ = _series_kernels(method)
+    quadrant = (quadrant + shift) % 4
+    if quadrant % 2 == 0:
+        value, terms = sine_kernel(r, precision, threshold)
+    else:
+        value, terms = cosine_kernel(r, precision, threshold)
+    if quadrant >= 2:
+        value = -value
+    return value, terms
+
+
+@isolated_precision
+def sine_power_series(x, precision, method="taylor", backend="auto"):
+    """Computes sine using Taylor series expansion around 0 of the reduced angle.
+
+    method selects how the series is summed: "taylor" (term by term),
+    "paterson_stockmeyer" (fewer full-precision multiplications, faster
+    from a few hundred digits), "triple_angle" (series at x / 3**k rebuilt
+    with sin(3t) = 3s - 4s³; far fewer terms at high precision),
+    "minimax" (Remez polynomials from minimax_tables.json; fewer terms at
+    the tabulated precisions, see minimax.py) or
+    "binary_splitting" (exact int/Fraction x only, summed without
+    reduction; practical up to 10**5 digits).
+
+    backend "auto" (default) runs precisions up to 15 digits on native
+    float64 (float_kernel.py, a float result, no mpf created) whenever x
+    converts to a float exactly, and up to 31 digits on double-double
+    (double_double.py) whenever x is exactly a sum of two floats; "mpmath"
+    always uses mpf and "float" / "double_double" force those kernels.
+    "fixed" sums the Taylor series on Python integers scaled by 2**wp
+    (fixed_point.py), several times faster from about 50 digits, and
+    "decimal" on the standard decimal module (decimal_backend.py; the value
+    is a Decimal).
+
+    x may also be a DegreeAngle (exact_angle.py): at special angles such as
+    30° or 45° the closed form is returned with 0 terms; otherwise method
+    "taylor" on mpmath sums the short series of its exact distance to the
+    nearest anchor angle (anchor_table.py), and the other methods and
+    backends get it converted to radians with a single rounding. A complex
+    or mpc x gives an mpc (complex_series.py; methods "taylor" and
+    "paterson_stockmeyer").
+    """
+    _series_kernels(method)
+    _check_backend(backend, precision)
+    if is_complex(x):
+        value, _, terms = complex_sincos(x, precision, method, backend)
+        return value, terms
+    angle = x
+    x, special = _degree_argument(x, precision)
+    kind, arg = _fast_argument(x, precision, method, backend)
+    if special is not None:
+        return _special_value(special[0], kind, precision), 0
     try:
-        mp.dps = precision
-        result = mpf(0)
-        term = x
-        n = 1
-        total_terms = 1
-        threshold = mpf(10) ** (-precision)
-
-        while abs(term) > threshold:
-            result += term
-            n += 2
-            term *= -(x**2) / (n * (n - 1))
-            total_terms += 1
-            if total_terms > 1000:  # Prevent infinite loops
-                raise RuntimeError("Series not converging")
-        return result, total_terms
+        if kind == "float":
+            return float_sine(arg, precision)
+        if kind == "double_double":
+            value, terms = dd_sine(arg, precision)
+            return _from_dd(value, precision), terms
+        if kind == "fixed":
+            return fixed_sine(arg, precision)
+        if kind == "decimal":
+            return decimal_sine(arg, precision)
+        if isinstance(angle, DegreeAngle) and method == "taylor":
+            return sine_degrees(angle, precision)
+        return _quadrant_series(x, precision, 0, method=method)
     except (ValueError, RuntimeError) as e:
         print(f"Error in sine calculation: {e}")
-        return mpf(0), 0
+        return local_mpf(0), 0
 
-def cosine_power_series(x, precision):
-    """Computes cosine using Taylor series expansion around 0."""
+@isolated_precision
+def cosine_power_series(x, precision, method="taylor", backend="auto"):
+    """Computes cosine using Taylor series expansion around 0 of the reduced angle.
+
+    method, backend, DegreeAngle and complex arguments are as for
+    sine_power_series.
+    """
+    _series_kernels(method)
+    _check_backend(backend, precision)
+    if is_complex(x):
+        _, value, terms = complex_sincos(x, precision, method, backend)
+        return value, terms
+    angle = x
+    x, special = _degree_argument(x, precision)
+    kind, arg = _fast_argument(x, precision, method, backend)
+    if special is not None:
+        return _special_value(special[1], kind, precision), 0
     try:
-        mp.dps = precision
-        result = mpf(1)
-        term = mpf(1)
-        n = 0
-        total_terms = 1
-        threshold = mpf(10) ** (-precision)
-
-        while abs(term) > threshold:
-            n += 2
-            term *= -(x**2) / (n * (n - 1))
-            result += term
-            total_terms += 1
-            if total_terms > 1000:  # Prevent infinite loops
-                raise RuntimeError("Series not converging")
-        return result, total_terms
+        if kind == "float":
+            return float_cosine(arg, precision)
+        if kind == "double_double":
+            value, terms = dd_cosine(arg, precision)
+            return _from_dd(value, precision), terms
+        if kind == "fixed":
+            return fixed_cosine(arg, precision)
+        if kind == "decimal":
+            return decimal_cosine(arg, precision)
+        if isinstance(angle, DegreeAngle) and method == "taylor":
+            return cosine_degrees(angle, precision)
+        return _quadrant_series(x, precision, 1, method=method)
     except (ValueError, RuntimeError) as e:
         print(f"Error in cosine calculation: {e}")
-        return mpf(1), 0
-
-
-def tangent_power_series(x, precision):
-    """Computes tangent by invoking sine and cosine power series."""
-    k = round((2 * x) / mp.pi)
-    if k % 2 != 0:  # odd multiple
-        expected = (k * mp.pi) / 2
-        if abs(x - expected) < mpf(10) ** (
-            -precision + 5
-        ):  # within precision threshold
-            print(
-                f"\nTangent is undefined at this angle ({degrees(x)} degrees ≈ {k}·π/2)."
-            )
-            wait_for_key()
-            result, terms_sine, terms_cos = "undefined", 0, 0
-            return result, terms_sine, terms_cos
-    sin_val, sin_terms = sine_power_series(x, precision)
-    cos_val, cos_terms = cosine_power_series(x, precision)
+        return local_mpf(1), 0
+
+
+def _sincos_series(x, precision):
+    """Sums the sine and cosine Taylor series of x together in one pass.
+
+    Both series share the powers x**(2k): cosine adds ±x**(2k)/(2k)! and
+    sine accumulates ±x**(2k)/(2k+1)!, multiplied by x once at the end.
+    That is three multiplications per pair of terms instead of four.
+    Returns (sin, cos, sin_terms, cos_terms) with term counts matching the
+    separate loops.
+    """
+    local_mp.dps = precision
+    threshold = local_mpf(10) ** (-precision)
+    if x == 0:
+        return local_mpf(0), local_mpf(1), 1, 2
+    sin_threshold = threshold / abs(x)  # |sine term| > threshold, before the factor x
+    sin_coefficients = sine_coefficients(16)
+    cos_coefficients = cosine_coefficients(16)
+    x2 = x * x
+    power = local_mpf(1)
+    sin_sum = local_mpf(0)
+    cos_val = local_mpf(1)
+    sin_terms = 1
+    cos_terms = 2  # The leading 1 and the final negligible term, as in _cosine_series
+    sin_active = True
+    cos_active = True
+    k = 0
+
+    while sin_active or cos_active:
+        if sin_active:
+            # Every computed term is added, the final negligible one too.
+            term = sin_coefficients[k] * power
+            sin_sum += term
+            if abs(term) > sin_threshold:
+                sin_terms += 1
+            else:
+                sin_active = False
+        k += 1
+        if k == len(cos_coefficients):
+            sin_coefficients = sine_coefficients(2 * k)
+            cos_coefficients = cosine_coefficients(2 * k)
+        power *= x2
+        if cos_active:
+            term = cos_coefficients[k] * power
+            if abs(term) > threshold:
+                cos_val += term
+                cos_terms += 1
+            else:
+                cos_active = False
+        if k > 1000:  # Prevent infinite loops
+            raise RuntimeError("Series not converging")
+    return sin_sum * x, cos_val, sin_terms, cos_terms
+
+
+# Evaluation methods: name -> (sine kernel, cosine kernel, sincos kernel).
+# The kernels work on already reduced arguments.
+SERIES_METHODS = {
+    "taylor": (_sine_series, _cosine_series, _sincos_series),
+    "paterson_stockmeyer": (ps_sine, ps_cosine, ps_sincos),
+    "triple_angle": (ta_sine, ta_cosine, ta_sincos),
+    "minimax": (mm_sine, mm_cosine, mm_sincos),
+}
+
+# Methods for exact rational arguments, applied to x without reduction.
+EXACT_METHODS = {
+    "binary_splitting": (
+        sine_binary_splitting,
+        cosine_binary_splitting,
+        sincos_binary_splitting,
+    ),
+}
+
+
+@isolated_precision
+def sincos_power_series(x, precision, method="taylor", backend="auto"):
+    """Computes sine and cosine together from one reduction and one series pass.
+
+    method and backend are as for sine_power_series.
+    Returns (sin, cos, sin_terms, cos_terms); for a complex x, and for a
+    DegreeAngle on the anchor table, both values come from one pass and its
+    terms are the first count, 0 the second.
+    """
+    sincos_kernel = _series_kernels(method)[2]
+    _check_backend(backend, precision)
+    if is_complex(x):
+        s, c, terms = complex_sincos(x, precision, method, backend)
+        return s, c, terms, 0
+    angle = x
+    x, special = _degree_argument(x, precision)
+    kind, arg = _fast_argument(x, precision, method, backend)
+    if special is not None:
+        s, c = special[0], special[1]
+        return _special_value(s, kind, precision), _special_value(c, kind, precision), 0, 0
+    try:
+        if kind == "float":
+            return float_sincos(arg, precision)
+        if kind == "double_double":
+            s, c, s_terms, c_terms = dd_sincos(arg, precision)
+            return _from_dd(s, precision), _from_dd(c, precision), s_terms, c_terms
+        if kind == "fixed":
+            return fixed_sincos(arg, precision)
+        if kind == "decimal":
+            return decimal_sincos(arg, precision)
+        if isinstance(angle, DegreeAngle) and method == "taylor":
+            s, c, terms = sincos_degrees(angle, precision)
+            return s, c, terms, 0
+        if method in EXACT_METHODS:
+            return sincos_kernel(x, precision)
+        r, quadrant = reduce_argument(x, precision)
+        return _reduced_sincos(r, quadrant, precision, method)
+    except (ValueError, RuntimeError) as e:
+        print(f"Error in sine/cosine calculation: {e}")
+        return local_mpf(0), local_mpf(1), 0, 0
+
+
+def _reduced_sincos(r, quadrant, precision, method="taylor"):
+    """(sin, cos, sin_terms, cos_terms) of x = quadrant·(π/2) + r, reduced already."""
+    s, c, s_terms, c_terms = _series_kernels(method)[2](r, precision)
+    # sin(q·π/2 + r) and cos(q·π/2 + r) for q = 0, 1, 2, 3.
+    if quadrant == 1:
+        s, c, s_terms, c_terms = c, -s, c_terms, s_terms
+    elif quadrant == 2:
+        s, c = -s, -c
+    elif quadrant == 3:
+        s, c, s_terms, c_terms = -c, s, c_terms, s_terms
+    return s, c, s_terms, c_terms
+
+
+def _batch_power_series(angles, precision, shift, method, backend):
+    """Shared loop for the batch evaluators (shift=0 sine, shift=1 cosine).
+
+    The precision and threshold are set up once per batch and the
+    coefficient tables come from the cache, so each angle only costs its
+    reduction, one r**2 and two multiplications per term. Angles the
+    float64 or double-double kernels can take (or all of them, for the
+    fixed and decimal backends) are sent there, as in sine_power_series,
+    and complex angles to complex_series.py.
+
+    The loop runs outside isolated_precision, so values made in the thread's
+    context are passed through to_caller before they are yielded.
+    """
+    float_kernel = float_cosine if shift else float_sine
+    dd_kernel = dd_cosine if shift else dd_sine
+    fixed_kernel = fixed_cosine if shift else fixed_sine
+    decimal_kernel = decimal_cosine if shift else decimal_sine
+    local_mp.dps = precision
+    threshold = local_mpf(10) ** (-precision)
+    label = "cosine" if shift else "sine"
+
+    for x in angles:
+        try:
+            if is_complex(x):
+                values = complex_sincos(x, precision, method, backend)
+                yield to_caller(values[shift]), values[2]
+                continue
+            x, special = _degree_argument(x, precision)
+            kind, arg = _fast_argument(x, precision, method, backend)
+            if special is not None:
+                result, total_terms = _special_value(special[shift], kind, precision), 0
+            elif kind == "float":
+                result, total_terms = float_kernel(arg, precision)
+            elif kind == "double_double":
+                pair, total_terms = dd_kernel(arg, precision)
+                result = _from_dd(pair, precision)
+            elif kind == "fixed":
+                result, total_terms = fixed_kernel(arg, precision)
+            elif kind == "decimal":
+                result, total_terms = decimal_kernel(arg, precision)
+            else:
+                result, total_terms = _quadrant_series(x, precision, shift, threshold, method)
+        except (ValueError, RuntimeError) as e:
+            print(f"Error in {label} calculation: {e}")
+            result, total_terms = (local_mpf(1) if shift else local_mpf(0)), 0
+        yield to_caller(result), total_terms
+
+
+def sine_power_series_batch(angles, precision, method="taylor", backend="auto"):
+    """Computes sine for many angles, sharing the setup for one precision.
+
+    Yields (value, terms) for each angle in the iterable, in order.
+    """
+    _series_kernels(method)
+    _check_backend(backend, precision)
+    return _batch_power_series(angles, precision, 0, method, backend)
+
+
+def cosine_power_series_batch(angles, precision, method="taylor", backend="auto"):
+    """Computes cosine for many angles, sharing the setup for one precision.
+
+    Yields (value, terms) for each angle in the iterable, in order.
+    """
+    _series_kernels(method)
+    _check_backend(backend, precision)
+    return _batch_power_series(angles, precision, 1, method, backend)
+
+
+def _pole_check_value(x):
+    """Returns x as an mpf for the pole checks, accepting exact Fractions,
+    Decimals and decimal strings too."""
+    if isinstance(x, (Decimal, str)):
+        return local_mpf(str(x))
+    if hasattr(x, "numerator") and not isinstance(x, int):
+        return local_mpf(x.numerator) / x.denominator
+    return x
+
+
+def _pole_multiple(x, angle, precision, fast, half):
+    """Returns k if the ratio has a pole at x = k·π/2 (half=True, k odd:
+    tan, sec) or x = k·π (half=False: csc, cot), else None.
+
+    A DegreeAngle is decided exactly from its rational degrees. So is an
+    exact rational radian (int, Fraction, Decimal, decimal str): π is
+    irrational, so only 0 is a multiple of π/2. Floats and mpf, which are
+    usually rounded multiples of π, are poles within 10**(5 - precision).
+    """
+    if isinstance(angle, DegreeAngle):
+        return pole_multiple(angle, half)
+    if not isinstance(x, float) and not hasattr(x, "_mpf_"):
+        return 0 if not half and exact_fraction(x) == 0 else None
+    xv = float(x) if fast else x
+    pi, ten = _pole_constants(fast)
+    if half:
+        k = round((2 * xv) / pi)
+        if k % 2 != 0 and abs(xv - (k * pi) / 2) < ten ** (-precision + 5):
+            return k
+        return None
+    k = round(xv / pi)
+    return k if abs(xv - k * pi) < ten ** (-precision + 5) else None
+
+
+def _report_pole(name, x, angle, k, half):
+    """Prints that name is undefined at x ≈ k·π/2 or k·π and waits for a key."""
+    if isinstance(angle, DegreeAngle):
+        shown, relation = angle.degrees, "="
+    else:
+        exact = not isinstance(x, float) and not hasattr(x, "_mpf_")
+        shown, relation = degrees(_pole_check_value(x)), "=" if exact else "≈"
+    multiple = f"{k}·π/2" if half else f"{k}·π"
+    print(f"\n{name} is undefined at this angle ({shown} degrees {relation} {multiple}).")
+    from Utils import wait_for_key
+    wait_for_key()
+
+
+def _direct_or_reduced(func, x, precision):
+    """Reduces a radian x once for the "taylor" ratio functions on mpmath.
+
+    Returns (direct, r, quadrant): direct is (value, terms) from the direct
+    series (reciprocal_series.py) where that is estimated cheaper, else
+    None, and the caller sums the quotient from the same r and quadrant.
+    """
+    r, quadrant = reduce_argument(x, precision + DIRECT_GUARD_DIGITS)
+    direct = direct_series_reduced(func, r, quadrant, precision)
+    local_mp.dps = precision
+    return direct, r, quadrant
+
+
+@isolated_precision
+def tangent_pole(x, precision, method="taylor", backend="auto"):
+    """Returns k if tangent_power_series(x, ...) would find a pole at x = k·π/2
+    (k odd), else None; nothing is printed.
+
+    The test is the one tangent_power_series applies, for callers such as
+    parallel_sweep.py that must not stop at the interactive pole message.
+    """
+    if is_complex(x):
+        return None
+    angle = x
+    x, _ = _degree_argument(x, precision)
+    kind, _ = _fast_argument(x, precision, method, backend)
+    local_mp.dps = precision
+    return _pole_multiple(x, angle, precision, kind == "float", half=True)
+
+
+@isolated_precision
+def tangent_power_series(x, precision, method="taylor", backend="auto"):
+    """Computes tangent from the fused sine/cosine power series.
+
+    With method "taylor" on mpmath, a radian x is reduced once, and the
+    tangent (or cotangent) series of the reduced angle is summed instead of
+    the quotient where it is estimated cheaper (reciprocal_series.py); its
+    terms are then the first count, and 0 the second. The same holds for a
+    complex x (complex_series.py).
+    """
+    _check_backend(backend, precision)
+    if is_complex(x):
+        value, terms = complex_tangent(x, precision, method, backend)
+        return value, terms, 0
+    angle = x
+    x, special = _degree_argument(x, precision)
+    kind, arg = _fast_argument(x, precision, method, backend)
+    local_mp.dps = precision
+    k = _pole_multiple(x, angle, precision, kind == "float", half=True)
+    if k is not None:
+        _report_pole("Tangent", x, angle, k, half=True)
+        result, terms_sine, terms_cos = "undefined", 0, 0
+        return result, terms_sine, terms_cos
+    if special is not None:
+        return _special_value(special[0] / special[1], kind, precision), 0, 0
+    if kind == "double_double":
+        s, c, sin_terms, cos_terms = dd_sincos(arg, precision)
+        return _from_dd(dd_div(s, c), precision), sin_terms, cos_terms
+    if kind is None and method == "taylor" and not isinstance(angle, DegreeAngle):
+        direct, r, quadrant = _direct_or_reduced("tangent", x, precision)
+        if direct is not None:
+            return direct[0], direct[1], 0
+        sin_val, cos_val, sin_terms, cos_terms = _reduced_sincos(r, quadrant, precision)
+    else:
+        sin_val, cos_val, sin_terms, cos_terms = sincos_power_series(angle, precision, method, backend)
+    if kind == "decimal":
+        return decimal_divide(sin_val, cos_val, precision), sin_terms, cos_terms
     return sin_val / cos_val, sin_terms, cos_terms
 
 
-def secant_power_series(x, precision):
-    """Computes secant by taking the reciprocal of cosine power series."""
-    k = round((2 * x) / mp.pi)
-    if k % 2 != 0:  # odd multiple
-        expected = (k * mp.pi) / 2
-        if abs(x - expected) < mpf(10) ** (-precision + 5):
-            print(
-                f"\nSecant is undefined at this angle ({degrees(x)} degrees ≈ {k}·π/2)."
-            )
-            wait_for_key()
-            result, terms = "undefined", 0
-            return result, terms
-    cos_val, cos_terms = cosine_power_series(x, precision)
-    return mpf(1) / cos_val, cos_terms
-
-
-def cosecant_power_series(x, precision):
-    """Computes cosecant by taking the reciprocal of sine power series."""
-    k = round(x / mp.pi)
-    if abs(x - k * mp.pi) < mpf(10) ** (-precision + 5):  # near multiple of π
-        print(f"\nCosecant is undefined at this angle ({degrees(x)} degrees ≈ {k}·π).")
-        wait_for_key()
+@isolated_precision
+def secant_power_series(x, precision, method="taylor", backend="auto"):
+    """Computes secant by taking the reciprocal of cosine power series.
+
+    With method "taylor" on mpmath, the secant (or cosecant) series is
+    summed instead where it is estimated cheaper (reciprocal_series.py).
+    """
+    _check_backend(backend, precision)
+    angle = x
+    x, special = _degree_argument(x, precision)
+    kind, arg = _fast_argument(x, precision, method, backend)
+    local_mp.dps = precision
+    k = _pole_multiple(x, angle, precision, kind == "float", half=True)
+    if k is not None:
+        _report_pole("Secant", x, angle, k, half=True)
+        result, terms = "undefined", 0
+        return result, terms
+    if special is not None:
+        return _special_value(1 / special[1], kind, precision), 0
+    if kind == "double_double":
+        c, cos_terms = dd_cosine(arg, precision)
+        return _from_dd(dd_div((1.0, 0.0), c), precision), cos_terms
+    if kind is None and method == "taylor" and not isinstance(angle, DegreeAngle):
+        direct, r, quadrant = _direct_or_reduced("secant", x, precision)
+        if direct is not None:
+            return direct
+        cos_val, cos_terms = _reduced_series(r, quadrant, precision, 1)
+    else:
+        cos_val, cos_terms = cosine_power_series(angle, precision, method, backend)
+    if kind == "decimal":
+        return decimal_divide(1, cos_val, precision), cos_terms
+    return 1 / cos_val, cos_terms
+
+
+@isolated_precision
+def cosecant_power_series(x, precision, method="taylor", backend="auto"):
+    """Computes cosecant by taking the reciprocal of sine power series.
+
+    With method "taylor" on mpmath, the cosecant (or secant) series is
+    summed instead where it is estimated cheaper (reciprocal_series.py).
+    """
+    _check_backend(backend, precision)
+    angle = x
+    x, special = _degree_argument(x, precision)
+    kind, arg = _fast_argument(x, precision, method, backend)
+    local_mp.dps = precision
+    k = _pole_multiple(x, angle, precision, kind == "float", half=False)
+    if k is not None:
+        _report_pole("Cosecant", x, angle, k, half=False)
         result, terms = "undefined", 0
         return result, terms
-    sin_val, sin_terms = sine_power_series(x, precision)
-    return mpf(1) / sin_val, sin_terms
+    if special is not None:
+        return _special_value(1 / special[0], kind, precision), 0
+    if kind == "double_double":
+        s, sin_terms = dd_sine(arg, precision)
+        return _from_dd(dd_div((1.0, 0.0), s), precision), sin_terms
+    if kind is None and method == "taylor" and not isinstance(angle, DegreeAngle):
+        direct, r, quadrant = _direct_or_reduced("cosecant", x, precision)
+        if direct is not None:
+            return direct
+        sin_val, sin_terms = _reduced_series(r, quadrant, precision, 0)
+    else:
+        sin_val, sin_terms = sine_power_series(angle, precision, method, backend)
+    if kind == "decimal":
+        return decimal_divide(1, sin_val, precision), sin_terms
+    return 1 / sin_val, sin_terms
 
 
-def cotangent_power_series(x, precision):
-    """Computes cotangent by taking the reciprocal of tangent power series."""
-    k = round(x / mp.pi)
-    if abs(x - k * mp.pi) < mpf(10) ** (-precision + 5):  # near multiple of π
-        print(f"\nCotangent is undefined at this angle ({degrees(x)} degrees ≈ {k}·π).")
-        wait_for_key()
+@isolated_precision
+def cotangent_power_series(x, precision, method="taylor", backend="auto"):
+    """Computes cotangent from the fused sine/cosine power series.
+
+    With method "taylor" on mpmath, the cotangent (or tangent) series is
+    summed instead where it is estimated cheaper (reciprocal_series.py), as
+    for tangent_power_series.
+    """
+    _check_backend(backend, precision)
+    angle = x
+    x, special = _degree_argument(x, precision)
+    kind, arg = _fast_argument(x, precision, method, backend)
+    local_mp.dps = precision
+    k = _pole_multiple(x, angle, precision, kind == "float", half=False)
+    if k is not None:
+        _report_pole("Cotangent", x, angle, k, half=False)
         result, terms_sine, terms_cos = "undefined", 0, 0
         return result, terms_sine, terms_cos
-    sin_val, sin_terms = sine_power_series(x, precision)
-    cos_val, cos_terms = cosine_power_series(x, precision)
+    if special is not None:
+        return _special_value(special[1] / special[0], kind, precision), 0, 0
+    if kind == "double_double":
+        s, c, sin_terms, cos_terms = dd_sincos(arg, precision)
+        return _from_dd(dd_div(c, s), precision), sin_terms, cos_terms
+    if kind is None and method == "taylor" and not isinstance(angle, DegreeAngle):
+        direct, r, quadrant = _direct_or_reduced("cotangent", x, precision)
+        if direct is not None:
+            return direct[0], direct[1], 0
+        sin_val, cos_val, sin_terms, cos_terms = _reduced_sincos(r, quadrant, precision)
+    else:
+        sin_val, cos_val, sin_terms, cos_terms = sincos_power_series(angle, precision, method, backend)
+    if kind == "decimal":
+        return decimal_divide(cos_val, sin_val, precision), sin_terms, cos_terms
     return cos_val / sin_val, sin_terms, cos_terms
 
 
-def process_degree(given_degree, given_minute, given_second):
-    """Processes the degree input and converts it to radians."""
-    decimal_degree = given_degree + given_minute / 60 + given_second / 3600
-    equivalent_radian = radians(decimal_degree)
-    # Normalize the degree to be within [0, 360]
-    normal_degree = fmod(decimal_degree, 360)
-    # Convert to radians
-    normal_radian = radians(normal_degree)
-    normal_minute = fmod(normal_degree, 1) * 60
-    normal_second = fmod(normal_minute, 1) * 60
-    normal_degree = int(normal_degree)
-    normal_minute = int(normal_minute)
+def process_degree(given_degree, given_minute, given_second, backend="mpmath", precision=None):
+    """Processes the degree input and converts it to radians.
+
+    The angle is added up and normalized to [0, 360) degrees as an exact
+    fraction (exact_angle.py) and rounded only by the final conversion to
+    radians, at precision digits (default: mp.dps). backend "decimal"
+    converts in a local decimal context instead and returns a Decimal.
+    """
+    precision = precision or mp.dps
+    if backend == "decimal":
+        decimal_degree, equivalent_radian, normal_degree, normal_radian = dms_to_radians(
+            given_degree, given_minute, given_second, precision
+        )
+        normal_degree, normal_minute, normal_second = degrees_to_dms(normal_degree, precision)
+    else:
+        angle = DegreeAngle(given_degree, given_minute, given_second)
+        equivalent_radian = degrees_to_radians(angle, precision, normalize=False)
+        normal_radian = degrees_to_radians(angle, precision)
+        # Whole degrees, minutes and the seconds of the normalized angle, exactly
+        normal = angle.normal
+        normal_degree = int(normal)
+        normal_minute = int((normal - normal_degree) * 60)
+        seconds = (normal - normal_degree) * 3600 - normal_minute * 60
+        with mp.workdps(precision):
+            decimal_degree = mpf(angle.degrees.numerator) / angle.degrees.denominator
+            normal_second = mpf(seconds.numerator) / seconds.denominator
     print(f"Given angle in degrees: {given_degree}° {given_minute}' {given_second}\"")
     print(f"Converted to radians: {equivalent_radian} rad")
     print(f"Decimal degrees: {decimal_degree}°")
@@ -179,16 +803,26 @@ def process_degree(given_degree, given_minute, given_second):
     return normal_radian
 
 
-def process_radian(given_radian):
-    """Processes the radian input and converts it to degrees."""
-    decimal_degree = degrees(given_radian)
-    # Normalize the radian to be within [0, 2π]
-    normal_radian = fmod(given_radian, 2 * mp.pi)
-    normal_degree = degrees(normal_radian)
-    normal_minute = fmod(normal_degree, 1) * 60
-    normal_second = fmod(normal_minute, 1) * 60
-    normal_degree = int(normal_degree)
-    normal_minute = int(normal_minute)
+def process_radian(given_radian, backend="mpmath", precision=None):
+    """Processes the radian input and converts it to degrees.
+
+    backend "decimal" converts in a local decimal context of precision
+    digits (default: mp.dps) and returns a Decimal; "mpmath" normalizes to
+    precision digits (default: mp.dps) as well.
+    """
+    if backend == "decimal":
+        precision = precision or mp.dps
+        decimal_degree, normal_radian, normal_degree = radians_to_degrees(given_radian, precision)
+        normal_degree, normal_minute, normal_second = degrees_to_dms(normal_degree, precision)
+    else:
+        decimal_degree = degrees(given_radian)
+        # Normalize the radian to be within [0, 2π], exactly even for huge inputs
+        normal_radian = normalize_radian(given_radian, precision)
+        normal_degree = degrees(normal_radian)
+        normal_minute = fmod(normal_degree, 1) * 60
+        normal_second = fmod(normal_minute, 1) * 60
+        normal_degree = int(normal_degree)
+        normal_minute = int(normal_minute)
     print(f"Given angle in radians: {given_radian} rad")
     print(f"Converted to degrees: {decimal_degree}°")
     print(f"Normalized degrees: {normal_degree}° {normal_minute}' {normal_second}\"")
@@ -211,7 +845,6 @@ def get_precision():
 
 def flprint(value, precision, message=""):
     """Format and print the value with the specified precision."""
-    mp.dps = precision  # Set display precision once
     print(
         f"{message} {mp.nstr(value, n=precision, strip_zeros=False, min_fixed=-inf, max_fixed=inf)}"
     )
@@ -219,6 +852,7 @@ def flprint(value, precision, message=""):
 
 def main():
     """Main function to run the trigonometric calculator."""
+    from Utils import operate_menu, get_single_key, get_integer, get_float
     menu_items = [
         ("[S] Sine", "S", "sine_power_series"),
         ("[C] Cosine", "C", "cosine_power_series"),
@@ -262,9 +896,19 @@ def main():
         # Step 4 Get precision.
         # Get precision
         precision = get_precision()
+        # The series run in their own context; the built-in comparisons and
+        # the display below use the global one.
+        mp.dps = precision
+        if origdr == "degree":
+            # The series get the exact angle; the built-ins its radians at
+            # the chosen precision.
+            angle = DegreeAngle(given_degree, given_minute, given_second)
+            x = degrees_to_radians(angle, precision)
+        else:
+            angle = x
         # Step 5 Call the selected function.
         if selected_func == "sine_power_series":
-            result, terms = sine_power_series(x, precision)
+            result, terms = sine_power_series(angle, precision)
             builtin = sin(x)
             print("\nResults: ================")
             print(f"Function: {selected_func}")
@@ -282,7 +926,7 @@ def main():
             flprint(diff, precision, "       Difference: ")
             print(f"Number of terms used: {terms}")
         elif selected_func == "cosine_power_series":
-            result, terms = cosine_power_series(x, precision)
+            result, terms = cosine_power_series(angle, precision)
             builtin = cos(x)
             print("\nResults: ================")
             print(f"Function: {selected_func}")
@@ -300,7 +944,7 @@ def main():
             flprint(diff, precision, "       Difference: ")
             print(f"Number of terms used: {terms}")
         elif selected_func == "tangent_power_series":
-            result, terms_sine, terms_cos = tangent_power_series(x, precision)
+            result, terms_sine, terms_cos = tangent_power_series(angle, precision)
             if result == "undefined":
                 print("Tangent is undefined.")
                 builtin = "undefined"
@@ -324,7 +968,7 @@ def main():
                 print(f"Number of terms used in cosine: {terms_cos}")
                 print(f"Total terms used: {terms_sine + terms_cos}")
         elif selected_func == "secant_power_series":
-            result, terms = secant_power_series(x, precision)
+            result, terms = secant_power_series(angle, precision)
             if result == "undefined":
                 print("Secant is undefined.")
                 builtin = "undefined"
@@ -344,7 +988,7 @@ def main():
                 flprint(diff, precision, "       Difference: ")
                 print(f"Number of terms used: {terms}")
         elif selected_func == "cosecant_power_series":
-            result, terms = cosecant_power_series(x, precision)
+            result, terms = cosecant_power_series(angle, precision)
             if result == "undefined":
                 print("Cosecant is undefined.")
                 builtin = "undefined"
@@ -367,7 +1011,7 @@ def main():
                 print(f"Number of terms used: {terms}")
 
         elif selected_func == "cotangent_power_series":
-            result, terms_sine, terms_cos = cotangent_power_series(x, precision)
+            result, terms_sine, terms_cos = cotangent_power_series(angle, precision)
             if result == "undefined":
                 print("Cotangent is undefined.")
                 builtin = "undefined"